@@ -20,15 +20,23 @@ from aiml_studio.constants import ASIDE_WIDTH, FOOTER_HEIGHT, HEADER_HEIGHT, NAV
 from aiml_studio.managers import (
     ApplicationManager,
     BrowserPersistenceManager,
-    DataManager,
+    Count,
+    CountBy,
     LRUCacheManager,
 )
 from aiml_studio.managers.application_manager import DefaultApplicationManager
 from aiml_studio.managers.data_manager import InMemoryDataManager
+from aiml_studio.managers.retention import RetentionPolicy, RetentionWorker
+from aiml_studio.managers.write_ahead_log import WriteAheadLog
 
 # Initialize managers
 app_manager: ApplicationManager = DefaultApplicationManager()
-data_manager: DataManager = InMemoryDataManager()
+data_manager: InMemoryDataManager = InMemoryDataManager(
+    wal=WriteAheadLog(settings.DATA_WAL_DIR, fsync_policy=settings.DATA_WAL_FSYNC_POLICY)
+    if settings.DATA_WAL_DIR
+    else None,
+    slow_query_threshold=settings.DATA_SLOW_QUERY_MS / 1000 or None,
+)
 persistence_manager = BrowserPersistenceManager()
 cache_manager = LRUCacheManager(max_size=100, default_ttl=3600)
 
@@ -38,6 +46,33 @@ data_manager.initialize()
 persistence_manager.initialize()
 cache_manager.initialize()
 
+# Dashboard statistics, kept current on every mutation and read with get_aggregates()
+data_manager.register_aggregation("projects_total", "projects", Count())
+data_manager.register_aggregation("projects_by_status", "projects", CountBy("status"))
+data_manager.register_aggregation("data_sources_total", "data_sources", Count())
+data_manager.register_aggregation("data_sources_by_type", "data_sources", CountBy("type"))
+data_manager.register_aggregation("logs_by_level", "logs", CountBy("level"))
+
+# Projects list the data sources they use; experiment runs belong to a project
+data_manager.define_relationship(
+    "project_data_sources", "projects", "data_source_ids", "data_sources", many=True, on_delete="set_null"
+)
+data_manager.define_relationship("project_runs", "runs", "project_id", "projects", on_delete="cascade")
+
+# Bound the logs and users stores; expired records are removed in the background
+retention_worker = RetentionWorker(
+    data_manager,
+    {
+        "logs": RetentionPolicy(
+            max_age=settings.DATA_LOG_MAX_AGE_DAYS * 86400 or None,
+            max_count=settings.DATA_LOG_MAX_RECORDS or None,
+        ),
+        "users": RetentionPolicy(max_count=settings.DATA_USER_MAX_RECORDS or None),
+    },
+    interval=settings.DATA_RETENTION_INTERVAL,
+)
+retention_worker.start()
+
 # Initialize Dash app with pages support
 app = dash.Dash(
     __name__,
@@ -202,6 +237,7 @@ def main() -> None:
     finally:
         # Cleanup on shutdown
         app_manager.shutdown()
+        retention_worker.stop()
         data_manager.shutdown()
 
 
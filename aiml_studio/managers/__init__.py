@@ -1,18 +1,78 @@
 """Manager modules for AIML Studio."""
 
+from aiml_studio.managers.aggregations import Aggregation, Count, CountBy, Max, Min, Sum
+from aiml_studio.managers.analytics_data_manager import DuckDBDataManager
 from aiml_studio.managers.application_manager import ApplicationManager, DefaultApplicationManager
+from aiml_studio.managers.async_data_manager import (
+    AsyncDataManager,
+    ExecutorAsyncDataManager,
+    SQLiteAsyncDataManager,
+)
 from aiml_studio.managers.cache_manager import CacheManager, LRUCacheManager, cached
+from aiml_studio.managers.caching_data_manager import CachingDataManager
+from aiml_studio.managers.change_feed import ChangeEvent, ChangeFeed, apply_changes
+from aiml_studio.managers.columnar import ColumnarTable
 from aiml_studio.managers.data_manager import DataManager, InMemoryDataManager
+from aiml_studio.managers.log_store import TimePartitionedLogStore
+from aiml_studio.managers.partitioned_data_manager import PartitionedDataManager
 from aiml_studio.managers.persistence_manager import BrowserPersistenceManager, PersistenceManager
+from aiml_studio.managers.query_plan import QueryPlan
+from aiml_studio.managers.records import (
+    DataSourceRecord,
+    LogRecord,
+    ProjectRecord,
+    Record,
+    RecordViews,
+    UserRecord,
+    read_only,
+)
+from aiml_studio.managers.relationships import Relationship
+from aiml_studio.managers.replication import FollowerDataManager, ReplicationServer
+from aiml_studio.managers.retention import RetentionPolicy, RetentionReport, RetentionWorker
+from aiml_studio.managers.text_index import FullTextIndex
+from aiml_studio.managers.write_ahead_log import WriteAheadLog
 
 __all__ = [
     "ApplicationManager",
     "DefaultApplicationManager",
     "DataManager",
     "InMemoryDataManager",
+    "CachingDataManager",
+    "PartitionedDataManager",
+    "FollowerDataManager",
+    "ReplicationServer",
+    "DuckDBDataManager",
+    "AsyncDataManager",
+    "ExecutorAsyncDataManager",
+    "SQLiteAsyncDataManager",
     "CacheManager",
     "LRUCacheManager",
     "cached",
     "PersistenceManager",
     "BrowserPersistenceManager",
+    "QueryPlan",
+    "Relationship",
+    "FullTextIndex",
+    "ColumnarTable",
+    "TimePartitionedLogStore",
+    "Record",
+    "ProjectRecord",
+    "DataSourceRecord",
+    "LogRecord",
+    "UserRecord",
+    "RecordViews",
+    "read_only",
+    "Aggregation",
+    "Count",
+    "CountBy",
+    "Sum",
+    "Min",
+    "Max",
+    "ChangeEvent",
+    "ChangeFeed",
+    "apply_changes",
+    "WriteAheadLog",
+    "RetentionPolicy",
+    "RetentionReport",
+    "RetentionWorker",
 ]
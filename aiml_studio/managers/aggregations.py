@@ -0,0 +1,278 @@
+"""Incrementally maintained aggregations over data records."""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any
+
+
+class Aggregation(ABC):
+    """Abstract base class for an aggregate kept current on every mutation.
+
+    Subclasses update their state in O(1) when a record is added or removed,
+    so reading the result never scans the underlying records.
+    """
+
+    def __init__(self, field: str | None = None) -> None:
+        """Initialize the aggregation.
+
+        Args:
+            field: Record field the aggregation reads (None if unused)
+        """
+        self.field = field
+
+    @abstractmethod
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was added.
+
+        Args:
+            record: Added record
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was removed.
+
+        Args:
+            record: Removed record
+        """
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Get the current aggregate value.
+
+        Returns:
+            Aggregate value
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Reset the aggregation to its empty state."""
+        pass
+
+    def replace(self, old_record: Mapping[str, Any], new_record: Mapping[str, Any]) -> None:
+        """Account for a record that was updated.
+
+        Args:
+            old_record: Record before the update
+            new_record: Record after the update
+        """
+        if self.field is not None and old_record.get(self.field) == new_record.get(self.field):
+            return
+        self.remove(old_record)
+        self.add(new_record)
+
+
+class Count(Aggregation):
+    """Number of records."""
+
+    def __init__(self) -> None:
+        """Initialize the count."""
+        super().__init__()
+        self._count = 0
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was added.
+
+        Args:
+            record: Added record
+        """
+        self._count += 1
+
+    def remove(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was removed.
+
+        Args:
+            record: Removed record
+        """
+        self._count -= 1
+
+    def replace(self, old_record: Mapping[str, Any], new_record: Mapping[str, Any]) -> None:
+        """Account for a record that was updated (the count is unchanged).
+
+        Args:
+            old_record: Record before the update
+            new_record: Record after the update
+        """
+
+    def result(self) -> int:
+        """Get the number of records.
+
+        Returns:
+            Record count
+        """
+        return self._count
+
+    def reset(self) -> None:
+        """Reset the count to zero."""
+        self._count = 0
+
+
+class CountBy(Aggregation):
+    """Number of records per distinct value of a field."""
+
+    def __init__(self, field: str) -> None:
+        """Initialize the grouped count.
+
+        Args:
+            field: Field to group by
+        """
+        super().__init__(field)
+        self._counts: Counter = Counter()
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was added.
+
+        Args:
+            record: Added record
+        """
+        self._counts[record.get(self.field)] += 1
+
+    def remove(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was removed.
+
+        Args:
+            record: Removed record
+        """
+        value = record.get(self.field)
+        self._counts[value] -= 1
+        if self._counts[value] <= 0:
+            del self._counts[value]
+
+    def result(self) -> dict[Any, int]:
+        """Get the record count per field value.
+
+        Returns:
+            Mapping of field value to count
+        """
+        return dict(self._counts)
+
+    def reset(self) -> None:
+        """Reset all counts."""
+        self._counts.clear()
+
+
+class Sum(Aggregation):
+    """Sum of a numeric field, ignoring records without a numeric value."""
+
+    def __init__(self, field: str) -> None:
+        """Initialize the sum.
+
+        Args:
+            field: Numeric field to sum
+        """
+        super().__init__(field)
+        self._total: float = 0
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was added.
+
+        Args:
+            record: Added record
+        """
+        value = record.get(self.field)
+        if isinstance(value, (int, float)):
+            self._total += value
+
+    def remove(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was removed.
+
+        Args:
+            record: Removed record
+        """
+        value = record.get(self.field)
+        if isinstance(value, (int, float)):
+            self._total -= value
+
+    def result(self) -> float:
+        """Get the sum.
+
+        Returns:
+            Sum of the field values
+        """
+        return self._total
+
+    def reset(self) -> None:
+        """Reset the sum to zero."""
+        self._total = 0
+
+
+class _Extreme(Aggregation):
+    """Minimum or maximum of a field, ignoring records without a value.
+
+    Values are counted so removals are O(1); when the current extreme is
+    removed it is recomputed lazily from the distinct values on the next read.
+    """
+
+    _pick = staticmethod(min)
+
+    def __init__(self, field: str) -> None:
+        """Initialize the aggregation.
+
+        Args:
+            field: Field to aggregate
+        """
+        super().__init__(field)
+        self._counts: Counter = Counter()
+        self._extreme: Any = None
+        self._stale = False
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was added.
+
+        Args:
+            record: Added record
+        """
+        value = record.get(self.field)
+        if value is None:
+            return
+        self._counts[value] += 1
+        if not self._stale and (self._extreme is None or self._pick(value, self._extreme) == value):
+            self._extreme = value
+
+    def remove(self, record: Mapping[str, Any]) -> None:
+        """Account for a record that was removed.
+
+        Args:
+            record: Removed record
+        """
+        value = record.get(self.field)
+        if value is None or value not in self._counts:
+            return
+        self._counts[value] -= 1
+        if self._counts[value] <= 0:
+            del self._counts[value]
+            if value == self._extreme:
+                self._stale = True
+
+    def result(self) -> Any:
+        """Get the current extreme value.
+
+        Returns:
+            Extreme value, or None if no record holds a value
+        """
+        if self._stale:
+            self._extreme = self._pick(self._counts) if self._counts else None
+            self._stale = False
+        return self._extreme
+
+    def reset(self) -> None:
+        """Reset the aggregation."""
+        self._counts.clear()
+        self._extreme = None
+        self._stale = False
+
+
+class Min(_Extreme):
+    """Minimum value of a field."""
+
+    _pick = staticmethod(min)
+
+
+class Max(_Extreme):
+    """Maximum value of a field."""
+
+    _pick = staticmethod(max)
@@ -0,0 +1,673 @@
+"""Embedded analytical (OLAP) data manager backed by DuckDB."""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from aiml_studio.managers.data_manager import DataManager, InMemoryDataManager
+from aiml_studio.managers.log_store import to_epoch
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+
+# Column kinds (the ``ColumnarTable`` kinds plus epoch-second timestamps) and their DuckDB types
+COLUMN_TYPES = {
+    "int": "BIGINT",
+    "float": "DOUBLE",
+    "bool": "BOOLEAN",
+    "category": "VARCHAR",
+    "str": "VARCHAR",
+    "object": "VARCHAR",
+    "timestamp": "DOUBLE",
+}
+
+AGGREGATE_FUNCTIONS = {
+    "count": "COUNT",
+    "count_distinct": "COUNT(DISTINCT",
+    "sum": "SUM",
+    "avg": "AVG",
+    "min": "MIN",
+    "max": "MAX",
+}
+
+# Column kinds whose values are converted before they are stored
+_CONVERTERS = {
+    "timestamp": to_epoch,
+    "object": lambda value: json.dumps(value, default=str),
+}
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _quote(identifier: str) -> str:
+    """Quote a validated SQL identifier.
+
+    Args:
+        identifier: Table or column name
+
+    Returns:
+        Quoted identifier
+    """
+    return f'"{identifier}"'
+
+
+class DuckDBDataManager(DataManager):
+    """DataManager storing records in typed DuckDB columns for analytics.
+
+    Each entity type is a DuckDB table with one column per schema field, so
+    counts, time-window filters and group-bys run as vectorized column scans
+    instead of per-record dictionary lookups. Fields outside the schema are
+    not stored, and timestamps are stored as epoch seconds.
+
+    The manager is meant as an analytical replica of the operational store:
+    ``load_from`` copies it in batches and ``sync`` applies its change feed
+    incrementally. Single-record CRUD works but is slow compared to
+    ``InMemoryDataManager``; versions, text indexes, registered aggregations
+    and the change feed are not maintained.
+
+    Requires the optional ``duckdb`` package.
+    """
+
+    def __init__(
+        self, schemas: Mapping[str, Mapping[str, str]], database: str = ":memory:", batch_size: int = 100_000
+    ) -> None:
+        """Initialize the analytical data manager.
+
+        Args:
+            schemas: Column kind per field per entity type (see ``COLUMN_TYPES``),
+                e.g. ``{"logs": {"timestamp": "timestamp", "level": "category"}}``
+            database: DuckDB database path (':memory:' for an in-process database)
+            batch_size: Records written per ingestion batch
+
+        Raises:
+            ImportError: If duckdb is not installed
+            ValueError: If a schema uses an invalid name or column kind
+        """
+        if duckdb is None:
+            msg = "DuckDBDataManager requires the optional 'duckdb' package (pip install duckdb)"
+            raise ImportError(msg)
+        for entity_type, schema in schemas.items():
+            names = [entity_type, *schema]
+            invalid = [name for name in names if not _IDENTIFIER.fullmatch(name) or name == "entity_id"]
+            if invalid:
+                msg = f"Invalid table or column names: {', '.join(invalid)}"
+                raise ValueError(msg)
+            unknown = set(schema.values()) - set(COLUMN_TYPES)
+            if unknown:
+                msg = f"Unknown column types: {', '.join(sorted(unknown))}"
+                raise ValueError(msg)
+
+        super().__init__()
+        self._schemas = {entity_type: dict(schema) for entity_type, schema in schemas.items()}
+        # Field names and the converters of non-native columns, per entity type
+        self._columns = {
+            entity_type: (
+                tuple(schema),
+                [(field, _CONVERTERS[kind]) for field, kind in schema.items() if kind in _CONVERTERS],
+            )
+            for entity_type, schema in self._schemas.items()
+        }
+        self._database = database
+        self._batch_size = batch_size
+        self._connection: Any = None
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    def initialize(self) -> None:
+        """Open the database and create one table per entity type."""
+        self._connection = duckdb.connect(self._database)
+        for entity_type, schema in self._schemas.items():
+            columns = ", ".join(f"{_quote(field)} {COLUMN_TYPES[kind]}" for field, kind in schema.items())
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(entity_type)} (entity_id VARCHAR, {columns})")
+        self._logger.info(f"DuckDBDataManager initialized ({self._database})")
+
+    def shutdown(self) -> None:
+        """Close the database."""
+        self._logger.info("DuckDBDataManager shutting down")
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _schema(self, entity_type: str) -> dict[str, str]:
+        """Get the column schema of an entity type.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            Column kind per field
+
+        Raises:
+            ValueError: If the entity type has no schema
+        """
+        schema = self._schemas.get(entity_type)
+        if schema is None:
+            msg = f"No analytics schema for entity type {entity_type!r}"
+            raise ValueError(msg)
+        return schema
+
+    def _to_row(self, entity_type: str, entity_id: str, record: Mapping[str, Any]) -> dict[str, Any]:
+        """Convert a record to a row of column values.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            record: Record data
+
+        Returns:
+            Column values keyed by column name (None for missing fields)
+        """
+        fields, converters = self._columns[entity_type]
+        row = dict(zip(fields, map(record.get, fields), strict=True))
+        for field, convert in converters:
+            if row[field] is not None:
+                row[field] = convert(row[field])
+        row["entity_id"] = entity_id
+        return row
+
+    def _from_row(self, schema: Mapping[str, str], columns: list[str], row: tuple[Any, ...]) -> dict[str, Any]:
+        """Convert selected column values back to a record.
+
+        Args:
+            schema: Column kind per field
+            columns: Selected column names
+            row: Column values
+
+        Returns:
+            Record data without NULL fields
+        """
+        record = {}
+        for field, value in zip(columns, row, strict=True):
+            if value is None:
+                continue
+            record[field] = json.loads(value) if schema[field] == "object" else value
+        return record
+
+    def _write(self, entity_type: str, rows: list[dict[str, Any]], replace: bool) -> None:
+        """Write a batch of rows through a staged bulk load.
+
+        Rows are staged as one JSON document read by ``read_json``, which
+        loads a batch orders of magnitude faster than parameterized inserts.
+        Must be called with the lock held.
+
+        Args:
+            entity_type: Type of entity
+            rows: Rows from ``_to_row``
+            replace: Delete existing rows with the same entity ids first
+        """
+        schema = self._schemas[entity_type]
+        columns = {"entity_id": "VARCHAR", **{field: COLUMN_TYPES[kind] for field, kind in schema.items()}}
+        fd, path = tempfile.mkstemp(suffix=".json", prefix="aiml-analytics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                # ``dumps`` encodes the whole batch in C; ``dump`` would stream it in Python
+                f.write(json.dumps(rows, separators=(",", ":")))
+            table = _quote(entity_type)
+            connection = self._connection
+            connection.execute("BEGIN TRANSACTION")
+            try:
+                connection.execute(
+                    "CREATE OR REPLACE TEMP TABLE staging AS SELECT * FROM read_json(?, format = 'array', "
+                    "columns = ?, maximum_object_size = 2147483647)",
+                    [path, columns],
+                )
+                if replace:
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE entity_id IN (SELECT entity_id FROM staging)"  # noqa: S608
+                    )
+                connection.execute(f"INSERT INTO {table} BY NAME SELECT * FROM staging")  # noqa: S608
+                connection.execute("DROP TABLE staging")
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        finally:
+            os.unlink(path)
+
+    def ingest(self, entity_type: str, records: Mapping[str, Mapping[str, Any]], replace: bool = True) -> int:
+        """Bulk-load records in batches.
+
+        Args:
+            entity_type: Type of entity
+            records: Records keyed by entity id
+            replace: Replace existing rows with the same entity ids (pass
+                False for a first load into an empty table)
+
+        Returns:
+            Number of records written
+        """
+        self._schema(entity_type)
+        items = list(records.items())
+        written = 0
+        try:
+            for start in range(0, len(items), self._batch_size):
+                batch = items[start : start + self._batch_size]
+                rows = [self._to_row(entity_type, entity_id, record) for entity_id, record in batch]
+                with self._lock:
+                    self._write(entity_type, rows, replace)
+                written += len(rows)
+        except Exception:
+            self._logger.exception(f"Error ingesting {entity_type} records")
+        return written
+
+    def load_from(self, data_manager: InMemoryDataManager) -> int:
+        """Replace all tables with a copy of an operational data manager.
+
+        The change feed position is taken before copying, so a later
+        ``sync`` re-applies any mutation the copy may have missed.
+
+        Args:
+            data_manager: Data manager to copy from
+
+        Returns:
+            Number of records loaded
+        """
+        sequence = data_manager.latest_change_sequence()
+        loaded = 0
+        for entity_type in self._schemas:
+            with self._lock:
+                self._connection.execute(f"DELETE FROM {_quote(entity_type)}")  # noqa: S608
+            loaded += self.ingest(entity_type, data_manager.snapshot(entity_type), replace=False)
+        self._sequence = sequence
+        self._logger.info(f"Loaded {loaded} records into the analytics store")
+        return loaded
+
+    def sync(self, data_manager: InMemoryDataManager) -> int:
+        """Apply the mutations made on an operational data manager since the last sync.
+
+        Changes are collapsed to the final state of each record and written
+        as one batch per entity type. If the change feed no longer holds the
+        last synced position, the tables are reloaded with ``load_from``.
+
+        Args:
+            data_manager: Data manager to read the change feed of
+
+        Returns:
+            Number of change events applied
+        """
+        changes = data_manager.changes_since(self._sequence)
+        if changes is None:
+            self._logger.warning("Analytics store fell behind the change feed, reloading")
+            self.load_from(data_manager)
+            return 0
+        if not changes:
+            return 0
+
+        final: dict[str, dict[str, Mapping[str, Any] | None]] = {}
+        for event in changes:
+            if event.entity_type in self._schemas:
+                final.setdefault(event.entity_type, {})[event.entity_id] = event.record
+        try:
+            for entity_type, records in final.items():
+                deleted = [{"entity_id": entity_id} for entity_id, record in records.items() if record is None]
+                rows = [
+                    self._to_row(entity_type, entity_id, record)
+                    for entity_id, record in records.items()
+                    if record is not None
+                ]
+                with self._lock:
+                    if deleted:
+                        self._delete_rows(entity_type, deleted)
+                    if rows:
+                        self._write(entity_type, rows, replace=True)
+        except Exception:
+            self._logger.exception("Error applying changes to the analytics store")
+            return 0
+        self._sequence = changes[-1].sequence
+        return len(changes)
+
+    def _delete_rows(self, entity_type: str, rows: list[dict[str, Any]]) -> None:
+        """Delete the rows of staged entity ids. Must be called with the lock held.
+
+        Args:
+            entity_type: Type of entity
+            rows: Rows holding the ``entity_id`` to delete
+        """
+        fd, path = tempfile.mkstemp(suffix=".json", prefix="aiml-analytics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(rows))
+            self._connection.execute(
+                f"DELETE FROM {_quote(entity_type)} WHERE entity_id IN "  # noqa: S608
+                "(SELECT entity_id FROM read_json(?, format = 'array', columns = {entity_id: 'VARCHAR'}))",
+                [path],
+            )
+        finally:
+            os.unlink(path)
+
+    def _where(
+        self,
+        entity_type: str,
+        filters: Mapping[str, Any] | None,
+        start: Any = None,
+        end: Any = None,
+        timestamp_field: str = "timestamp",
+    ) -> tuple[str, list[Any]] | None:
+        """Translate filters and a time window into a WHERE clause.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match
+            start: Inclusive window start (epoch seconds, datetime or ISO string)
+            end: Exclusive window end
+            timestamp_field: Field the window applies to
+
+        Returns:
+            WHERE clause and parameters, or None if no record can match
+            (a filter on a field that is not stored)
+        """
+        schema = self._schema(entity_type)
+        clauses = ["TRUE"]
+        params: list[Any] = []
+        for field, value in (filters or {}).items():
+            if field not in schema and field != "entity_id":
+                return None
+            if value is None:
+                clauses.append(f"{_quote(field)} IS NULL")
+                continue
+            if schema.get(field) == "timestamp":
+                value = to_epoch(value)
+            elif schema.get(field) == "object":
+                value = json.dumps(value, default=str)
+            clauses.append(f"{_quote(field)} = ?")
+            params.append(value)
+        if start is not None or end is not None:
+            if schema.get(timestamp_field) != "timestamp":
+                msg = f"{entity_type}.{timestamp_field} is not a timestamp column"
+                raise ValueError(msg)
+            for bound, operator in ((start, ">="), (end, "<")):
+                if bound is not None:
+                    clauses.append(f"{_quote(timestamp_field)} {operator} ?")
+                    params.append(to_epoch(bound))
+        return " AND ".join(clauses), params
+
+    def _query(self, sql: str, params: list[Any]) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Run a query.
+
+        Args:
+            sql: Query
+            params: Query parameters
+
+        Returns:
+            Column names and rows
+        """
+        with self._lock:
+            cursor = self._connection.execute(sql, params)
+            return [column[0] for column in cursor.description], cursor.fetchall()
+
+    def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Create a new data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Unique identifier
+            data: Data to store
+
+        Returns:
+            True if successful
+        """
+        try:
+            if self.retrieve(entity_type, entity_id) is not None:
+                self._logger.warning(f"Entity {entity_type}/{entity_id} already exists")
+                return False
+            with self._lock:
+                self._write(entity_type, [self._to_row(entity_type, entity_id, data)], replace=False)
+            return True
+        except Exception:
+            self._logger.exception(f"Error creating {entity_type}/{entity_id}")
+            return False
+
+    def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Stored fields of the record, or None
+        """
+        records = self.search(entity_type, {"entity_id": entity_id})
+        return records[0] if records else None
+
+    def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Update an existing data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Not supported; conditional updates are rejected
+
+        Returns:
+            True if successful
+        """
+        if expected_version is not None:
+            self._logger.warning("DuckDBDataManager does not track versions; rejecting conditional update")
+            return False
+        try:
+            record = self.retrieve(entity_type, entity_id)
+            if record is None:
+                self._logger.warning(f"Entity {entity_type}/{entity_id} not found")
+                return False
+            row = self._to_row(entity_type, entity_id, {**record, **data})
+            with self._lock:
+                self._write(entity_type, [row], replace=True)
+            return True
+        except Exception:
+            self._logger.exception(f"Error updating {entity_type}/{entity_id}")
+            return False
+
+    def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Not supported; conditional deletes are rejected
+
+        Returns:
+            True if a record was deleted
+        """
+        if expected_version is not None:
+            self._logger.warning("DuckDBDataManager does not track versions; rejecting conditional delete")
+            return False
+        try:
+            _, rows = self._query(
+                f"DELETE FROM {_quote(entity_type)} WHERE entity_id = ? RETURNING entity_id",  # noqa: S608
+                [entity_id],
+            )
+            return bool(rows)
+        except Exception:
+            self._logger.exception(f"Error deleting {entity_type}/{entity_id}")
+            return False
+
+    def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all records of a given entity type.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record
+
+        Returns:
+            List of entity records
+        """
+        return self.search(entity_type, {}, fields)
+
+    def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search for records matching equality filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records
+        """
+        schema = self._schema(entity_type)
+        where = self._where(entity_type, filters)
+        if where is None:
+            return []
+        selected = [field for field in (schema if fields is None else fields) if field in schema]
+        if not selected:
+            selected_sql = "NULL AS entity_id"
+        else:
+            selected_sql = ", ".join(_quote(field) for field in selected)
+        columns, rows = self._query(
+            f"SELECT {selected_sql} FROM {_quote(entity_type)} WHERE {where[0]}",  # noqa: S608
+            where[1],
+        )
+        if not selected:
+            return [{} for _ in rows]
+        return [self._from_row(schema, columns, row) for row in rows]
+
+    def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count the records matching filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        where = self._where(entity_type, filters)
+        if where is None:
+            return 0
+        _, rows = self._query(f"SELECT COUNT(*) FROM {_quote(entity_type)} WHERE {where[0]}", where[1])  # noqa: S608
+        return rows[0][0]
+
+    def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record matches filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        where = self._where(entity_type, filters)
+        if where is None:
+            return False
+        _, rows = self._query(
+            f"SELECT EXISTS (SELECT 1 FROM {_quote(entity_type)} WHERE {where[0]})",  # noqa: S608
+            where[1],
+        )
+        return bool(rows[0][0])
+
+    def register_index(self, entity_type: str, field: str) -> None:
+        """Create a DuckDB index on a column.
+
+        Scans already skip row groups by their min/max statistics, so an
+        index only pays off for selective point lookups.
+
+        Args:
+            entity_type: Type of entity
+            field: Column to index
+        """
+        if field not in self._schema(entity_type) and field != "entity_id":
+            self._logger.warning(f"Cannot index field {field!r} of {entity_type}")
+            return
+        with self._lock:
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {_quote(f'{entity_type}_{field}_idx')} "
+                f"ON {_quote(entity_type)} ({_quote(field)})"
+            )
+        self._logger.info(f"Registered index on {entity_type}.{field}")
+
+    def aggregate(
+        self,
+        entity_type: str,
+        aggregates: Mapping[str, str],
+        group_by: Iterable[str] = (),
+        filters: Mapping[str, Any] | None = None,
+        start: Any = None,
+        end: Any = None,
+        bucket: float | None = None,
+        timestamp_field: str = "timestamp",
+    ) -> list[dict[str, Any]]:
+        """Run a grouped aggregate query.
+
+        Example: error counts per level and hour over the last day::
+
+            manager.aggregate(
+                "logs", {"errors": "count"}, group_by=["level"],
+                start=time.time() - 86400, bucket=3600,
+            )
+
+        Args:
+            entity_type: Type of entity
+            aggregates: Output name to aggregate spec: ``"count"`` or
+                ``"<function>:<field>"`` with a function from ``AGGREGATE_FUNCTIONS``
+            group_by: Fields to group by
+            filters: Field values to match
+            start: Inclusive window start (epoch seconds, datetime or ISO string)
+            end: Exclusive window end
+            bucket: Also group by time buckets of this many seconds; the
+                bucket start is returned under ``timestamp_field``
+            timestamp_field: Timestamp column for the window and buckets
+
+        Returns:
+            One row per group, ordered by the group keys
+
+        Raises:
+            ValueError: If a field or aggregate spec is invalid
+        """
+        schema = self._schema(entity_type)
+        keys = []
+        for field in group_by:
+            if field not in schema:
+                msg = f"Unknown group-by field {entity_type}.{field}"
+                raise ValueError(msg)
+            keys.append(_quote(field))
+        if bucket is not None:
+            if schema.get(timestamp_field) != "timestamp" or bucket <= 0:
+                msg = f"Cannot bucket {entity_type} by {timestamp_field!r} every {bucket} seconds"
+                raise ValueError(msg)
+            column = _quote(timestamp_field)
+            keys.append(f"floor({column} / {float(bucket)!r}) * {float(bucket)!r} AS {column}")
+
+        expressions = []
+        for name, spec in aggregates.items():
+            function, _, field = spec.partition(":")
+            if not _IDENTIFIER.fullmatch(name) or function not in AGGREGATE_FUNCTIONS:
+                msg = f"Invalid aggregate {name}={spec!r}"
+                raise ValueError(msg)
+            if not field:
+                if function != "count":
+                    msg = f"Aggregate {spec!r} needs a field"
+                    raise ValueError(msg)
+                expressions.append(f"COUNT(*) AS {_quote(name)}")
+                continue
+            if field not in schema:
+                msg = f"Unknown aggregate field {entity_type}.{field}"
+                raise ValueError(msg)
+            closing = ")" * (1 + AGGREGATE_FUNCTIONS[function].count("("))
+            expressions.append(f"{AGGREGATE_FUNCTIONS[function]}({_quote(field)}{closing} AS {_quote(name)}")
+
+        where = self._where(entity_type, filters, start, end, timestamp_field)
+        if where is None:
+            return []
+        sql = f"SELECT {', '.join(keys + expressions)} FROM {_quote(entity_type)} WHERE {where[0]}"  # noqa: S608
+        if keys:
+            positions = ", ".join(str(position) for position in range(1, len(keys) + 1))
+            sql += f" GROUP BY {positions} ORDER BY {positions}"
+        try:
+            columns, rows = self._query(sql, where[1])
+        except Exception:
+            self._logger.exception(f"Error aggregating {entity_type}")
+            return []
+        return [dict(zip(columns, row, strict=True)) for row in rows]
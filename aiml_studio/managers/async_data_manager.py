@@ -0,0 +1,769 @@
+"""Asyncio-native Data Manager interface and implementations."""
+
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from aiml_studio.managers.data_manager import DataManager
+from aiml_studio.utilities.logger import get_logger
+
+T = TypeVar("T")
+_Job = tuple[Callable[[sqlite3.Connection], Any], asyncio.Future, asyncio.AbstractEventLoop]
+
+
+class AsyncDataManager(ABC):
+    """Abstract base class mirroring DataManager with coroutine methods.
+
+    Backends doing real I/O implement this interface so an outstanding query
+    does not tie up a server thread while it waits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the AsyncDataManager."""
+        self._logger = get_logger(__name__)
+
+    @abstractmethod
+    async def initialize(self) -> None:
+        """Initialize the data manager."""
+        pass
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        """Shutdown the data manager."""
+        pass
+
+    @abstractmethod
+    async def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Create a new data record.
+
+        Args:
+            entity_type: Type of entity (e.g., 'project', 'data_source')
+            entity_id: Unique identifier for the entity
+            data: Data to store
+
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Entity data or None if not found
+        """
+        pass
+
+    @abstractmethod
+    async def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Update an existing data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Only update if the record is still at this version
+
+        Returns:
+            True if successful, False otherwise (including version conflicts)
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
+
+        Returns:
+            True if successful, False otherwise (including version conflicts)
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(self, entity_type: str, entity_id: str) -> int | None:
+        """Get the current version of a record, usable as an ETag.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Record version, or None if the record does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all records of a given entity type.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record
+
+        Returns:
+            List of entity records
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search for records matching filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count the records matching filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record matches filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        pass
+
+    @abstractmethod
+    async def register_index(self, entity_type: str, field: str) -> None:
+        """Declare an equality index on a field of an entity type.
+
+        Args:
+            entity_type: Type of entity
+            field: Field to index
+        """
+        pass
+
+
+class ExecutorAsyncDataManager(AsyncDataManager):
+    """Async adapter running any synchronous DataManager on a bounded executor.
+
+    At most ``max_workers`` calls run at once and at most ``max_pending``
+    calls are queued for the executor; further callers wait on the event
+    loop without occupying a thread.
+    """
+
+    def __init__(self, data_manager: DataManager, max_workers: int = 8, max_pending: int = 256) -> None:
+        """Initialize the adapter.
+
+        Args:
+            data_manager: Synchronous data manager to wrap
+            max_workers: Number of executor threads
+            max_pending: Maximum number of calls submitted to the executor
+        """
+        super().__init__()
+        self._data_manager = data_manager
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(max_pending)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call on the executor.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+
+        Returns:
+            Result of the call
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="data-manager")
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args))
+
+    async def initialize(self) -> None:
+        """Initialize the wrapped data manager."""
+        await self._run(self._data_manager.initialize)
+        self._logger.info(f"ExecutorAsyncDataManager initialized (max_workers={self._max_workers})")
+
+    async def shutdown(self) -> None:
+        """Shutdown the wrapped data manager and the executor."""
+        await self._run(self._data_manager.shutdown)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Create a new data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Unique identifier
+            data: Data to store
+
+        Returns:
+            True if successful
+        """
+        return await self._run(self._data_manager.create, entity_type, entity_id, data)
+
+    async def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Entity data or None
+        """
+        return await self._run(self._data_manager.retrieve, entity_type, entity_id)
+
+    async def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Update an existing data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Only update if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        return await self._run(self._data_manager.update, entity_type, entity_id, data, expected_version)
+
+    async def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        return await self._run(self._data_manager.delete, entity_type, entity_id, expected_version)
+
+    async def get_version(self, entity_type: str, entity_id: str) -> int | None:
+        """Get the current version of a record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Record version, or None if the record does not exist
+        """
+        return self._data_manager.get_version(entity_type, entity_id)
+
+    async def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all records of a given entity type.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record
+
+        Returns:
+            List of entity records
+        """
+        return await self._run(self._data_manager.list_all, entity_type, fields)
+
+    async def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search for records matching filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records
+        """
+        return await self._run(self._data_manager.search, entity_type, filters, fields)
+
+    async def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count the records matching filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        return await self._run(self._data_manager.count, entity_type, filters)
+
+    async def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record matches filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        return await self._run(self._data_manager.exists, entity_type, filters)
+
+    async def register_index(self, entity_type: str, field: str) -> None:
+        """Declare an equality index on a field of an entity type.
+
+        Args:
+            entity_type: Type of entity
+            field: Field to index
+        """
+        await self._run(self._data_manager.register_index, entity_type, field)
+
+
+def _matches(record: dict[str, Any], filters: dict[str, Any]) -> bool:
+    """Check whether a record matches equality filters.
+
+    Args:
+        record: Record to test
+        filters: Field values to match
+
+    Returns:
+        True if every filter matches
+    """
+    return all(key in record and record[key] == value for key, value in filters.items())
+
+
+def _json_path(field: str) -> str | None:
+    """Build a literal SQLite JSON path for a top-level field.
+
+    The path is inlined into SQL (rather than bound) so expressions match
+    the expression indexes created by ``register_index``.
+
+    Args:
+        field: Record field name
+
+    Returns:
+        SQL string literal of the path, or None if the name cannot be inlined
+    """
+    if any(char in field for char in "'\"\\") or not field.isprintable():
+        return None
+    return f"'$.\"{field}\"'"
+
+
+def _project(record: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    """Restrict a record to a subset of its fields.
+
+    Args:
+        record: Record data
+        fields: Fields to keep (None keeps every field)
+
+    Returns:
+        Projected record
+    """
+    if fields is None:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+class SQLiteAsyncDataManager(AsyncDataManager):
+    """Native async data manager backed by SQLite.
+
+    A single connection is owned by a dedicated thread that executes queued
+    statements and resolves the awaiting futures on the event loop. Queued
+    writes are committed together in one transaction, so many concurrent
+    requests share a single commit.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS records (
+            entity_type TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 1,
+            UNIQUE (entity_type, entity_id)
+        )
+    """
+
+    def __init__(self, database: str = ":memory:", max_batch: int = 256) -> None:
+        """Initialize the SQLite data manager.
+
+        Args:
+            database: SQLite database path (':memory:' for a private database)
+            max_batch: Maximum number of queued statements per transaction
+        """
+        super().__init__()
+        self._database = database
+        self._max_batch = max_batch
+        self._jobs: queue.Queue[_Job | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    async def _submit(self, job: Callable[[sqlite3.Connection], T]) -> T:
+        """Queue a job for the connection thread and await its result.
+
+        Args:
+            job: Callable receiving the connection
+
+        Returns:
+            Result of the job
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._jobs.put((job, future, loop))
+        return await future
+
+    def _serve(self) -> None:
+        """Execute queued jobs on the connection thread."""
+        connection = sqlite3.connect(self._database)
+        try:
+            while True:
+                item = self._jobs.get()
+                if item is None:
+                    break
+
+                batch = [item]
+                while len(batch) < self._max_batch:
+                    try:
+                        item = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        self._jobs.put(None)
+                        break
+                    batch.append(item)
+
+                results = []
+                for job, future, loop in batch:
+                    try:
+                        results.append((future, loop, job(connection), None))
+                    except Exception as e:
+                        results.append((future, loop, None, e))
+                connection.commit()
+
+                for future, loop, result, error in results:
+                    loop.call_soon_threadsafe(self._resolve, future, result, error)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any, error: BaseException | None) -> None:
+        """Complete a future on its event loop.
+
+        Args:
+            future: Future to complete
+            result: Result value
+            error: Exception raised by the job, if any
+        """
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def initialize(self) -> None:
+        """Start the connection thread and create the schema."""
+        self._thread = threading.Thread(target=self._serve, name="sqlite-data-manager", daemon=True)
+        self._thread.start()
+        await self._submit(lambda connection: connection.execute(self._SCHEMA))
+        self._logger.info(f"SQLiteAsyncDataManager initialized ({self._database})")
+
+    async def shutdown(self) -> None:
+        """Stop the connection thread after pending jobs complete."""
+        self._logger.info("SQLiteAsyncDataManager shutting down")
+        if self._thread is not None:
+            self._jobs.put(None)
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+            self._thread = None
+
+    async def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Create a new data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Unique identifier
+            data: Data to store
+
+        Returns:
+            True if successful
+        """
+        try:
+            payload = json.dumps(data)
+            created = await self._submit(
+                lambda connection: connection.execute(
+                    "INSERT OR IGNORE INTO records (entity_type, entity_id, data) VALUES (?, ?, ?)",
+                    (entity_type, entity_id, payload),
+                ).rowcount
+                == 1
+            )
+        except Exception:
+            self._logger.exception(f"Error creating {entity_type}/{entity_id}")
+            return False
+
+        if not created:
+            self._logger.warning(f"Entity {entity_type}/{entity_id} already exists")
+        return created
+
+    async def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Entity data or None
+        """
+        row = await self._submit(
+            lambda connection: connection.execute(
+                "SELECT data FROM records WHERE entity_type = ? AND entity_id = ?", (entity_type, entity_id)
+            ).fetchone()
+        )
+        return json.loads(row[0]) if row is not None else None
+
+    async def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Update an existing data record.
+
+        The read, version check and write run as one job on the connection
+        thread, so a conditional update is an atomic compare-and-swap.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Only update if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+
+        def merge(connection: sqlite3.Connection) -> str | None:
+            row = connection.execute(
+                "SELECT data, version FROM records WHERE entity_type = ? AND entity_id = ?", (entity_type, entity_id)
+            ).fetchone()
+            if row is None:
+                return "not found"
+            if expected_version is not None and row[1] != expected_version:
+                return f"version conflict: expected {expected_version}, found {row[1]}"
+            record = {**json.loads(row[0]), **data}
+            connection.execute(
+                "UPDATE records SET data = ?, version = version + 1 WHERE entity_type = ? AND entity_id = ?",
+                (json.dumps(record), entity_type, entity_id),
+            )
+            return None
+
+        try:
+            failure = await self._submit(merge)
+        except Exception:
+            self._logger.exception(f"Error updating {entity_type}/{entity_id}")
+            return False
+
+        if failure is not None:
+            self._logger.warning(f"Entity {entity_type}/{entity_id} not updated: {failure}")
+            return False
+        return True
+
+    async def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a data record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        sql = "DELETE FROM records WHERE entity_type = ? AND entity_id = ?"
+        params: tuple[Any, ...] = (entity_type, entity_id)
+        if expected_version is not None:
+            sql += " AND version = ?"
+            params += (expected_version,)
+        try:
+            return await self._submit(lambda connection: connection.execute(sql, params).rowcount == 1)
+        except Exception:
+            self._logger.exception(f"Error deleting {entity_type}/{entity_id}")
+            return False
+
+    async def get_version(self, entity_type: str, entity_id: str) -> int | None:
+        """Get the current version of a record.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Record version, or None if the record does not exist
+        """
+        row = await self._submit(
+            lambda connection: connection.execute(
+                "SELECT version FROM records WHERE entity_type = ? AND entity_id = ?", (entity_type, entity_id)
+            ).fetchone()
+        )
+        return row[0] if row is not None else None
+
+    @staticmethod
+    def _where(entity_type: str, filters: dict[str, Any] | None) -> tuple[str, list[Any], bool]:
+        """Translate equality filters into a WHERE clause on the stored JSON.
+
+        Scalar values compare in SQLite exactly as in Python (strings never
+        equal numbers, ``True`` equals ``1``), so such filters are answered
+        completely by SQL. Other filters must be re-checked in Python.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match
+
+        Returns:
+            WHERE clause, its parameters, and whether SQL evaluates every filter
+        """
+        clauses = ["entity_type = ?"]
+        params: list[Any] = [entity_type]
+        exact = True
+        for key, value in (filters or {}).items():
+            path = _json_path(key)
+            scalar = isinstance(value, (str, float)) or (isinstance(value, int) and value.bit_length() <= 63)
+            if path is None or not scalar:
+                exact = False
+                continue
+            clauses.append(f"json_extract(data, {path}) = ?")
+            params.append(value)
+        return " AND ".join(clauses), params, exact
+
+    @staticmethod
+    def _select(fields: list[str] | None) -> tuple[str, list[Any]]:
+        """Build the selected column, projecting fields inside SQLite.
+
+        Args:
+            fields: Fields to keep (None selects the whole record)
+
+        Returns:
+            Column expression and its parameters
+        """
+        if fields is None:
+            return "data", []
+        placeholders = ", ".join("?" * len(fields))
+        column = f"(SELECT json_group_object(key, value) FROM json_each(records.data) WHERE key IN ({placeholders}))"
+        return column, list(fields)
+
+    async def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all records of a given entity type.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record, extracted by SQLite
+
+        Returns:
+            List of entity records
+        """
+        return await self.search(entity_type, {}, fields)
+
+    async def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search for records matching filters.
+
+        Scalar filters are evaluated by SQLite on the stored JSON (using the
+        indexes from ``register_index``); other filters are checked in Python.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records
+        """
+        where, params, exact = self._where(entity_type, filters)
+        column, column_params = self._select(fields if exact else None)
+        query = f"SELECT {column} FROM records WHERE {where} ORDER BY rowid"  # noqa: S608
+        rows = await self._submit(lambda connection: connection.execute(query, column_params + params).fetchall())
+        records = (json.loads(row[0]) for row in rows)
+        if exact:
+            return list(records)
+        return [_project(record, fields) for record in records if _matches(record, filters)]
+
+    async def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count the records matching filters with ``SELECT COUNT(*)``.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        where, params, exact = self._where(entity_type, filters)
+        if not exact:
+            return len(await self.search(entity_type, filters or {}, []))
+        query = f"SELECT COUNT(*) FROM records WHERE {where}"  # noqa: S608
+        return await self._submit(lambda connection: connection.execute(query, params).fetchone()[0])
+
+    async def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record matches filters, stopping at the first match.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        where, params, exact = self._where(entity_type, filters)
+        if not exact:
+            return await self.count(entity_type, filters) > 0
+        query = f"SELECT EXISTS (SELECT 1 FROM records WHERE {where})"  # noqa: S608
+        return bool(await self._submit(lambda connection: connection.execute(query, params).fetchone()[0]))
+
+    async def register_index(self, entity_type: str, field: str) -> None:
+        """Create a SQLite expression index on a field of the stored JSON.
+
+        The index covers the field for every entity type.
+
+        Args:
+            entity_type: Type of entity
+            field: Field to index
+        """
+        path = _json_path(field)
+        if path is None:
+            self._logger.warning(f"Cannot index field {field!r}")
+            return
+        slug = "".join(char if char.isalnum() else "_" for char in field)
+        name = f"records_{slug}_{zlib.crc32(field.encode()):08x}"
+        statement = f'CREATE INDEX IF NOT EXISTS "{name}" ON records (entity_type, json_extract(data, {path}))'
+        await self._submit(lambda connection: connection.execute(statement))
+        self._logger.info(f"Registered index on {entity_type}.{field}")
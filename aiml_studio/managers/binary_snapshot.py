@@ -0,0 +1,210 @@
+"""Compact binary snapshots of DataManager partitions for fast startup."""
+
+import itertools
+import marshal
+import mmap
+import os
+import struct
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aiml_studio.managers.records import Record
+
+MAGIC = b"AIMLSNAP"
+FORMAT_VERSION = 1
+BLOCK_SIZE = 4096
+
+# Magic, format version, marshal version, number of partitions
+_HEADER = struct.Struct("<8sHHI")
+_LENGTH = struct.Struct("<I")
+_NAME_LENGTH = struct.Struct("<H")
+
+
+@dataclass
+class PartitionSnapshot:
+    """Records of one entity type with the derived structures persisted alongside.
+
+    Attributes:
+        records: Record data keyed by entity id, in insertion order
+        versions: Record version per entity id
+        id_order: Time-ordered ids in sort order
+        postings: Equality index postings per indexed field (value to ids)
+    """
+
+    records: dict[str, Any] = field(default_factory=dict)
+    versions: dict[str, int] = field(default_factory=dict)
+    id_order: list[str] = field(default_factory=list)
+    postings: dict[str, dict[Any, list[str]]] = field(default_factory=dict)
+
+
+def write_snapshot(path: str | Path, partitions: Mapping[str, PartitionSnapshot]) -> int:
+    """Write partitions to a binary snapshot file.
+
+    Layout: a header, then per partition its name, its table of key shapes
+    (the distinct key tuples of its records) and its records in
+    length-prefixed blocks of up to ``BLOCK_SIZE`` records, followed by the
+    length-prefixed id order and index postings. A block is the ``marshal``
+    encoding of the ids, versions, shape numbers and value tuples of its
+    records. Storing keys once per shape keeps blocks small and lets typed
+    records be built positionally. The file is written to a temporary path,
+    fsynced and renamed into place.
+
+    Args:
+        path: Snapshot file path
+        partitions: Partition snapshots keyed by entity type
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        ValueError: If a record holds a value ``marshal`` cannot encode
+    """
+    path = Path(path)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    size = 0
+    with temp_path.open("wb") as f:
+        size += f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version, len(partitions)))
+        for entity_type, partition in partitions.items():
+            shapes: dict[tuple[str, ...], int] = {}
+            blocks = []
+            items = list(partition.records.items())
+            for start in range(0, len(items), BLOCK_SIZE):
+                ids, shape_numbers, values = [], [], []
+                for entity_id, record in items[start : start + BLOCK_SIZE]:
+                    data = record.to_dict() if isinstance(record, Record) else record
+                    keys = tuple(data)
+                    shape = shapes.get(keys)
+                    if shape is None:
+                        shape = shapes[keys] = len(shapes)
+                    ids.append(entity_id)
+                    shape_numbers.append(shape)
+                    values.append(tuple(data.values()))
+                versions = [partition.versions.get(entity_id, 0) for entity_id in ids]
+                blocks.append(_frame((ids, versions, shape_numbers, values)))
+            name = entity_type.encode()
+            size += f.write(_NAME_LENGTH.pack(len(name)) + name + _frame(list(shapes)))
+            size += f.write(_LENGTH.pack(len(blocks)) + b"".join(blocks))
+            size += f.write(_frame(partition.id_order) + _frame(partition.postings))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return size
+
+
+def _frame(value: Any) -> bytes:
+    """Encode a value as a length-prefixed ``marshal`` frame.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Frame bytes
+    """
+    payload = marshal.dumps(value)
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def read_snapshot(
+    path: str | Path, record_types: Mapping[str, type[Record]] | None = None
+) -> dict[str, PartitionSnapshot]:
+    """Read partitions from a binary snapshot file.
+
+    The file is memory-mapped and each block is decoded straight from the
+    mapping, so the file is never copied into a second buffer.
+
+    Args:
+        path: Snapshot file path
+        record_types: Record class per entity type to build records as
+            (other entity types are read as dictionaries)
+
+    Returns:
+        Partition snapshots keyed by entity type
+
+    Raises:
+        ValueError: If the file is not a snapshot or was written by an
+            incompatible format or Python version
+    """
+    with Path(path).open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            return _decode(mapped, view, record_types or {})
+        finally:
+            view.release()
+
+
+def _decode(
+    mapped: mmap.mmap, view: memoryview, record_types: Mapping[str, type[Record]]
+) -> dict[str, PartitionSnapshot]:
+    """Decode a memory-mapped snapshot.
+
+    Args:
+        mapped: Mapped snapshot file
+        view: Memory view over ``mapped``
+        record_types: Record class per entity type
+
+    Returns:
+        Partition snapshots keyed by entity type
+    """
+    if len(mapped) < _HEADER.size:
+        msg = "Snapshot file is truncated"
+        raise ValueError(msg)
+    magic, format_version, marshal_version, partition_count = _HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        msg = "Not a supported data snapshot"
+        raise ValueError(msg)
+    if marshal_version != marshal.version:
+        msg = f"Snapshot was written with marshal version {marshal_version}, expected {marshal.version}"
+        raise ValueError(msg)
+
+    offset = _HEADER.size
+
+    def read_frame() -> Any:
+        nonlocal offset
+        (length,) = _LENGTH.unpack_from(mapped, offset)
+        value = marshal.loads(view[offset + 4 : offset + 4 + length])
+        offset += 4 + length
+        return value
+
+    partitions = {}
+    for _ in range(partition_count):
+        (name_length,) = _NAME_LENGTH.unpack_from(mapped, offset)
+        offset += _NAME_LENGTH.size
+        entity_type = bytes(view[offset : offset + name_length]).decode()
+        offset += name_length
+        builders = [_builder(keys, record_types.get(entity_type)) for keys in read_frame()]
+        (block_count,) = _LENGTH.unpack_from(mapped, offset)
+        offset += _LENGTH.size
+
+        partition = PartitionSnapshot()
+        for _ in range(block_count):
+            ids, versions, shape_numbers, values = read_frame()
+            if min(shape_numbers) == max(shape_numbers):
+                records = builders[shape_numbers[0]](values)
+            else:
+                records = [builders[shape]([row])[0] for shape, row in zip(shape_numbers, values, strict=True)]
+            partition.records.update(zip(ids, records, strict=True))
+            partition.versions.update(zip(ids, versions, strict=True))
+        partition.id_order = read_frame()
+        partition.postings = read_frame()
+        partitions[entity_type] = partition
+    return partitions
+
+
+def _builder(keys: tuple[str, ...], record_type: type[Record] | None) -> Callable[[list[tuple[Any, ...]]], list[Any]]:
+    """Get a function building the records of one key shape.
+
+    Args:
+        keys: Keys of the shape, in record order
+        record_type: Record class to build (None builds dictionaries)
+
+    Returns:
+        Function turning a list of value tuples into records
+    """
+    if record_type is None:
+        return lambda rows: list(map(dict, map(zip, itertools.repeat(keys), rows)))
+    if keys == record_type.field_names()[: len(keys)]:
+        # Keys are a prefix of the schema, so values map onto positional arguments
+        return lambda rows: list(itertools.starmap(record_type, rows))
+    return lambda rows: [record_type.from_dict(dict(zip(keys, row, strict=True))) for row in rows]
@@ -0,0 +1,524 @@
+"""Read-through caching wrapper composing a DataManager with a CacheManager."""
+
+import json
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from aiml_studio.managers.aggregations import Aggregation
+from aiml_studio.managers.cache_manager import CacheManager
+from aiml_studio.managers.change_feed import ChangeEvent
+from aiml_studio.managers.data_manager import DataManager
+from aiml_studio.managers.query_plan import QueryPlan
+from aiml_studio.managers.records import MISSING
+from aiml_studio.managers.relationships import Relationship
+
+# Stored in place of a cached None so it can be told apart from a cache miss
+_NONE = ("__cached_none__",)
+
+
+class CachingDataManager(DataManager):
+    """DataManager that caches reads of another DataManager.
+
+    ``retrieve``, ``search``, ``list_all`` and ``count`` results are kept in
+    the cache manager. Mutations made through this wrapper invalidate only
+    the entries they can affect: the record itself and the cached queries
+    whose filters match the record before or after the change. Records a
+    delete cascades to drop every cached query of their entity type. Writes
+    that bypass the wrapper are only picked up when the cache entries expire.
+    """
+
+    def __init__(self, data_manager: DataManager, cache_manager: CacheManager, ttl: int | None = None) -> None:
+        """Initialize the caching wrapper.
+
+        Args:
+            data_manager: Data manager holding the records
+            cache_manager: Cache to store read results in
+            ttl: Time-to-live of cached results (None uses the cache default)
+        """
+        super().__init__()
+        self._data_manager = data_manager
+        self._cache = cache_manager
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # Cached query keys per entity type with the filters they depend on
+        self._queries: dict[str, dict[str, tuple[str, Mapping[str, Any] | None]]] = {}
+        # Bumped on every mutation so reads started before it are not cached
+        self._generations: dict[str, int] = {}
+        self._stats = {"backend_calls": 0, "cache_hits": 0, "invalidations": 0}
+
+    def initialize(self) -> None:
+        """Initialize the wrapped data manager and the cache."""
+        self._data_manager.initialize()
+        self._cache.initialize()
+        self._logger.info("CachingDataManager initialized")
+
+    def shutdown(self) -> None:
+        """Shutdown the wrapped data manager and drop cached results."""
+        self._data_manager.shutdown()
+        self._cache.clear()
+        with self._lock:
+            self._queries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get caching statistics.
+
+        Returns:
+            Backend calls made, calls saved by cache hits and invalidations
+        """
+        stats = dict(self._stats)
+        stats["saved_calls"] = stats["cache_hits"]
+        return stats
+
+    def _read(self, key: str, entity_type: str, kind: str, filters: Mapping[str, Any] | None, load: Any) -> Any:
+        """Read through the cache.
+
+        Args:
+            key: Cache key
+            entity_type: Type of entity
+            kind: 'retrieve', 'count' or 'search'
+            filters: Filters the result depends on (queries only)
+            load: Callable loading the result from the wrapped manager
+
+        Returns:
+            Cached or loaded result
+        """
+        cached = self._cache.get(key, MISSING)
+        if cached is not MISSING:
+            self._stats["cache_hits"] += 1
+            return None if cached is _NONE else cached
+
+        generation = self._generations.get(entity_type, 0)
+        result = load()
+        self._stats["backend_calls"] += 1
+        with self._lock:
+            if self._generations.get(entity_type, 0) != generation:
+                return result
+            if kind != "retrieve":
+                self._queries.setdefault(entity_type, {})[key] = (kind, filters)
+            self._cache.set(key, _NONE if result is None else result, ttl=self._ttl)
+        return result
+
+    def _invalidate(
+        self,
+        entity_type: str,
+        entity_id: str,
+        old_record: Mapping[str, Any] | None,
+        new_record: Mapping[str, Any] | None,
+    ) -> None:
+        """Drop the cache entries a mutation can affect.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            old_record: Record before the mutation (None if it did not exist)
+            new_record: Record after the mutation (None if it was deleted)
+        """
+        membership_changed = old_record is None or new_record is None
+        with self._lock:
+            self._generations[entity_type] = self._generations.get(entity_type, 0) + 1
+            stale = [_key("retrieve", entity_type, entity_id)]
+            queries = self._queries.get(entity_type, {})
+            for key, (kind, filters) in list(queries.items()):
+                if not filters:
+                    affected = membership_changed or kind == "search"
+                else:
+                    affected = any(
+                        record is not None and _matches(record, filters) for record in (old_record, new_record)
+                    )
+                if affected:
+                    stale.append(key)
+                    del queries[key]
+            for key in stale:
+                if self._cache.delete(key):
+                    self._stats["invalidations"] += 1
+
+    def _invalidate_changed(self, sequence: int, entity_type: str, entity_id: str) -> None:
+        """Drop the cache entries of records a delete changed besides its own.
+
+        The previous versions of cascaded records are unknown, so every
+        cached query of their entity types is dropped.
+
+        Args:
+            sequence: Change sequence of the wrapped manager before the delete
+            entity_type: Type of the deleted entity
+            entity_id: Deleted entity identifier
+        """
+        events = self._data_manager.changes_since(sequence)
+        with self._lock:
+            if events is None:
+                changed = [(changed_type, None) for changed_type in list(self._queries)]
+            else:
+                changed = [
+                    (event.entity_type, event.entity_id)
+                    for event in events
+                    if (event.entity_type, event.entity_id) != (entity_type, entity_id)
+                ]
+            stale = set()
+            for changed_type, changed_id in changed:
+                self._generations[changed_type] = self._generations.get(changed_type, 0) + 1
+                if changed_id is not None:
+                    stale.add(_key("retrieve", changed_type, changed_id))
+                stale.update(self._queries.pop(changed_type, {}))
+            for key in stale:
+                if self._cache.delete(key):
+                    self._stats["invalidations"] += 1
+
+    def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Create a record and invalidate the queries it joins.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Unique identifier
+            data: Data to store
+
+        Returns:
+            True if successful
+        """
+        self._stats["backend_calls"] += 1
+        if not self._data_manager.create(entity_type, entity_id, data):
+            return False
+        self._invalidate(entity_type, entity_id, None, data)
+        return True
+
+    def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a record through the cache.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Entity data or None
+        """
+        return self._read(
+            _key("retrieve", entity_type, entity_id),
+            entity_type,
+            "retrieve",
+            None,
+            lambda: self._data_manager.retrieve(entity_type, entity_id),
+        )
+
+    def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Update a record and invalidate the entries it affects.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Only update if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        old_record = self._data_manager.retrieve(entity_type, entity_id)
+        self._stats["backend_calls"] += 2
+        if not self._data_manager.update(entity_type, entity_id, data, expected_version):
+            return False
+        self._stats["backend_calls"] += 1
+        new_record = self._data_manager.retrieve(entity_type, entity_id)
+        old_record = old_record or {}
+        self._invalidate(entity_type, entity_id, old_record, new_record or {**old_record, **data})
+        return True
+
+    def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a record and invalidate the entries it affects.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        old_record = self._data_manager.retrieve(entity_type, entity_id)
+        sequence = self._data_manager.latest_change_sequence()
+        self._stats["backend_calls"] += 2
+        if not self._data_manager.delete(entity_type, entity_id, expected_version):
+            return False
+        self._invalidate(entity_type, entity_id, old_record or {}, None)
+        if self._data_manager.latest_change_sequence() != sequence + 1:
+            self._invalidate_changed(sequence, entity_type, entity_id)
+        return True
+
+    def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all records of an entity type through the cache.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record
+
+        Returns:
+            List of entity records
+        """
+        return self.search(entity_type, {}, fields)
+
+    def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search records through the cache.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records (a new list on every call)
+        """
+        results = self._read(
+            _key("search", entity_type, filters, fields),
+            entity_type,
+            "search",
+            dict(filters),
+            lambda: self._data_manager.search(entity_type, filters, fields),
+        )
+        return list(results)
+
+    def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count matching records through the cache.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        return self._read(
+            _key("count", entity_type, filters),
+            entity_type,
+            "count",
+            dict(filters) if filters else None,
+            lambda: self._data_manager.count(entity_type, filters),
+        )
+
+    def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record matches filters, using the cached count.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        return self.count(entity_type, filters) > 0
+
+    def retrieve_many(
+        self, entity_type: str, entity_ids: Iterable[str], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Retrieve several records through the cache.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: Entity identifiers
+            fields: Only return these fields of each record
+
+        Returns:
+            Records in the order of ``entity_ids``, skipping ids that do not exist
+        """
+        records = (self.retrieve(entity_type, entity_id) for entity_id in entity_ids)
+        return self._project((record for record in records if record is not None), fields)
+
+    def define_relationship(
+        self,
+        name: str,
+        source_type: str,
+        field: str,
+        target_type: str,
+        many: bool = False,
+        on_delete: str = "restrict",
+    ) -> Relationship:
+        """Declare a relationship on the wrapped data manager.
+
+        Args:
+            name: Relationship name
+            source_type: Entity type holding the reference
+            field: Field holding the referenced id (a list of ids if ``many``)
+            target_type: Entity type referenced
+            many: Whether the field holds a list of ids
+            on_delete: 'restrict', 'cascade' or 'set_null'
+
+        Returns:
+            Declared relationship
+        """
+        return self._data_manager.define_relationship(name, source_type, field, target_type, many, on_delete)
+
+    def related(
+        self, name: str, entity_id: str, reverse: bool = False, fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Get related records from the wrapped data manager.
+
+        Args:
+            name: Relationship name
+            entity_id: Id of a source record (or of a target record if ``reverse``)
+            reverse: Return the source records referencing a target
+            fields: Only return these fields of each record
+
+        Returns:
+            Related records
+        """
+        return self._data_manager.related(name, entity_id, reverse, fields)
+
+    def explain(self, entity_type: str, filters: dict[str, Any]) -> QueryPlan:
+        """Explain a search on the wrapped data manager, bypassing the cache.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+
+        Returns:
+            Plan of the search on the wrapped data manager
+        """
+        return self._data_manager.explain(entity_type, filters)
+
+    def register_index(self, entity_type: str, field: str) -> None:
+        """Declare an equality index on the wrapped data manager.
+
+        Args:
+            entity_type: Type of entity
+            field: Field to index
+        """
+        self._data_manager.register_index(entity_type, field)
+
+    def register_text_index(self, entity_type: str, fields: list[str]) -> None:
+        """Declare full-text indexed fields on the wrapped data manager.
+
+        Args:
+            entity_type: Type of entity
+            fields: Names of the text fields to index
+        """
+        self._data_manager.register_text_index(entity_type, fields)
+
+    def text_search(self, entity_type: str, query: str) -> list[dict[str, Any]]:
+        """Run a full-text search on the wrapped data manager.
+
+        Args:
+            entity_type: Type of entity
+            query: Full-text query
+
+        Returns:
+            List of matching records
+        """
+        return self._data_manager.text_search(entity_type, query)
+
+    def changes_since(self, sequence: int, entity_type: str | None = None) -> list[ChangeEvent] | None:
+        """Get the change feed of the wrapped data manager.
+
+        Args:
+            sequence: Last sequence number the reader has applied
+            entity_type: Only return changes of this entity type
+
+        Returns:
+            Change events in order, or None if the reader has to reload
+        """
+        return self._data_manager.changes_since(sequence, entity_type)
+
+    def latest_change_sequence(self) -> int:
+        """Get the latest change sequence of the wrapped data manager.
+
+        Returns:
+            Latest sequence number
+        """
+        return self._data_manager.latest_change_sequence()
+
+    def wait_for_changes(self, sequence: int, timeout: float | None = None) -> bool:
+        """Wait for a change on the wrapped data manager.
+
+        Args:
+            sequence: Last sequence number the reader has applied
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if newer changes are available
+        """
+        return self._data_manager.wait_for_changes(sequence, timeout)
+
+    def register_aggregation(self, name: str, entity_type: str, aggregation: Aggregation) -> None:
+        """Register an aggregation on the wrapped data manager.
+
+        Args:
+            name: Name of the aggregate
+            entity_type: Type of entity to aggregate
+            aggregation: Aggregation to maintain
+        """
+        self._data_manager.register_aggregation(name, entity_type, aggregation)
+
+    def get_aggregates(self, names: list[str] | None = None) -> dict[str, Any]:
+        """Get aggregates of the wrapped data manager.
+
+        Args:
+            names: Aggregates to return (None returns all)
+
+        Returns:
+            Mapping of aggregate name to value
+        """
+        return self._data_manager.get_aggregates(names)
+
+    def get_version(self, entity_type: str, entity_id: str) -> int | None:
+        """Get a record version from the wrapped data manager.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Record version, or None if the record does not exist
+        """
+        return self._data_manager.get_version(entity_type, entity_id)
+
+    def latest(self, entity_type: str, n: int) -> list[dict[str, Any]]:
+        """Get the most recently created records from the wrapped data manager.
+
+        Args:
+            entity_type: Type of entity
+            n: Maximum number of records
+
+        Returns:
+            Up to ``n`` records, newest first
+        """
+        return self._data_manager.latest(entity_type, n)
+
+    def created_after(self, entity_type: str, timestamp: float, limit: int | None = None) -> list[dict[str, Any]]:
+        """Get records created after a time from the wrapped data manager.
+
+        Args:
+            entity_type: Type of entity
+            timestamp: Epoch seconds
+            limit: Maximum number of records
+
+        Returns:
+            Records created after ``timestamp``
+        """
+        return self._data_manager.created_after(entity_type, timestamp, limit)
+
+
+def _key(kind: str, entity_type: str, *parts: Any) -> str:
+    """Build a cache key.
+
+    Args:
+        kind: Operation name
+        entity_type: Type of entity
+        *parts: Operation arguments
+
+    Returns:
+        Cache key
+    """
+    return f"data:{kind}:{entity_type}:" + json.dumps(parts, sort_keys=True, default=repr, separators=(",", ":"))
+
+
+def _matches(record: Mapping[str, Any], filters: Mapping[str, Any]) -> bool:
+    """Check whether a record matches equality filters.
+
+    Args:
+        record: Record to test
+        filters: Field values to match
+
+    Returns:
+        True if every filter matches
+    """
+    return all(record.get(key, MISSING) == value for key, value in filters.items())
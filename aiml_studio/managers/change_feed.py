@@ -0,0 +1,150 @@
+"""Change-data-capture feed of data mutations."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A single create, update or delete applied to a data record."""
+
+    sequence: int
+    op: str
+    entity_type: str
+    entity_id: str
+    record: Mapping[str, Any] | None
+    timestamp: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the event to a JSON-serializable dictionary.
+
+        Returns:
+            Event data
+        """
+        data = asdict(self)
+        data["record"] = dict(self.record) if self.record is not None else None
+        return data
+
+
+class ChangeFeed:
+    """Bounded, sequenced in-memory log of change events.
+
+    Sequence numbers are consecutive, so reading the changes after a known
+    sequence only touches the events that are actually returned. Once an
+    event falls out of the bounded log, readers positioned before it must
+    reload the full data set.
+    """
+
+    def __init__(self, max_events: int = 10_000) -> None:
+        """Initialize the change feed.
+
+        Args:
+            max_events: Maximum number of events retained
+        """
+        self._events: deque[ChangeEvent] = deque(maxlen=max_events)
+        self._sequence = 0
+        self._condition = threading.Condition()
+
+    @property
+    def latest_sequence(self) -> int:
+        """Get the sequence number of the most recent event.
+
+        Returns:
+            Latest sequence number (0 if nothing was published)
+        """
+        return self._sequence
+
+    def publish(
+        self, op: str, entity_type: str, entity_id: str, record: Mapping[str, Any] | None
+    ) -> ChangeEvent:
+        """Append a change event to the feed.
+
+        Args:
+            op: Mutation type ('create', 'update' or 'delete')
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            record: Record after the change (None for deletes)
+
+        Returns:
+            The published event
+        """
+        with self._condition:
+            self._sequence += 1
+            event = ChangeEvent(self._sequence, op, entity_type, entity_id, record, time.time())
+            self._events.append(event)
+            self._condition.notify_all()
+        return event
+
+    def changes_since(
+        self, sequence: int, entity_type: str | None = None, limit: int | None = None
+    ) -> list[ChangeEvent] | None:
+        """Get the events published after a sequence number.
+
+        Args:
+            sequence: Last sequence number the reader has applied
+            entity_type: Only return events of this entity type
+            limit: Maximum number of events to return (oldest first)
+
+        Returns:
+            Events in sequence order, or None if some of the requested events
+            were already evicted and the reader has to reload everything
+        """
+        with self._condition:
+            pending = self._sequence - sequence
+            if pending <= 0:
+                return []
+            if pending > len(self._events):
+                return None
+
+            events: list[ChangeEvent] = []
+            for event in reversed(self._events):
+                if event.sequence <= sequence:
+                    break
+                events.append(event)
+
+        events.reverse()
+        if entity_type is not None:
+            events = [event for event in events if event.entity_type == entity_type]
+        if limit is not None:
+            events = events[:limit]
+        return events
+
+    def wait_for_changes(self, sequence: int, timeout: float | None = None) -> bool:
+        """Block until an event newer than a sequence number is published.
+
+        Args:
+            sequence: Last sequence number the reader has applied
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if newer events are available
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._sequence > sequence, timeout)
+
+    def clear(self) -> None:
+        """Drop all retained events, keeping the sequence counter."""
+        with self._condition:
+            self._events.clear()
+
+
+def apply_changes(records: dict[str, Any], events: Iterable[ChangeEvent]) -> dict[str, Any]:
+    """Apply change events to a local copy of records keyed by entity id.
+
+    Args:
+        records: Records keyed by entity id, updated in place
+        events: Events in sequence order
+
+    Returns:
+        The updated records
+    """
+    for event in events:
+        if event.op == "delete":
+            records.pop(event.entity_id, None)
+        else:
+            records[event.entity_id] = event.record
+    return records
@@ -0,0 +1,551 @@
+"""Compact columnar storage engine for high-volume entity types."""
+
+import threading
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+COLUMN_TYPES = ("int", "float", "bool", "category", "str", "object")
+
+_MISSING = object()
+
+
+class _Column:
+    """Column holding arbitrary Python objects."""
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self._values: list[Any] = []
+
+    def accepts(self, value: Any) -> bool:
+        """Check whether the column can store a value natively.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            True if the value fits the column type
+        """
+        return value is not None
+
+    def append(self, value: Any) -> None:
+        """Append a value (or ``_MISSING``) as a new row.
+
+        Args:
+            value: Value to append
+        """
+        self._values.append(value)
+
+    def set(self, row: int, value: Any) -> None:
+        """Overwrite the value of a row.
+
+        Args:
+            row: Row number
+            value: New value (or ``_MISSING``)
+        """
+        self._values[row] = value
+
+    def get(self, row: int) -> Any:
+        """Get the value of a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Stored value or ``_MISSING``
+        """
+        return self._values[row]
+
+    def move(self, source: int, target: int) -> None:
+        """Copy a row over another row.
+
+        Args:
+            source: Row to copy from
+            target: Row to overwrite
+        """
+        self._values[target] = self._values[source]
+
+    def pop(self) -> None:
+        """Remove the last row."""
+        self._values.pop()
+
+    def rows_equal(self, value: Any) -> list[int]:
+        """Find the rows holding a value.
+
+        Args:
+            value: Value to look for
+
+        Returns:
+            Matching row numbers
+        """
+        return [row for row, stored in enumerate(self._values) if stored is not _MISSING and stored == value]
+
+
+class _StrColumn(_Column):
+    """Column of plain strings."""
+
+    def accepts(self, value: Any) -> bool:
+        """Check whether a value is a string.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            True for strings
+        """
+        return isinstance(value, str)
+
+
+class _CategoryColumn(_Column):
+    """Dictionary-encoded string column storing 32-bit codes per row."""
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self._codes = array("I")
+        self._dictionary: list[Any] = [_MISSING]
+        self._lookup: dict[str, int] = {}
+
+    def accepts(self, value: Any) -> bool:
+        """Check whether a value is a string.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            True for strings
+        """
+        return isinstance(value, str)
+
+    def _encode(self, value: Any) -> int:
+        """Get the code of a value, adding it to the dictionary if needed.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Dictionary code (0 for missing)
+        """
+        if value is _MISSING:
+            return 0
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self._dictionary)
+            self._dictionary.append(value)
+        return code
+
+    def append(self, value: Any) -> None:
+        """Append a value (or ``_MISSING``) as a new row.
+
+        Args:
+            value: Value to append
+        """
+        self._codes.append(self._encode(value))
+
+    def set(self, row: int, value: Any) -> None:
+        """Overwrite the value of a row.
+
+        Args:
+            row: Row number
+            value: New value (or ``_MISSING``)
+        """
+        self._codes[row] = self._encode(value)
+
+    def get(self, row: int) -> Any:
+        """Get the value of a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Stored value or ``_MISSING``
+        """
+        return self._dictionary[self._codes[row]]
+
+    def move(self, source: int, target: int) -> None:
+        """Copy a row over another row.
+
+        Args:
+            source: Row to copy from
+            target: Row to overwrite
+        """
+        self._codes[target] = self._codes[source]
+
+    def pop(self) -> None:
+        """Remove the last row."""
+        self._codes.pop()
+
+    def rows_equal(self, value: Any) -> list[int]:
+        """Find the rows holding a value by comparing codes.
+
+        Args:
+            value: Value to look for
+
+        Returns:
+            Matching row numbers
+        """
+        code = self._lookup.get(value) if isinstance(value, str) else None
+        if code is None:
+            return []
+        return [row for row, stored in enumerate(self._codes) if stored == code]
+
+
+class _NumericColumn(_Column):
+    """Typed array column with a validity byte per row."""
+
+    _typecode = "q"
+
+    def __init__(self) -> None:
+        """Initialize an empty column."""
+        self._values = array(self._typecode)  # type: ignore[assignment]
+        self._valid = bytearray()
+
+    def accepts(self, value: Any) -> bool:
+        """Check whether a value is an integer.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            True for integers that fit in 64 bits
+        """
+        return type(value) is int and -(2**63) <= value < 2**63
+
+    def append(self, value: Any) -> None:
+        """Append a value (or ``_MISSING``) as a new row.
+
+        Args:
+            value: Value to append
+        """
+        missing = value is _MISSING
+        self._values.append(0 if missing else value)
+        self._valid.append(0 if missing else 1)
+
+    def set(self, row: int, value: Any) -> None:
+        """Overwrite the value of a row.
+
+        Args:
+            row: Row number
+            value: New value (or ``_MISSING``)
+        """
+        missing = value is _MISSING
+        self._values[row] = 0 if missing else value
+        self._valid[row] = 0 if missing else 1
+
+    def get(self, row: int) -> Any:
+        """Get the value of a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Stored value or ``_MISSING``
+        """
+        return self._values[row] if self._valid[row] else _MISSING
+
+    def move(self, source: int, target: int) -> None:
+        """Copy a row over another row.
+
+        Args:
+            source: Row to copy from
+            target: Row to overwrite
+        """
+        self._values[target] = self._values[source]
+        self._valid[target] = self._valid[source]
+
+    def pop(self) -> None:
+        """Remove the last row."""
+        self._values.pop()
+        self._valid.pop()
+
+    def rows_equal(self, value: Any) -> list[int]:
+        """Find the rows holding a value.
+
+        Args:
+            value: Value to look for
+
+        Returns:
+            Matching row numbers
+        """
+        if not self.accepts(value):
+            return []
+        valid = self._valid
+        return [row for row, stored in enumerate(self._values) if stored == value and valid[row]]
+
+
+class _FloatColumn(_NumericColumn):
+    """Double-precision float column."""
+
+    _typecode = "d"
+
+    def accepts(self, value: Any) -> bool:
+        """Check whether a value is a float.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            True for floats
+        """
+        return type(value) is float
+
+
+class _BoolColumn(_NumericColumn):
+    """Boolean column stored as one byte per row."""
+
+    _typecode = "b"
+
+    def accepts(self, value: Any) -> bool:
+        """Check whether a value is a boolean.
+
+        Args:
+            value: Value to store
+
+        Returns:
+            True for booleans
+        """
+        return type(value) is bool
+
+    def get(self, row: int) -> Any:
+        """Get the value of a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Stored value or ``_MISSING``
+        """
+        return bool(self._values[row]) if self._valid[row] else _MISSING
+
+
+_COLUMN_CLASSES: dict[str, type[_Column]] = {
+    "int": _NumericColumn,
+    "float": _FloatColumn,
+    "bool": _BoolColumn,
+    "category": _CategoryColumn,
+    "str": _StrColumn,
+    "object": _Column,
+}
+
+
+class ColumnarTable(MutableMapping):
+    """Records of one entity type stored column by column.
+
+    Each schema field is kept in its own column: numbers and booleans in
+    typed arrays, ``category`` strings as 32-bit codes into a shared
+    dictionary. A row-id mapping translates entity ids to row numbers and
+    deletes move the last row into the freed slot to keep columns dense.
+    Values that do not fit their column (and fields outside the schema) are
+    kept in a sparse per-row overflow mapping, so any record round-trips
+    unchanged.
+
+    The table behaves like a ``dict`` of entity id to record; records are
+    materialized as new dictionaries on access. All access is serialized by
+    an internal lock.
+    """
+
+    def __init__(self, schema: Mapping[str, str]) -> None:
+        """Initialize the table.
+
+        Args:
+            schema: Mapping of field name to column type (see ``COLUMN_TYPES``)
+        """
+        unknown = set(schema.values()) - set(COLUMN_TYPES)
+        if unknown:
+            msg = f"Unknown column types: {', '.join(sorted(unknown))}"
+            raise ValueError(msg)
+
+        self._schema = dict(schema)
+        self._columns = {field: _COLUMN_CLASSES[kind]() for field, kind in self._schema.items()}
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._overflow: dict[int, dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def schema(self) -> dict[str, str]:
+        """Get the table schema.
+
+        Returns:
+            Mapping of field name to column type
+        """
+        return dict(self._schema)
+
+    def _split(self, record: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        """Split a record into column values and overflow fields.
+
+        Args:
+            record: Record to store
+
+        Returns:
+            Tuple of (column values, overflow mapping or None)
+        """
+        values = {}
+        overflow = None
+        for field, column in self._columns.items():
+            value = record.get(field, _MISSING)
+            if value is _MISSING or column.accepts(value):
+                values[field] = value
+            else:
+                values[field] = _MISSING
+                overflow = overflow or {}
+                overflow[field] = value
+        for field, value in record.items():
+            if field not in self._columns:
+                overflow = overflow or {}
+                overflow[field] = value
+        return values, overflow
+
+    def _materialize(self, row: int) -> dict[str, Any]:
+        """Build the record stored in a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Record dictionary
+        """
+        record = {field: value for field, column in self._columns.items() if (value := column.get(row)) is not _MISSING}
+        overflow = self._overflow.get(row)
+        if overflow:
+            record.update(overflow)
+        return record
+
+    def __getitem__(self, entity_id: str) -> dict[str, Any]:
+        """Get a record.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            Materialized record
+        """
+        with self._lock:
+            return self._materialize(self._rows[entity_id])
+
+    def __setitem__(self, entity_id: str, record: Mapping[str, Any]) -> None:
+        """Insert or replace a record.
+
+        Args:
+            entity_id: Entity identifier
+            record: Record data
+        """
+        values, overflow = self._split(record)
+        with self._lock:
+            row = self._rows.get(entity_id)
+            if row is None:
+                row = len(self._ids)
+                self._rows[entity_id] = row
+                self._ids.append(entity_id)
+                for field, column in self._columns.items():
+                    column.append(values[field])
+            else:
+                for field, column in self._columns.items():
+                    column.set(row, values[field])
+            if overflow:
+                self._overflow[row] = overflow
+            else:
+                self._overflow.pop(row, None)
+
+    def __delitem__(self, entity_id: str) -> None:
+        """Delete a record by moving the last row into its slot.
+
+        Args:
+            entity_id: Entity identifier
+        """
+        with self._lock:
+            row = self._rows.pop(entity_id)
+            last = len(self._ids) - 1
+            if row != last:
+                moved_id = self._ids[last]
+                self._ids[row] = moved_id
+                self._rows[moved_id] = row
+                moved_overflow = self._overflow.pop(last, None)
+                if moved_overflow:
+                    self._overflow[row] = moved_overflow
+                else:
+                    self._overflow.pop(row, None)
+                for column in self._columns.values():
+                    column.move(last, row)
+            else:
+                self._overflow.pop(row, None)
+            self._ids.pop()
+            for column in self._columns.values():
+                column.pop()
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Check whether a record exists.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            True if the record exists
+        """
+        return entity_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over a snapshot of the entity ids.
+
+        Returns:
+            Iterator of entity ids
+        """
+        with self._lock:
+            return iter(list(self._ids))
+
+    def __len__(self) -> int:
+        """Get the number of records.
+
+        Returns:
+            Number of records
+        """
+        return len(self._ids)
+
+    def copy(self) -> dict[str, dict[str, Any]]:
+        """Materialize all records.
+
+        Returns:
+            Mapping of entity id to record
+        """
+        with self._lock:
+            return {entity_id: self._materialize(row) for row, entity_id in enumerate(self._ids)}
+
+    def records(self) -> list[dict[str, Any]]:
+        """Materialize all records in row order.
+
+        Returns:
+            List of records
+        """
+        with self._lock:
+            return [self._materialize(row) for row in range(len(self._ids))]
+
+    def select(self, filters: Mapping[str, Any]) -> list[dict[str, Any]]:
+        """Find records whose fields equal the filter values.
+
+        Filters on schema columns are evaluated on the encoded column data,
+        starting with the most selective one; only matching rows are
+        materialized.
+
+        Args:
+            filters: Field values to match
+
+        Returns:
+            Matching records
+        """
+        with self._lock:
+            rows: list[int] | None = None
+            for field, value in filters.items():
+                column = self._columns.get(field)
+                if column is None or not column.accepts(value):
+                    continue
+                matches = column.rows_equal(value)
+                rows = matches if rows is None else sorted(set(rows).intersection(matches))
+                if not rows:
+                    return []
+
+            candidates = range(len(self._ids)) if rows is None else rows
+            results = []
+            for row in candidates:
+                record = self._materialize(row)
+                if all(field in record and record[field] == value for field, value in filters.items()):
+                    results.append(record)
+            return results
@@ -1,8 +1,26 @@
 """Data Manager for handling all application data operations."""
 
+import bisect
+import itertools
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
+from pathlib import Path
 from typing import Any
 
+from aiml_studio.managers.aggregations import Aggregation
+from aiml_studio.managers.binary_snapshot import PartitionSnapshot, read_snapshot, write_snapshot
+from aiml_studio.managers.change_feed import ChangeEvent, ChangeFeed
+from aiml_studio.managers.columnar import ColumnarTable
+from aiml_studio.managers.field_index import FieldIndex
+from aiml_studio.managers.log_store import TimePartitionedLogStore, to_epoch
+from aiml_studio.managers.query_plan import QueryPlan
+from aiml_studio.managers.records import MISSING, RECORD_TYPES, Record, RecordViews, read_only
+from aiml_studio.managers.relationships import ON_DELETE, Relationship, RelationshipIndex
+from aiml_studio.managers.text_index import FullTextIndex
+from aiml_studio.managers.write_ahead_log import WriteAheadLog
+from aiml_studio.utilities.ids import is_time_ordered_id, min_id_after
 from aiml_studio.utilities.logger import get_logger
 
 
@@ -15,12 +33,35 @@ class DataManager(ABC):
     - Updating existing records
     - Deleting records
     - Storing and managing data
+    - Equality indexes answering counts and filters without scans
+    - Full-text search over declared text fields
+    - Publishing a change feed of every mutation
+    - Maintaining registered aggregations incrementally
+    - Versioning records for optimistic concurrency control
+    - Time-ordered access to records created with ``generate_id`` ids
+    - Zero-copy, read-only views of stored records
+    - Explaining searches and logging slow ones
+    - Relationships between entity types with cascade-aware deletes
     """
 
     def __init__(self) -> None:
         """Initialize the DataManager."""
         self._logger = get_logger(__name__)
-        self._data_store: dict[str, dict[str, Any]] = {}
+        self._data_store: dict[str, MutableMapping[str, Any]] = {}
+        self._text_indexes: dict[str, FullTextIndex] = {}
+        self._field_indexes: dict[str, dict[str, FieldIndex]] = {}
+        self._change_feed = ChangeFeed()
+        self._aggregations: dict[str, dict[str, Aggregation]] = {}
+        self._versions: dict[str, dict[str, int]] = {}
+        # Versions come from a clock seeded with the current time, so versions
+        # issued after a restart never collide with ETags handed out before it.
+        self._version_clock = itertools.count(time.time_ns())
+        self._id_order: dict[str, list[str]] = {}
+        self._relationships: dict[str, RelationshipIndex] = {}
+        # Relationship indexes per source entity type, maintained on every mutation
+        self._outgoing: dict[str, list[RelationshipIndex]] = {}
+        # Searches taking at least this many seconds are logged (None disables)
+        self.slow_query_threshold: float | None = None
 
     @abstractmethod
     def initialize(self) -> None:
@@ -68,38 +109,45 @@ class DataManager(ABC):
         pass
 
     @abstractmethod
-    def update(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+    def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
         """Update an existing data record.
 
         Args:
             entity_type: Type of entity
             entity_id: Entity identifier
             data: Updated data
+            expected_version: Only update if the record is still at this
+                version (see ``get_version``)
 
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise (including version conflicts)
         """
         pass
 
     @abstractmethod
-    def delete(self, entity_type: str, entity_id: str) -> bool:
+    def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
         """Delete a data record.
 
         Args:
             entity_type: Type of entity
             entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this
+                version (see ``get_version``)
 
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise (including version conflicts)
         """
         pass
 
     @abstractmethod
-    def list_all(self, entity_type: str) -> list[dict[str, Any]]:
+    def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
         """List all records of a given entity type.
 
         Args:
             entity_type: Type of entity
+            fields: Only return these fields of each record
 
         Returns:
             List of entity records
@@ -107,36 +155,1050 @@ class DataManager(ABC):
         pass
 
     @abstractmethod
-    def search(self, entity_type: str, filters: dict[str, Any]) -> list[dict[str, Any]]:
+    def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
         """Search for records matching filters.
 
         Args:
             entity_type: Type of entity
             filters: Search filters
+            fields: Only return these fields of each record
 
         Returns:
             List of matching records
         """
         pass
 
+    def retrieve_view(self, entity_type: str, entity_id: str) -> Mapping[str, Any] | None:
+        """Retrieve a read-only view of a record without copying it.
+
+        Unlike ``retrieve``, the result cannot be used to modify the stored
+        record, so it is safe to hand to code that does not own the store.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Read-only record, or None if not found
+        """
+        record = self.retrieve(entity_type, entity_id)
+        return None if record is None else read_only(record)
+
+    def list_all_views(self, entity_type: str) -> Sequence[Mapping[str, Any]]:
+        """List read-only views of all records of an entity type.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            Lazy sequence of read-only records
+        """
+        return RecordViews(self.list_all(entity_type))
+
+    def search_views(self, entity_type: str, filters: dict[str, Any]) -> Sequence[Mapping[str, Any]]:
+        """Search for records matching filters, returning read-only views.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+
+        Returns:
+            Lazy sequence of read-only matching records
+        """
+        return RecordViews(self.search(entity_type, filters))
+
+    def explain(self, entity_type: str, filters: dict[str, Any]) -> QueryPlan:
+        """Run a search and report how it was executed.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+
+        Returns:
+            Plan with the strategy chosen (index or scan), the indexes used,
+            rows examined and returned, and the execution time
+        """
+        _, plan = self._run_search(entity_type, filters, None, explain=True)
+        return plan  # type: ignore[return-value]
+
+    def _run_search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None, explain: bool = False
+    ) -> tuple[list[Any], QueryPlan | None]:
+        """Execute a search, logging it if it is slow.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+            explain: Always build the query plan
+
+        Returns:
+            Matching records and the plan (None unless explained or slow)
+        """
+        started = time.perf_counter()
+        results, strategy, unindexed, examined = self._execute_search(entity_type, filters, fields)
+        duration = time.perf_counter() - started
+        slow = self.slow_query_threshold is not None and duration >= self.slow_query_threshold
+        if not explain and not slow:
+            return results, None
+        indexes = tuple(field for field in filters if field not in unindexed)
+        plan = QueryPlan(entity_type, dict(filters), strategy, indexes, examined, len(results), duration)
+        if slow:
+            self._logger.warning(f"Slow query on {plan.describe()}")
+        return results, plan
+
+    def _execute_search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None
+    ) -> tuple[list[Any], str, Mapping[str, Any], int | None]:
+        """Execute a search and describe how it was done.
+
+        Subclasses that route ``search`` through ``_run_search`` override
+        this; the default runs ``search`` without reporting a plan.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            Matching records, strategy, the filters not answered by an index
+            and rows examined (None if unknown)
+        """
+        return self.search(entity_type, filters, fields), "unknown", filters, None
+
+    def retrieve_many(
+        self, entity_type: str, entity_ids: Iterable[str], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Retrieve several records by id in one call.
+
+        Costs one lookup per id, independent of the number of stored records.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: Entity identifiers
+            fields: Only return these fields of each record
+
+        Returns:
+            Records in the order of ``entity_ids``, skipping ids that do not exist
+        """
+        records = self._records(entity_type)
+        found = [record for record in map(records.get, entity_ids) if record is not None]
+        return self._project(found, fields)
+
+    def define_relationship(
+        self,
+        name: str,
+        source_type: str,
+        field: str,
+        target_type: str,
+        many: bool = False,
+        on_delete: str = "restrict",
+    ) -> Relationship:
+        """Declare that a field of one entity type references records of another.
+
+        Existing records are indexed immediately; later creates, updates and
+        deletes keep the forward and reverse adjacency current, so ``related``
+        costs O(k) for k related records in either direction. Deleting a
+        referenced record applies ``on_delete`` to the records referencing it.
+
+        Args:
+            name: Relationship name
+            source_type: Entity type holding the reference
+            field: Field holding the referenced id (a list of ids if ``many``)
+            target_type: Entity type referenced
+            many: Whether the field holds a list of ids
+            on_delete: 'restrict', 'cascade' or 'set_null'
+
+        Returns:
+            Declared relationship
+
+        Raises:
+            ValueError: If the name is taken or ``on_delete`` is unknown
+        """
+        if name in self._relationships:
+            msg = f"Relationship {name} is already defined"
+            raise ValueError(msg)
+        if on_delete not in ON_DELETE:
+            msg = f"Unknown on_delete {on_delete!r}, expected one of {', '.join(ON_DELETE)}"
+            raise ValueError(msg)
+        relationship = Relationship(name, source_type, field, target_type, many, on_delete)
+        index = RelationshipIndex(relationship)
+        for entity_id, record in self._records(source_type).items():
+            index.add(entity_id, record)
+        self._relationships[name] = index
+        self._outgoing.setdefault(source_type, []).append(index)
+        self._logger.info(f"Defined relationship {name}: {source_type}.{field} -> {target_type} ({on_delete})")
+        return relationship
+
+    def related(
+        self, name: str, entity_id: str, reverse: bool = False, fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Get the records related to a record through a relationship.
+
+        Args:
+            name: Relationship name
+            entity_id: Id of a source record (or of a target record if ``reverse``)
+            reverse: Return the source records referencing a target instead of
+                the target records a source references
+            fields: Only return these fields of each record
+
+        Returns:
+            Related records (references in field order, referencing records in
+            id order)
+
+        Raises:
+            ValueError: If the relationship is not defined
+        """
+        index = self._relationships.get(name)
+        if index is None:
+            msg = f"Relationship {name} is not defined"
+            raise ValueError(msg)
+        relationship = index.relationship
+        if reverse:
+            return self.retrieve_many(relationship.source_type, sorted(index.sources(entity_id)), fields)
+        return self.retrieve_many(relationship.target_type, index.targets(entity_id), fields)
+
+    def _plan_delete(
+        self, entity_type: str, entity_id: str
+    ) -> tuple[list[tuple[str, str]], list[tuple[Relationship, str, str]]] | None:
+        """Work out what deleting a record does to the records referencing it.
+
+        Follows cascading relationships transitively. A restricting reference
+        blocks the delete unless the referencing record is deleted as well.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Records to delete first (dependents before the records they
+            reference) and references to clear as (relationship, source id,
+            target id), or None if a restricting reference blocks the delete
+        """
+        deleting = {(entity_type, entity_id)}
+        pending = [(entity_type, entity_id)]
+        deletions: list[tuple[str, str]] = []
+        clears: list[tuple[Relationship, str, str]] = []
+        restricted: list[tuple[Relationship, str]] = []
+        while pending:
+            target_type, target_id = pending.pop()
+            for index in list(self._relationships.values()):
+                relationship = index.relationship
+                if relationship.target_type != target_type:
+                    continue
+                for source_id in sorted(index.sources(target_id)):
+                    if relationship.on_delete == "cascade":
+                        key = (relationship.source_type, source_id)
+                        if key not in deleting:
+                            deleting.add(key)
+                            deletions.append(key)
+                            pending.append(key)
+                    elif relationship.on_delete == "set_null":
+                        clears.append((relationship, source_id, target_id))
+                    else:
+                        restricted.append((relationship, source_id))
+
+        for relationship, source_id in restricted:
+            if (relationship.source_type, source_id) not in deleting:
+                self._logger.warning(
+                    f"Cannot delete {entity_type}/{entity_id}: referenced by "
+                    f"{relationship.source_type}/{source_id} through {relationship.name}"
+                )
+                return None
+        clears = [clear for clear in clears if (clear[0].source_type, clear[1]) not in deleting]
+        deletions.reverse()
+        return deletions, clears
+
+    def register_index(self, entity_type: str, field: str) -> None:
+        """Declare an equality index on a field of an entity type.
+
+        Existing records are indexed immediately; later creates, updates and
+        deletes keep the index current. ``count``, ``exists`` and ``search``
+        use the index for filters on the field.
+
+        Args:
+            entity_type: Type of entity
+            field: Field to index
+        """
+        index = FieldIndex(field)
+        for entity_id, record in self._records(entity_type).items():
+            index.add(entity_id, record)
+        self._field_indexes.setdefault(entity_type, {})[field] = index
+        self._logger.info(f"Registered index on {entity_type}.{field}, {len(index)} distinct values")
+
+    def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count the records matching filters without materializing them.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        if not filters:
+            return len(self._records(entity_type))
+        candidates, remaining = self._index_candidates(entity_type, filters)
+        if candidates is not None and not remaining:
+            return len(candidates)
+        return sum(1 for _ in self._matching(entity_type, filters, candidates, remaining))
+
+    def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record matches filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        if not filters:
+            return len(self._records(entity_type)) > 0
+        candidates, remaining = self._index_candidates(entity_type, filters)
+        if candidates is not None and not remaining:
+            return len(candidates) > 0
+        return next(self._matching(entity_type, filters, candidates, remaining), None) is not None
+
+    def _index_candidates(
+        self, entity_type: str, filters: Mapping[str, Any]
+    ) -> tuple[set[str] | None, dict[str, Any]]:
+        """Narrow a filter down to candidate ids using equality indexes.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match
+
+        Returns:
+            Ids matching every indexed filter (None if no filter is indexed;
+            may be a live posting set that must not be modified) and the
+            filters still to be checked against the records
+        """
+        indexes = self._field_indexes.get(entity_type, {})
+        postings = []
+        remaining = {}
+        for field, value in filters.items():
+            index = indexes.get(field)
+            matches = index.lookup(value) if index is not None else None
+            if matches is None:
+                remaining[field] = value
+            else:
+                postings.append(matches)
+        if not postings:
+            return None, remaining
+
+        if len(postings) == 1:
+            return postings[0], remaining  # type: ignore[return-value]
+
+        # Intersections run in C, so they see each posting set atomically
+        # even while a writer is changing it.
+        postings.sort(key=len)
+        candidates = postings[0] & postings[1]
+        for matches in postings[2:]:
+            candidates &= matches
+        return candidates, remaining
+
+    def _matching(
+        self,
+        entity_type: str,
+        filters: Mapping[str, Any],
+        candidates: set[str] | None = None,
+        remaining: Mapping[str, Any] | None = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Iterate over the records matching filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match
+            candidates: Ids to check instead of every record
+            remaining: Filters not yet satisfied by ``candidates``
+
+        Returns:
+            Iterator of matching records
+        """
+        records = self._records(entity_type)
+        if candidates is None:
+            checks = list(filters.items())
+            # Copying the values is atomic for dicts, so concurrent writers
+            # cannot invalidate the iteration.
+            source: Iterable[Any] = list(records.values())
+        else:
+            checks = list((remaining if remaining is not None else filters).items())
+            # ``list`` copies a (possibly live) posting set atomically
+            source = (record for record in map(records.get, list(candidates)) if record is not None)
+        for record in source:
+            for key, value in checks:
+                if record.get(key, MISSING) != value:
+                    break
+            else:
+                yield record
+
+    @staticmethod
+    def _project(records: Iterable[Mapping[str, Any]], fields: list[str] | None) -> list[Any]:
+        """Restrict records to a subset of their fields.
+
+        Args:
+            records: Records to project
+            fields: Fields to keep (None keeps the records as they are)
+
+        Returns:
+            Projected records
+        """
+        if fields is None:
+            return records if isinstance(records, list) else list(records)
+        return [
+            {field: value for field in fields if (value := record.get(field, MISSING)) is not MISSING}
+            for record in records
+        ]
+
+    def register_text_index(self, entity_type: str, fields: list[str]) -> None:
+        """Declare text fields of an entity type to be full-text indexed.
+
+        Existing records are indexed immediately; later creates, updates and
+        deletes keep the index current.
+
+        Args:
+            entity_type: Type of entity
+            fields: Names of the text fields to index
+        """
+        index = FullTextIndex(fields)
+        for entity_id, record in self._records(entity_type).items():
+            index.add(entity_id, record)
+        self._text_indexes[entity_type] = index
+        self._logger.info(f"Registered text index on {entity_type} ({', '.join(fields)}), {len(index)} records")
+
+    def text_search(self, entity_type: str, query: str) -> list[dict[str, Any]]:
+        """Search records of an entity type using its full-text index.
+
+        The query is a list of words combined with AND. Words ending in ``*``
+        match any token with that prefix and double-quoted text matches a
+        phrase, e.g. ``'failed "data source" conn*'``.
+
+        Args:
+            entity_type: Type of entity
+            query: Full-text query
+
+        Returns:
+            List of matching records
+        """
+        index = self._text_indexes.get(entity_type)
+        if index is None:
+            self._logger.warning(f"No text index registered for {entity_type}")
+            return []
+
+        records = self._records(entity_type)
+        matches = index.search(query, resolve=records.get)
+        return [record for record in map(records.get, matches) if record is not None]
+
+    def changes_since(self, sequence: int, entity_type: str | None = None) -> list[ChangeEvent] | None:
+        """Get the mutations applied after a change sequence number.
+
+        Readers keep the sequence of the last event they applied and call
+        this to receive only the delta instead of reloading every record.
+
+        Args:
+            sequence: Last sequence number the reader has applied (0 initially)
+            entity_type: Only return changes of this entity type
+
+        Returns:
+            Change events in order, or None if the feed no longer holds all of
+            them and the reader has to reload the full data set
+        """
+        return self._change_feed.changes_since(sequence, entity_type)
+
+    def latest_change_sequence(self) -> int:
+        """Get the sequence number of the most recent change.
+
+        Readers that load the full data set should record this before loading
+        and pass it to ``changes_since`` afterwards.
+
+        Returns:
+            Latest change sequence number
+        """
+        return self._change_feed.latest_sequence
+
+    def wait_for_changes(self, sequence: int, timeout: float | None = None) -> bool:
+        """Block until a change newer than a sequence number is made.
+
+        Args:
+            sequence: Last sequence number the reader has applied
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if newer changes are available
+        """
+        return self._change_feed.wait_for_changes(sequence, timeout)
+
+    def register_aggregation(self, name: str, entity_type: str, aggregation: Aggregation) -> None:
+        """Register an aggregation kept current by every mutation.
+
+        Args:
+            name: Unique name of the aggregate (e.g. 'projects_by_status')
+            entity_type: Type of entity to aggregate
+            aggregation: Aggregation instance (e.g. ``CountBy("status")``)
+        """
+        aggregation.reset()
+        for record in self._records(entity_type).values():
+            aggregation.add(record)
+        for aggregations in self._aggregations.values():
+            aggregations.pop(name, None)
+        self._aggregations.setdefault(entity_type, {})[name] = aggregation
+        self._logger.info(f"Registered aggregation {name} on {entity_type}")
+
+    def get_aggregates(self, names: list[str] | None = None) -> dict[str, Any]:
+        """Get the current values of registered aggregations.
+
+        Args:
+            names: Aggregates to return (None for all of them)
+
+        Returns:
+            Mapping of aggregate name to value
+        """
+        results = {
+            name: aggregation.result()
+            for aggregations in self._aggregations.values()
+            for name, aggregation in aggregations.items()
+        }
+        if names is None:
+            return results
+        return {name: results[name] for name in names if name in results}
+
+    def latest(self, entity_type: str, n: int) -> list[dict[str, Any]]:
+        """Get the most recently created records.
+
+        Only records whose ids come from ``utilities.ids.generate_id`` are
+        ordered; the order is maintained on every mutation, so no records
+        are scanned or sorted.
+
+        Args:
+            entity_type: Type of entity
+            n: Maximum number of records
+
+        Returns:
+            Up to ``n`` records, newest first
+        """
+        records = self._records(entity_type)
+        order = self._id_order.get(entity_type, [])
+        results: list[dict[str, Any]] = []
+        end = len(order)
+        while end > 0 and len(results) < n:
+            # Deleted ids are removed lazily, so read a little more than needed
+            start = max(0, end - 2 * (n - len(results)) - 16)
+            for entity_id in reversed(order[start:end]):
+                record = records.get(entity_id)
+                if record is not None:
+                    results.append(record)
+                    if len(results) == n:
+                        break
+            end = start
+        return results
+
+    def created_after(self, entity_type: str, timestamp: float, limit: int | None = None) -> list[dict[str, Any]]:
+        """Get records created after a point in time, oldest first.
+
+        Creation time is read from ``generate_id`` ids at millisecond
+        resolution; the start position is found by binary search.
+
+        Args:
+            entity_type: Type of entity
+            timestamp: Epoch seconds
+            limit: Maximum number of records
+
+        Returns:
+            Records created after ``timestamp``
+        """
+        records = self._records(entity_type)
+        order = self._id_order.get(entity_type, [])
+        results: list[dict[str, Any]] = []
+        for entity_id in order[bisect.bisect_left(order, min_id_after(timestamp)) :]:
+            record = records.get(entity_id)
+            if record is not None:
+                results.append(record)
+                if len(results) == limit:
+                    break
+        return results
+
+    def get_version(self, entity_type: str, entity_id: str) -> int | None:
+        """Get the current version of a record.
+
+        Every create, update and delete gives the record a new, larger
+        version, so the value can be used as an ETag and passed back as
+        ``expected_version`` to detect lost updates.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Record version, or None if the record does not exist
+        """
+        return self._versions.get(entity_type, {}).get(entity_id)
+
+    def _check_version(self, entity_type: str, entity_id: str, expected_version: int | None) -> bool:
+        """Check a conditional mutation against the current record version.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Version the caller based its change on (None
+                for unconditional mutations)
+
+        Returns:
+            True if the mutation may proceed
+        """
+        if expected_version is None:
+            return True
+        current = self.get_version(entity_type, entity_id)
+        if current != expected_version:
+            self._logger.warning(
+                f"Version conflict on {entity_type}/{entity_id}: expected {expected_version}, found {current}"
+            )
+            return False
+        return True
+
+    def _rebuild_derived(
+        self,
+        versions: Mapping[str, dict[str, int]] | None = None,
+        id_order: Mapping[str, list[str]] | None = None,
+        postings: Mapping[str, Mapping[str, Mapping[Any, Iterable[str]]]] | None = None,
+    ) -> None:
+        """Rebuild derived structures from the records currently stored.
+
+        Structures restored from a snapshot are installed as they are
+        instead of being recomputed from the records.
+
+        Args:
+            versions: Restored record versions per entity type
+            id_order: Restored time-ordered ids per entity type
+            postings: Restored equality index postings per entity type and field
+        """
+        versions = versions or {}
+        id_order = id_order or {}
+        postings = postings or {}
+        for entity_type, fields in postings.items():
+            for field in fields:
+                self._field_indexes.setdefault(entity_type, {}).setdefault(field, FieldIndex(field))
+        for entity_type, field_indexes in self._field_indexes.items():
+            for field, field_index in field_indexes.items():
+                restored = postings.get(entity_type, {}).get(field)
+                if restored is not None:
+                    field_index.load(restored)
+                    continue
+                field_index.clear()
+                for entity_id, record in self._records(entity_type).items():
+                    field_index.add(entity_id, record)
+        version = next(self._version_clock)
+        self._versions = {
+            entity_type: versions[entity_type]
+            if entity_type in versions
+            else dict.fromkeys(self._records(entity_type), version)
+            for entity_type in self._data_store
+        }
+        self._id_order = {
+            entity_type: id_order[entity_type]
+            if entity_type in id_order
+            else sorted(filter(is_time_ordered_id, self._records(entity_type)))
+            for entity_type in self._data_store
+        }
+        for entity_type, index in self._text_indexes.items():
+            index.clear()
+            for entity_id, record in self._records(entity_type).items():
+                index.add(entity_id, record)
+        for entity_type, relationship_indexes in self._outgoing.items():
+            for relationship_index in relationship_indexes:
+                relationship_index.clear()
+                for entity_id, record in self._records(entity_type).items():
+                    relationship_index.add(entity_id, record)
+        for entity_type, aggregations in self._aggregations.items():
+            for aggregation in aggregations.values():
+                aggregation.reset()
+                for record in self._records(entity_type).values():
+                    aggregation.add(record)
+
+    def _records(self, entity_type: str) -> Mapping[str, Any]:
+        """Get the records of an entity type keyed by entity id.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            Mapping of entity id to record
+        """
+        return self._data_store.get(entity_type, {})
+
+    def _on_created(self, entity_type: str, entity_id: str, record: Mapping[str, Any]) -> None:
+        """Update derived structures after a record was created.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            record: Stored record
+        """
+        self._versions.setdefault(entity_type, {})[entity_id] = next(self._version_clock)
+        if is_time_ordered_id(entity_id):
+            order = self._id_order.setdefault(entity_type, [])
+            if not order or entity_id > order[-1]:
+                order.append(entity_id)
+            else:
+                position = bisect.bisect_left(order, entity_id)
+                if position == len(order) or order[position] != entity_id:
+                    order.insert(position, entity_id)
+        for field_index in self._field_indexes.get(entity_type, {}).values():
+            field_index.add(entity_id, record)
+        index = self._text_indexes.get(entity_type)
+        if index is not None:
+            index.add(entity_id, record)
+        for relationship_index in self._outgoing.get(entity_type, ()):
+            relationship_index.add(entity_id, record)
+        for aggregation in self._aggregations.get(entity_type, {}).values():
+            aggregation.add(record)
+        self._change_feed.publish("create", entity_type, entity_id, record)
+
+    def _on_updated(
+        self, entity_type: str, entity_id: str, old_record: Mapping[str, Any], new_record: Mapping[str, Any]
+    ) -> None:
+        """Update derived structures after a record was updated.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            old_record: Record before the update
+            new_record: Record after the update
+        """
+        self._versions.setdefault(entity_type, {})[entity_id] = next(self._version_clock)
+        for field_index in self._field_indexes.get(entity_type, {}).values():
+            field_index.update(entity_id, old_record, new_record)
+        index = self._text_indexes.get(entity_type)
+        if index is not None:
+            index.update(entity_id, old_record, new_record)
+        for relationship_index in self._outgoing.get(entity_type, ()):
+            relationship_index.update(entity_id, new_record)
+        for aggregation in self._aggregations.get(entity_type, {}).values():
+            aggregation.replace(old_record, new_record)
+        self._change_feed.publish("update", entity_type, entity_id, new_record)
+
+    def _on_deleted(self, entity_type: str, entity_id: str, old_record: Mapping[str, Any]) -> None:
+        """Update derived structures after a record was deleted.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            old_record: Record that was removed
+        """
+        self._versions.get(entity_type, {}).pop(entity_id, None)
+        order = self._id_order.get(entity_type)
+        records = self._records(entity_type)
+        if order is not None and len(order) > 2 * len(records) + 64:
+            # Deleted ids stay in the order until it is mostly stale
+            self._id_order[entity_type] = [entity_id for entity_id in order if entity_id in records]
+        for field_index in self._field_indexes.get(entity_type, {}).values():
+            field_index.remove(entity_id, old_record)
+        index = self._text_indexes.get(entity_type)
+        if index is not None:
+            index.remove(entity_id, old_record)
+        for relationship_index in self._outgoing.get(entity_type, ()):
+            relationship_index.remove(entity_id)
+        for aggregation in self._aggregations.get(entity_type, {}).values():
+            aggregation.remove(old_record)
+        self._change_feed.publish("delete", entity_type, entity_id, None)
+
 
 class InMemoryDataManager(DataManager):
-    """In-memory implementation of DataManager for development and testing."""
+    """In-memory implementation of DataManager for development and testing.
+
+    Each entity type is a partition with its own writer lock. Stored records
+    are never modified in place: writers build a new record and swap it in
+    while holding the partition lock, so lock-free readers always observe a
+    complete version of every record and a consistent snapshot of the
+    partition.
+
+    When a write-ahead log is given, every mutation is logged before it is
+    applied, state is recovered from the log on ``initialize`` and compacted
+    snapshots are written in the background as the log grows.
+
+    High-volume entity types can be stored in a ``ColumnarTable`` instead of
+    one dictionary per record by declaring a column schema for them, and
+    append-mostly types such as logs in a ``TimePartitionedLogStore``.
+
+    Records of the core entity types are stored as slotted ``Record``
+    instances (see ``managers/records.py``) and returned as read-only
+    mappings; use ``records.to_dict`` where plain dictionaries are needed.
+    """
+
+    def __init__(
+        self,
+        wal: WriteAheadLog | None = None,
+        columnar_schemas: Mapping[str, Mapping[str, str]] | None = None,
+        time_partitioned: Mapping[str, Mapping[str, Any]] | None = None,
+        record_types: Mapping[str, type[Record]] | None = None,
+        slow_query_threshold: float | None = None,
+    ) -> None:
+        """Initialize the in-memory data manager.
+
+        Args:
+            wal: Optional write-ahead log making the store durable
+            columnar_schemas: Column schema per entity type to store columnar,
+                e.g. ``{"logs": {"level": "category", "message": "str"}}``
+            time_partitioned: ``TimePartitionedLogStore`` options per entity
+                type to store in time buckets, e.g. ``{"logs": {"segment_seconds": 3600}}``
+            record_types: Record class per entity type (defaults to the core
+                entity types; pass ``{}`` to store plain dictionaries)
+            slow_query_threshold: Log searches taking at least this many
+                seconds (None disables the slow-query log)
+        """
+        super().__init__()
+        self.slow_query_threshold = slow_query_threshold
+        self._partition_locks: dict[str, threading.Lock] = {}
+        self._wal = wal
+        self._columnar_schemas = dict(columnar_schemas or {})
+        self._time_partitioned = dict(time_partitioned or {})
+        self._record_types = dict(RECORD_TYPES if record_types is None else record_types)
 
     def initialize(self) -> None:
         """Initialize the in-memory data manager."""
-        self._logger.info("InMemoryDataManager initialized")
         self._data_store = {
             "projects": {},
             "data_sources": {},
             "logs": {},
             "users": {},
         }
+        for entity_type in itertools.chain(self._columnar_schemas, self._time_partitioned):
+            self._data_store[entity_type] = self._build_partition(entity_type, {})
+        if self._wal is not None:
+            for entity_type, records in self._wal.recover().items():
+                self._data_store[entity_type] = self._build_partition(entity_type, records)
+            self._wal.open()
+        self._rebuild_derived()
+        self._change_feed.clear()
+        self._logger.info("InMemoryDataManager initialized")
 
     def shutdown(self) -> None:
         """Shutdown the in-memory data manager."""
         self._logger.info("InMemoryDataManager shutting down")
+        if self._wal is not None:
+            self.compact()
+            self._wal.close()
         self._data_store.clear()
+        self._change_feed.clear()
+        self._rebuild_derived()
+
+    def compact(self) -> bool:
+        """Write a snapshot of all partitions and truncate the write-ahead log.
+
+        Returns:
+            True if a snapshot was written
+        """
+        if self._wal is None:
+            return False
+
+        sequence = self._wal.begin_snapshot()
+        if sequence is None:
+            return False
+
+        try:
+            state = {}
+            for entity_type in list(self._data_store):
+                # Writers log and apply under the partition lock, so holding it
+                # guarantees every mutation up to ``sequence`` is in the copy.
+                with self._partition_lock(entity_type):
+                    state[entity_type] = self._data_store[entity_type].copy()  # type: ignore[attr-defined]
+            self._wal.write_snapshot(state, sequence)
+            return True
+        except Exception:
+            self._logger.exception("Error writing data snapshot")
+            return False
+
+    def dump_snapshot(self, path: str | Path) -> bool:
+        """Write all partitions to a binary snapshot file.
+
+        Records are written with their versions, the time-ordered id order
+        and the equality index postings, so ``load_snapshot`` can restore
+        them without re-inserting records one by one. Each partition is
+        copied under its writer lock, so every partition is consistent on
+        its own.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            True if the snapshot was written
+        """
+        try:
+            partitions = {}
+            for entity_type in list(self._data_store):
+                with self._partition_lock(entity_type):
+                    records = self._data_store[entity_type].copy()  # type: ignore[attr-defined]
+                    versions = dict(self._versions.get(entity_type, {}))
+                    id_order = list(self._id_order.get(entity_type, []))
+                    postings = {
+                        field: index.postings() for field, index in self._field_indexes.get(entity_type, {}).items()
+                    }
+                # Ids of deleted records may linger in the id order until it is compacted
+                id_order = [entity_id for entity_id in id_order if entity_id in records]
+                partitions[entity_type] = PartitionSnapshot(records, versions, id_order, postings)
+            started = time.perf_counter()
+            size = write_snapshot(path, partitions)
+            self._logger.info(
+                f"Wrote {sum(len(p.records) for p in partitions.values())} records ({size} bytes) to {path} "
+                f"in {time.perf_counter() - started:.2f}s"
+            )
+            return True
+        except (OSError, ValueError):
+            self._logger.exception(f"Error writing data snapshot to {path}")
+            return False
+
+    def load_snapshot(self, path: str | Path) -> bool:
+        """Replace all data with the contents of a binary snapshot file.
+
+        Versions, the id order and equality indexes are restored from the
+        file; text indexes and aggregations are rebuilt from the records.
+        The change feed is cleared, so change feed readers reload. With a
+        write-ahead log, a log snapshot is written so the loaded data is
+        durable.
+
+        Args:
+            path: Snapshot file written by ``dump_snapshot``
+
+        Returns:
+            True if the snapshot was loaded
+        """
+        started = time.perf_counter()
+        try:
+            partitions = read_snapshot(path, self._record_types)
+        except (OSError, ValueError):
+            self._logger.exception(f"Error reading data snapshot from {path}")
+            return False
+
+        store: dict[str, MutableMapping[str, Any]] = {"projects": {}, "data_sources": {}, "logs": {}, "users": {}}
+        for entity_type in itertools.chain(self._columnar_schemas, self._time_partitioned):
+            store[entity_type] = self._build_partition(entity_type, {})
+        for entity_type, partition in partitions.items():
+            store[entity_type] = self._build_partition(entity_type, partition.records, converted=True)
+
+        self._replace_store(
+            store,
+            versions={entity_type: partition.versions for entity_type, partition in partitions.items()},
+            id_order={entity_type: partition.id_order for entity_type, partition in partitions.items()},
+            postings={entity_type: partition.postings for entity_type, partition in partitions.items()},
+        )
+        self.compact()
+        self._logger.info(
+            f"Loaded {sum(len(p.records) for p in partitions.values())} records from {path} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return True
+
+    def _replace_store(self, store: dict[str, MutableMapping[str, Any]], **restored: Any) -> None:
+        """Swap in a new set of partitions and rebuild what derives from them.
+
+        Every partition lock is held during the swap, so no writer observes
+        a mix of old and new partitions. The change feed is cleared, so
+        change feed readers reload.
+
+        Args:
+            store: Partitions keyed by entity type
+            **restored: Restored structures passed to ``_rebuild_derived``
+        """
+        locks = [self._partition_lock(entity_type) for entity_type in sorted(set(store) | set(self._data_store))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            self._data_store = store
+            self._rebuild_derived(**restored)
+            self._change_feed.clear()
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _build_partition(
+        self, entity_type: str, records: dict[str, Any], converted: bool = False
+    ) -> MutableMapping[str, Any]:
+        """Build the stored partition of an entity type from record data.
+
+        Args:
+            entity_type: Type of entity
+            records: Record data keyed by entity id (plain dictionaries are
+                stored as they are)
+            converted: Whether the records already have the entity type's
+                record class
+
+        Returns:
+            Partition in the storage layout of the entity type
+        """
+        record_type = self._record_types.get(entity_type)
+        if record_type is not None and not converted:
+            from_dict = record_type.from_dict
+            records = {entity_id: from_dict(record) for entity_id, record in records.items()}
+        partition: MutableMapping[str, Any]
+        if entity_type in self._columnar_schemas:
+            partition = ColumnarTable(self._columnar_schemas[entity_type])
+        elif entity_type in self._time_partitioned:
+            partition = TimePartitionedLogStore(**self._time_partitioned[entity_type])
+        else:
+            return records
+        partition.update(records)
+        return partition
+
+    def _log_mutation(self, op: str, entity_type: str, entity_id: str, record: Mapping[str, Any] | None) -> int:
+        """Append a mutation to the write-ahead log, if any.
+
+        Args:
+            op: Mutation type
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            record: Record after the mutation (None for deletes)
+
+        Returns:
+            Log sequence number, or 0 without a log
+        """
+        if self._wal is None:
+            return 0
+        return self._wal.append(op, entity_type, entity_id, record)
+
+    def _commit(self, sequence: int) -> None:
+        """Wait for a logged mutation to become durable.
+
+        Also starts a background snapshot when one is due.
+
+        Args:
+            sequence: Log sequence number of the mutation
+        """
+        if self._wal is None:
+            return
+        self._wal.sync(sequence)
+        if self._wal.snapshot_due:
+            threading.Thread(target=self.compact, name="data-compaction", daemon=True).start()
+
+    def _to_record(self, entity_type: str, data: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Convert record data to the stored representation of its entity type.
+
+        Args:
+            entity_type: Type of entity
+            data: Record data
+
+        Returns:
+            Typed record, or a dictionary for untyped entity types
+        """
+        record_type = self._record_types.get(entity_type)
+        if record_type is None:
+            return dict(data)
+        return record_type.from_dict(data)
+
+    def _partition_lock(self, entity_type: str) -> threading.Lock:
+        """Get the writer lock of an entity type partition.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            Lock serializing writers of the partition
+        """
+        lock = self._partition_locks.get(entity_type)
+        if lock is None:
+            lock = self._partition_locks.setdefault(entity_type, threading.Lock())
+        return lock
 
     def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
         """Create a new data record.
@@ -150,14 +1212,18 @@ class InMemoryDataManager(DataManager):
             True if successful
         """
         try:
-            if entity_type not in self._data_store:
-                self._data_store[entity_type] = {}
+            with self._partition_lock(entity_type):
+                partition = self._data_store.setdefault(entity_type, {})
 
-            if entity_id in self._data_store[entity_type]:
-                self._logger.warning(f"Entity {entity_type}/{entity_id} already exists")
-                return False
+                if entity_id in partition:
+                    self._logger.warning(f"Entity {entity_type}/{entity_id} already exists")
+                    return False
 
-            self._data_store[entity_type][entity_id] = data
+                record = self._to_record(entity_type, data)
+                sequence = self._log_mutation("create", entity_type, entity_id, record)
+                partition[entity_id] = record
+                self._on_created(entity_type, entity_id, record)
+            self._commit(sequence)
             self._logger.info(f"Created {entity_type}/{entity_id}")
             return True
         except Exception:
@@ -167,6 +1233,10 @@ class InMemoryDataManager(DataManager):
     def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
         """Retrieve a data record.
 
+        The stored record itself is returned; records of untyped entity
+        types are plain dictionaries, so use ``retrieve_view`` when the
+        caller must not be able to modify the store.
+
         Args:
             entity_type: Type of entity
             entity_id: Entity identifier
@@ -174,17 +1244,26 @@ class InMemoryDataManager(DataManager):
         Returns:
             Entity data or None
         """
-        if entity_type not in self._data_store:
+        partition = self._data_store.get(entity_type)
+        if partition is None:
             return None
-        return self._data_store[entity_type].get(entity_id)
+        return partition.get(entity_id)
 
-    def update(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+    def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
         """Update an existing data record.
 
+        The updated record replaces the stored one, so concurrent readers
+        see either the old or the new version but never a partial update.
+        The version check and the swap happen under the partition lock,
+        making a conditional update an atomic compare-and-swap.
+
         Args:
             entity_type: Type of entity
             entity_id: Entity identifier
             data: Updated data
+            expected_version: Only update if the record is still at this version
 
         Returns:
             True if successful
@@ -194,23 +1273,66 @@ class InMemoryDataManager(DataManager):
                 self._logger.warning(f"Entity type {entity_type} not found")
                 return False
 
-            if entity_id not in self._data_store[entity_type]:
-                self._logger.warning(f"Entity {entity_type}/{entity_id} not found")
-                return False
+            with self._partition_lock(entity_type):
+                partition = self._data_store[entity_type]
+                old_record = partition.get(entity_id)
+                if old_record is None:
+                    self._logger.warning(f"Entity {entity_type}/{entity_id} not found")
+                    return False
+                if not self._check_version(entity_type, entity_id, expected_version):
+                    return False
 
-            self._data_store[entity_type][entity_id].update(data)
+                new_record = self._to_record(entity_type, {**old_record, **data})
+                sequence = self._log_mutation("update", entity_type, entity_id, new_record)
+                partition[entity_id] = new_record
+                self._on_updated(entity_type, entity_id, old_record, new_record)
+            self._commit(sequence)
             self._logger.info(f"Updated {entity_type}/{entity_id}")
             return True
         except Exception:
             self._logger.exception(f"Error updating {entity_type}/{entity_id}")
             return False
 
-    def delete(self, entity_type: str, entity_id: str) -> bool:
-        """Delete a data record.
+    def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a data record and apply the relationships referencing it.
+
+        Records referencing it through a cascading relationship are deleted
+        first and set_null references are cleared; a restricting reference
+        refuses the delete. Each record is deleted atomically, but the
+        cascade as a whole is not atomic with respect to concurrent writers.
 
         Args:
             entity_type: Type of entity
             entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        if any(index.relationship.target_type == entity_type for index in list(self._relationships.values())):
+            if entity_id not in self._records(entity_type):
+                return False
+            if not self._check_version(entity_type, entity_id, expected_version):
+                return False
+            plan = self._plan_delete(entity_type, entity_id)
+            if plan is None:
+                return False
+            deletions, clears = plan
+            for relationship, source_id, target_id in clears:
+                source = self.retrieve(relationship.source_type, source_id)
+                if source is not None:
+                    self.update(relationship.source_type, source_id, relationship.cleared(source, target_id))
+            for dependent_type, dependent_id in deletions:
+                self._delete_record(dependent_type, dependent_id)
+        return self._delete_record(entity_type, entity_id, expected_version)
+
+    def _delete_record(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a single record without looking at relationships.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
 
         Returns:
             True if successful
@@ -219,51 +1341,201 @@ class InMemoryDataManager(DataManager):
             if entity_type not in self._data_store:
                 return False
 
-            if entity_id in self._data_store[entity_type]:
-                del self._data_store[entity_type][entity_id]
-                self._logger.info(f"Deleted {entity_type}/{entity_id}")
-                return True
-            else:
-                return False
+            with self._partition_lock(entity_type):
+                partition = self._data_store[entity_type]
+                if entity_id not in partition:
+                    return False
+                if not self._check_version(entity_type, entity_id, expected_version):
+                    return False
+                sequence = self._log_mutation("delete", entity_type, entity_id, None)
+                old_record = partition.pop(entity_id)
+                self._on_deleted(entity_type, entity_id, old_record)
+            self._commit(sequence)
+            self._logger.info(f"Deleted {entity_type}/{entity_id}")
+            return True
         except Exception:
             self._logger.exception(f"Error deleting {entity_type}/{entity_id}")
             return False
 
-    def list_all(self, entity_type: str) -> list[dict[str, Any]]:
+    def entity_types(self) -> list[str]:
+        """Get the entity types that have a partition.
+
+        Returns:
+            Entity type names
+        """
+        return list(self._data_store)
+
+    def snapshot(self, entity_type: str) -> dict[str, dict[str, Any]]:
+        """Take a point-in-time snapshot of an entity type partition.
+
+        The copy is taken atomically without blocking writers and is not
+        affected by later mutations.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            Mapping of entity id to record
+        """
+        partition = self._data_store.get(entity_type)
+        if partition is None:
+            return {}
+        return partition.copy()  # type: ignore[attr-defined]
+
+    def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
         """List all records of a given entity type.
 
         Args:
             entity_type: Type of entity
+            fields: Only return these fields of each record
 
         Returns:
             List of entity records
         """
-        if entity_type not in self._data_store:
+        partition = self._data_store.get(entity_type)
+        if partition is None:
             return []
-        return list(self._data_store[entity_type].values())
+        if isinstance(partition, (ColumnarTable, TimePartitionedLogStore)):
+            return self._project(partition.records(), fields)
+        return self._project(list(partition.values()), fields)
 
-    def search(self, entity_type: str, filters: dict[str, Any]) -> list[dict[str, Any]]:
+    def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
         """Search for records matching filters.
 
+        Filters on indexed fields (see ``register_index``) are answered from
+        the index and only the remaining filters are checked per record;
+        results found through an index are not in insertion order. Use
+        ``explain`` to see which plan a search gets; searches slower than
+        ``slow_query_threshold`` are logged with their plan.
+
         Args:
             entity_type: Type of entity
             filters: Search filters
+            fields: Only return these fields of each record
 
         Returns:
             List of matching records
         """
-        all_records = self.list_all(entity_type)
+        return self._run_search(entity_type, filters, fields)[0]
+
+    def _execute_search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None
+    ) -> tuple[list[Any], str, Mapping[str, Any], int | None]:
+        """Execute a search and describe how it was done.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            Matching records, strategy, the filters not answered by an index
+            and rows examined
+        """
         if not filters:
-            return all_records
+            results = self.list_all(entity_type, fields)
+            return results, "all", filters, len(results)
+
+        candidates, remaining = self._index_candidates(entity_type, filters)
+        if candidates is None:
+            partition = self._data_store.get(entity_type)
+            examined = len(partition) if partition is not None else 0
+            if isinstance(partition, ColumnarTable):
+                return self._project(partition.select(filters), fields), "columnar", filters, examined
+            if isinstance(partition, TimePartitionedLogStore):
+                return self._project(partition.select(filters), fields), "time_partitioned", filters, examined
+            return self._project(self._matching(entity_type, filters), fields), "scan", filters, examined
+
+        strategy = "index+filter" if remaining else "index"
+        results = self._project(self._matching(entity_type, filters, candidates, remaining), fields)
+        return results, strategy, remaining, len(candidates)
+
+    def range_query(
+        self,
+        entity_type: str,
+        start: Any,
+        end: Any,
+        filters: dict[str, Any] | None = None,
+        timestamp_field: str = "timestamp",
+    ) -> list[dict[str, Any]]:
+        """Find records with timestamps in ``[start, end)``.
+
+        Time-partitioned entity types only visit the segments overlapping the
+        window; other entity types are scanned.
+
+        Args:
+            entity_type: Type of entity
+            start: Window start (epoch seconds, datetime or ISO string)
+            end: Window end (epoch seconds, datetime or ISO string)
+            filters: Optional field values to match
+            timestamp_field: Timestamp field of scanned entity types
 
+        Returns:
+            Matching records
+        """
+        partition = self._data_store.get(entity_type)
+        if isinstance(partition, TimePartitionedLogStore):
+            return partition.range(start, end, filters)
+
+        start_epoch = to_epoch(start)
+        end_epoch = to_epoch(end)
+        if start_epoch is None or end_epoch is None:
+            return []
         results = []
-        for record in all_records:
-            match = True
-            for key, value in filters.items():
-                if key not in record or record[key] != value:
-                    match = False
-                    break
-            if match:
+        for record in self.search(entity_type, filters or {}):
+            timestamp = to_epoch(record.get(timestamp_field))
+            if timestamp is not None and start_epoch <= timestamp < end_epoch:
                 results.append(record)
-
         return results
+
+    def is_time_partitioned(self, entity_type: str) -> bool:
+        """Check whether an entity type is stored in time buckets.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            True if the entity type uses a ``TimePartitionedLogStore``
+        """
+        return isinstance(self._data_store.get(entity_type), TimePartitionedLogStore)
+
+    def drop_before(self, entity_type: str, cutoff: Any, timestamp_field: str = "timestamp") -> dict[str, Any]:
+        """Remove records with timestamps before a cutoff.
+
+        Time-partitioned entity types drop whole segments ending at or before
+        the cutoff; other entity types delete matching records one by one.
+
+        Args:
+            entity_type: Type of entity
+            cutoff: Epoch seconds, datetime or ISO string
+            timestamp_field: Timestamp field of scanned entity types
+
+        Returns:
+            Removed records keyed by entity id
+        """
+        partition = self._data_store.get(entity_type)
+        if partition is None:
+            return {}
+
+        if not isinstance(partition, TimePartitionedLogStore):
+            cutoff_epoch = to_epoch(cutoff)
+            if cutoff_epoch is None:
+                return {}
+            expired = {
+                entity_id: record
+                for entity_id, record in self.snapshot(entity_type).items()
+                if (timestamp := to_epoch(record.get(timestamp_field))) is not None and timestamp < cutoff_epoch
+            }
+            return {entity_id: record for entity_id, record in expired.items() if self.delete(entity_type, entity_id)}
+
+        sequence = 0
+        with self._partition_lock(entity_type):
+            dropped = partition.drop_before(cutoff)
+            for entity_id, record in dropped.items():
+                sequence = self._log_mutation("delete", entity_type, entity_id, None)
+                self._on_deleted(entity_type, entity_id, record)
+        self._commit(sequence)
+        self._logger.info(f"Dropped {len(dropped)} {entity_type} records before {cutoff}")
+        return dropped
@@ -0,0 +1,116 @@
+"""Equality index over a single record field."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+class FieldIndex:
+    """Map each value of a field to the ids of the records holding it.
+
+    Lookups are O(1) and return the posting set itself, so counting matches
+    never touches the records. Records without the field, or whose value is
+    unhashable, are not indexed; such values can never equal a hashable
+    filter value, so lookups stay exact.
+    """
+
+    def __init__(self, field: str) -> None:
+        """Initialize an empty index.
+
+        Args:
+            field: Record field to index
+        """
+        self.field = field
+        self._postings: dict[Any, set[str]] = {}
+
+    def add(self, entity_id: str, record: Mapping[str, Any]) -> None:
+        """Index a record.
+
+        Args:
+            entity_id: Entity identifier
+            record: Record data
+        """
+        if self.field not in record:
+            return
+        try:
+            self._postings.setdefault(record[self.field], set()).add(entity_id)
+        except TypeError:
+            pass
+
+    def remove(self, entity_id: str, record: Mapping[str, Any]) -> None:
+        """Remove a record from the index.
+
+        Args:
+            entity_id: Entity identifier
+            record: Record data as it was indexed
+        """
+        if self.field not in record:
+            return
+        value = record[self.field]
+        try:
+            postings = self._postings.get(value)
+        except TypeError:
+            return
+        if postings is not None:
+            postings.discard(entity_id)
+            if not postings:
+                del self._postings[value]
+
+    def update(self, entity_id: str, old_record: Mapping[str, Any], new_record: Mapping[str, Any]) -> None:
+        """Re-index a record whose field value may have changed.
+
+        Args:
+            entity_id: Entity identifier
+            old_record: Record before the update
+            new_record: Record after the update
+        """
+        if old_record.get(self.field) == new_record.get(self.field) and (self.field in old_record) == (
+            self.field in new_record
+        ):
+            return
+        self.remove(entity_id, old_record)
+        self.add(entity_id, new_record)
+
+    def lookup(self, value: Any) -> set[str] | frozenset[str] | None:
+        """Get the ids of the records whose field equals a value.
+
+        Args:
+            value: Field value
+
+        Returns:
+            Matching entity ids (do not modify), or None if the value is
+            unhashable and cannot be looked up
+        """
+        try:
+            return self._postings.get(value, _EMPTY)
+        except TypeError:
+            return None
+
+    def postings(self) -> dict[Any, list[str]]:
+        """Export the index contents.
+
+        Returns:
+            Mapping of field value to the ids holding it
+        """
+        return {value: list(ids) for value, ids in list(self._postings.items())}
+
+    def load(self, postings: Mapping[Any, Iterable[str]]) -> None:
+        """Replace the index contents with exported postings.
+
+        Args:
+            postings: Mapping of field value to the ids holding it
+        """
+        self._postings = {value: set(ids) for value, ids in postings.items()}
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._postings.clear()
+
+    def __len__(self) -> int:
+        """Get the number of distinct indexed values.
+
+        Returns:
+            Number of distinct values
+        """
+        return len(self._postings)
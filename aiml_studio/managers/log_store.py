@@ -0,0 +1,393 @@
+"""Time-partitioned storage engine for append-mostly log records."""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterator, Mapping, MutableMapping
+from datetime import datetime
+from typing import Any
+
+from aiml_studio.managers.columnar import ColumnarTable
+
+
+def to_epoch(value: Any) -> float | None:
+    """Convert a timestamp value to seconds since the epoch.
+
+    Args:
+        value: Epoch number, datetime or ISO 8601 string
+            (e.g. '2024-01-22 10:30:15')
+
+    Returns:
+        Epoch seconds, or None if the value is not a timestamp
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def infer_schema(records: list[Mapping[str, Any]]) -> dict[str, str]:
+    """Infer a columnar schema from sample records.
+
+    Args:
+        records: Records to inspect
+
+    Returns:
+        Mapping of field name to column type
+    """
+    kinds: dict[str, set[type]] = {}
+    distinct: dict[str, set[Any]] = {}
+    for record in records:
+        for field, value in record.items():
+            kinds.setdefault(field, set()).add(type(value))
+            if isinstance(value, str) and len(distinct.setdefault(field, set())) <= len(records) // 2:
+                distinct[field].add(value)
+
+    schema = {}
+    for field, types in kinds.items():
+        if types == {str}:
+            schema[field] = "category" if len(distinct[field]) <= len(records) // 2 else "str"
+        elif types == {int}:
+            schema[field] = "int"
+        elif types == {float}:
+            schema[field] = "float"
+        elif types == {bool}:
+            schema[field] = "bool"
+        else:
+            schema[field] = "object"
+    return schema
+
+
+class _Segment:
+    """Records whose timestamps fall into one time bucket."""
+
+    __slots__ = ("records", "sealed", "start")
+
+    def __init__(self, start: float) -> None:
+        """Initialize an open segment.
+
+        Args:
+            start: Bucket start in epoch seconds
+        """
+        self.start = start
+        self.records: MutableMapping[str, Any] = {}
+        self.sealed = False
+
+
+class TimePartitionedLogStore(MutableMapping):
+    """Log records partitioned into fixed-size time buckets.
+
+    Records are placed in the segment covering their timestamp field
+    (records without a parsable timestamp use their arrival time). Only the
+    newest ``open_segments`` segments stay as dictionaries; older ones are
+    sealed into compact columnar form. Range queries only visit segments
+    overlapping the requested window, and retention drops whole segments.
+
+    The store behaves like a ``dict`` of entity id to record, iterating in
+    time order. All access is serialized by an internal lock.
+    """
+
+    def __init__(
+        self,
+        timestamp_field: str = "timestamp",
+        segment_seconds: int = 3600,
+        open_segments: int = 2,
+        schema: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            timestamp_field: Record field holding the timestamp
+            segment_seconds: Width of each time bucket in seconds
+            open_segments: Number of newest segments kept unsealed
+            schema: Column schema for sealed segments (inferred if None)
+        """
+        self._timestamp_field = timestamp_field
+        self._segment_seconds = segment_seconds
+        self._open_segments = open_segments
+        self._schema = dict(schema) if schema is not None else None
+        self._segments: dict[float, _Segment] = {}
+        self._starts: list[float] = []
+        self._segment_of: dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def timestamp_field(self) -> str:
+        """Get the field holding record timestamps.
+
+        Returns:
+            Timestamp field name
+        """
+        return self._timestamp_field
+
+    def _bucket(self, record: Mapping[str, Any]) -> float:
+        """Get the bucket start for a record.
+
+        Args:
+            record: Record data
+
+        Returns:
+            Bucket start in epoch seconds
+        """
+        timestamp = to_epoch(record.get(self._timestamp_field))
+        if timestamp is None:
+            timestamp = time.time()
+        return timestamp - timestamp % self._segment_seconds
+
+    def _segment(self, start: float) -> _Segment:
+        """Get or create the segment of a bucket, sealing older segments.
+
+        Args:
+            start: Bucket start
+
+        Returns:
+            Segment for the bucket
+        """
+        segment = self._segments.get(start)
+        if segment is None:
+            segment = self._segments[start] = _Segment(start)
+            bisect.insort(self._starts, start)
+            self.seal_before(self._starts[-1] - (self._open_segments - 1) * self._segment_seconds)
+        return segment
+
+    def seal_before(self, cutoff: float) -> int:
+        """Seal every open segment that ends at or before a cutoff.
+
+        Args:
+            cutoff: Epoch seconds
+
+        Returns:
+            Number of segments sealed
+        """
+        sealed = 0
+        with self._lock:
+            for start in self._starts[: bisect.bisect_right(self._starts, cutoff - self._segment_seconds)]:
+                segment = self._segments[start]
+                if segment.sealed or not segment.records:
+                    continue
+                records = list(segment.records.values())
+                table = ColumnarTable(self._schema or infer_schema(records))
+                table.update(segment.records)
+                segment.records = table
+                segment.sealed = True
+                sealed += 1
+        return sealed
+
+    def __getitem__(self, entity_id: str) -> Any:
+        """Get a record.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            Record data
+        """
+        with self._lock:
+            return self._segments[self._segment_of[entity_id]].records[entity_id]
+
+    def __setitem__(self, entity_id: str, record: Mapping[str, Any]) -> None:
+        """Insert or replace a record, moving it if its timestamp changed.
+
+        Args:
+            entity_id: Entity identifier
+            record: Record data
+        """
+        with self._lock:
+            start = self._bucket(record)
+            previous = self._segment_of.get(entity_id)
+            if previous is not None and previous != start:
+                del self._segments[previous].records[entity_id]
+            self._segment(start).records[entity_id] = record
+            self._segment_of[entity_id] = start
+
+    def __delitem__(self, entity_id: str) -> None:
+        """Delete a record.
+
+        Args:
+            entity_id: Entity identifier
+        """
+        with self._lock:
+            start = self._segment_of.pop(entity_id)
+            del self._segments[start].records[entity_id]
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Check whether a record exists.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            True if the record exists
+        """
+        return entity_id in self._segment_of
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over a snapshot of the entity ids in time order.
+
+        Returns:
+            Iterator of entity ids
+        """
+        with self._lock:
+            return iter([entity_id for start in self._starts for entity_id in self._segments[start].records])
+
+    def __len__(self) -> int:
+        """Get the number of records.
+
+        Returns:
+            Number of records
+        """
+        return len(self._segment_of)
+
+    def copy(self) -> dict[str, Any]:
+        """Materialize all records.
+
+        Returns:
+            Mapping of entity id to record
+        """
+        with self._lock:
+            return {
+                entity_id: record
+                for start in self._starts
+                for entity_id, record in self._segments[start].records.items()
+            }
+
+    def records(self) -> list[Any]:
+        """Get all records in time order.
+
+        Returns:
+            List of records
+        """
+        with self._lock:
+            return [record for start in self._starts for record in self._segment_records(start)]
+
+    def select(self, filters: Mapping[str, Any]) -> list[Any]:
+        """Find records whose fields equal the filter values.
+
+        Args:
+            filters: Field values to match
+
+        Returns:
+            Matching records in time order
+        """
+        with self._lock:
+            return [record for start in self._starts for record in self._segment_select(start, filters)]
+
+    def segments(self) -> list[dict[str, Any]]:
+        """Describe the segments of the store.
+
+        Returns:
+            List of segment summaries (start, end, records, sealed)
+        """
+        with self._lock:
+            return [
+                {
+                    "start": start,
+                    "end": start + self._segment_seconds,
+                    "records": len(self._segments[start].records),
+                    "sealed": self._segments[start].sealed,
+                }
+                for start in self._starts
+            ]
+
+    def range(self, start: Any, end: Any, filters: Mapping[str, Any] | None = None) -> list[Any]:
+        """Find records with timestamps in ``[start, end)``.
+
+        Only segments overlapping the window are visited; records of
+        segments fully inside the window are taken without checking their
+        timestamps.
+
+        Args:
+            start: Window start (epoch seconds, datetime or ISO string)
+            end: Window end (epoch seconds, datetime or ISO string)
+            filters: Optional field values to match
+
+        Returns:
+            Matching records in time order
+        """
+        start_epoch = to_epoch(start)
+        end_epoch = to_epoch(end)
+        if start_epoch is None or end_epoch is None:
+            return []
+
+        results = []
+        with self._lock:
+            first = bisect.bisect_right(self._starts, start_epoch - self._segment_seconds)
+            last = bisect.bisect_left(self._starts, end_epoch)
+            for bucket in self._starts[first:last]:
+                records = self._segment_select(bucket, filters) if filters else self._segment_records(bucket)
+                if start_epoch <= bucket and bucket + self._segment_seconds <= end_epoch:
+                    results.extend(records)
+                    continue
+                for record in records:
+                    timestamp = to_epoch(record.get(self._timestamp_field))
+                    if timestamp is not None and start_epoch <= timestamp < end_epoch:
+                        results.append(record)
+        return results
+
+    def drop_before(self, cutoff: Any) -> dict[str, Any]:
+        """Drop every segment that ends at or before a cutoff.
+
+        Args:
+            cutoff: Epoch seconds, datetime or ISO string
+
+        Returns:
+            Dropped records keyed by entity id
+        """
+        cutoff_epoch = to_epoch(cutoff)
+        if cutoff_epoch is None:
+            return {}
+
+        dropped: dict[str, Any] = {}
+        with self._lock:
+            count = bisect.bisect_right(self._starts, cutoff_epoch - self._segment_seconds)
+            for start in self._starts[:count]:
+                segment = self._segments.pop(start)
+                records = segment.records.copy()  # type: ignore[attr-defined]
+                for entity_id in records:
+                    del self._segment_of[entity_id]
+                dropped.update(records)
+            del self._starts[:count]
+        return dropped
+
+    def _segment_records(self, start: float) -> list[Any]:
+        """Get the records of a segment.
+
+        Args:
+            start: Bucket start
+
+        Returns:
+            List of records
+        """
+        records = self._segments[start].records
+        if isinstance(records, ColumnarTable):
+            return records.records()
+        return list(records.values())
+
+    def _segment_select(self, start: float, filters: Mapping[str, Any] | None) -> list[Any]:
+        """Get the records of a segment matching equality filters.
+
+        Args:
+            start: Bucket start
+            filters: Field values to match
+
+        Returns:
+            List of matching records
+        """
+        records = self._segments[start].records
+        if not filters:
+            return self._segment_records(start)
+        if isinstance(records, ColumnarTable):
+            return records.select(filters)
+        return [
+            record
+            for record in records.values()
+            if all(field in record and record[field] == value for field, value in filters.items())
+        ]
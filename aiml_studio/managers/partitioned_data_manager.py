@@ -0,0 +1,409 @@
+"""DataManager hash-partitioning records across worker processes."""
+
+import logging
+import multiprocessing
+import os
+import threading
+import zlib
+from collections.abc import Iterable, Mapping
+from multiprocessing.connection import Connection
+from typing import Any
+
+from aiml_studio.managers.data_manager import DataManager, InMemoryDataManager
+
+
+def _serve(connection: Connection, options: Mapping[str, Any]) -> None:
+    """Run one partition: apply the requests received on a pipe to a local store.
+
+    A request is a method name with its arguments, or ``("_batch", calls)``
+    to apply several calls in one round trip. A None method shuts the
+    partition down.
+
+    Args:
+        connection: Worker end of the pipe
+        options: ``InMemoryDataManager`` keyword arguments
+    """
+    manager = InMemoryDataManager(**options)
+    manager.initialize()
+    # Per-record info logging would dominate the cost of a write in the workers
+    manager._logger.setLevel(logging.WARNING)
+    connection.send((True, None))
+    while True:
+        try:
+            method, args = connection.recv()
+        except EOFError:
+            break
+        if method is None:
+            manager.shutdown()
+            connection.send((True, None))
+            break
+        try:
+            if method == "_batch":
+                result: Any = [getattr(manager, name)(*call_args) for name, call_args in args]
+            else:
+                result = getattr(manager, method)(*args)
+            connection.send((True, result))
+        except Exception as e:
+            connection.send((False, e))
+    connection.close()
+
+
+class PartitionedDataManager(DataManager):
+    """DataManager sharding records across local worker processes.
+
+    Each worker process holds an ``InMemoryDataManager`` for the records
+    whose id hashes (CRC-32) to it, so writes to different partitions run in
+    parallel instead of contending for one interpreter lock. Single-record
+    operations go straight to the owning worker over its pipe; ``search``,
+    ``list_all``, ``count`` and ``exists`` are sent to every worker at once
+    and the answers merged. Batch calls (``create_many``, ``retrieve_many``)
+    cost one round trip per partition.
+
+    Every call pays a pipe round trip and pickling of its records, so a
+    partitioned store only outperforms ``InMemoryDataManager`` with several
+    cores and concurrent writers or batches. Records come back in partition
+    order, not insertion order. Relationships, registered aggregations, the
+    change feed and time-ordered queries are not maintained across
+    partitions. Workers are started with ``spawn``, so scripts creating
+    one must guard their entry point with ``if __name__ == "__main__"``.
+    """
+
+    def __init__(self, partitions: int | None = None, **options: Any) -> None:
+        """Initialize the partitioned data manager.
+
+        Args:
+            partitions: Number of worker processes (defaults to the CPU count)
+            **options: ``InMemoryDataManager`` keyword arguments for every
+                partition (must be picklable, so no write-ahead log)
+
+        Raises:
+            ValueError: If ``partitions`` is less than 1
+        """
+        super().__init__()
+        if partitions is None:
+            partitions = os.cpu_count() or 1
+        if partitions < 1:
+            msg = f"Number of partitions must be positive, got {partitions}"
+            raise ValueError(msg)
+        self.partitions = partitions
+        self._options = options
+        # Spawned workers do not inherit the locks and threads of this process
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._connections: list[Connection] = []
+        # One request in flight per pipe
+        self._locks = [threading.Lock() for _ in range(partitions)]
+
+    def initialize(self) -> None:
+        """Start the worker processes and wait until they are ready."""
+        if self._processes:
+            return
+        for number in range(self.partitions):
+            connection, worker_connection = self._context.Pipe()
+            process = self._context.Process(
+                target=_serve,
+                args=(worker_connection, self._options),
+                name=f"data-partition-{number}",
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._processes.append(process)
+            self._connections.append(connection)
+        for connection in self._connections:
+            connection.recv()
+        self._logger.info(f"PartitionedDataManager initialized ({self.partitions} partitions)")
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._logger.info("PartitionedDataManager shutting down")
+        for number, connection in enumerate(self._connections):
+            with self._locks[number]:
+                try:
+                    connection.send((None, ()))
+                    connection.recv()
+                except (EOFError, OSError):
+                    self._logger.warning(f"Partition {number} exited before shutdown")
+                connection.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes.clear()
+        self._connections.clear()
+
+    def partition_of(self, entity_id: str) -> int:
+        """Get the partition owning an entity id.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            Partition number
+        """
+        return zlib.crc32(entity_id.encode()) % self.partitions
+
+    def _call(self, partition: int, method: str, *args: Any) -> Any:
+        """Run a method on one partition.
+
+        Args:
+            partition: Partition number
+            method: ``InMemoryDataManager`` method name
+            *args: Positional arguments
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: The exception raised by the worker
+        """
+        with self._locks[partition]:
+            connection = self._connections[partition]
+            connection.send((method, args))
+            ok, result = connection.recv()
+        if not ok:
+            raise result
+        return result
+
+    def _gather(self, requests: Mapping[int, tuple[str, tuple[Any, ...]]]) -> dict[int, Any]:
+        """Run requests on several partitions in parallel.
+
+        Every request is sent before any answer is read, so the workers
+        execute them concurrently.
+
+        Args:
+            requests: Method name and arguments per partition number
+
+        Returns:
+            Result per partition number
+
+        Raises:
+            Exception: The first exception raised by a worker
+        """
+        partitions = sorted(requests)
+        for partition in partitions:
+            self._locks[partition].acquire()
+        try:
+            for partition in partitions:
+                self._connections[partition].send(requests[partition])
+            answers = {partition: self._connections[partition].recv() for partition in partitions}
+        finally:
+            for partition in reversed(partitions):
+                self._locks[partition].release()
+        for ok, result in answers.values():
+            if not ok:
+                raise result
+        return {partition: result for partition, (_, result) in answers.items()}
+
+    def _scatter(self, method: str, *args: Any) -> list[Any]:
+        """Run the same method on every partition in parallel.
+
+        Args:
+            method: ``InMemoryDataManager`` method name
+            *args: Positional arguments
+
+        Returns:
+            Results in partition order
+        """
+        results = self._gather(dict.fromkeys(range(self.partitions), (method, args)))
+        return [results[partition] for partition in range(self.partitions)]
+
+    def _batches(self, method: str, calls: Iterable[tuple[str, tuple[Any, ...]]]) -> list[Any]:
+        """Run single-record calls in one batch per partition.
+
+        Args:
+            method: ``InMemoryDataManager`` method name
+            calls: Entity id and arguments of each call
+
+        Returns:
+            Results in the order of ``calls``
+        """
+        calls = list(calls)
+        batches: dict[int, list[tuple[str, tuple[Any, ...]]]] = {}
+        positions: dict[int, list[int]] = {}
+        for position, (entity_id, args) in enumerate(calls):
+            partition = self.partition_of(entity_id)
+            batches.setdefault(partition, []).append((method, args))
+            positions.setdefault(partition, []).append(position)
+        results: list[Any] = [None] * len(calls)
+        answers = self._gather({partition: ("_batch", tuple(batch)) for partition, batch in batches.items()})
+        for partition, answer in answers.items():
+            for position, result in zip(positions[partition], answer, strict=True):
+                results[position] = result
+        return results
+
+    def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Create a new data record on its partition.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Unique identifier
+            data: Data to store
+
+        Returns:
+            True if successful
+        """
+        return self._call(self.partition_of(entity_id), "create", entity_type, entity_id, data)
+
+    def create_many(self, entity_type: str, records: Mapping[str, dict[str, Any]]) -> int:
+        """Create several records with one round trip per partition.
+
+        Args:
+            entity_type: Type of entity
+            records: Data to store keyed by entity id
+
+        Returns:
+            Number of records created
+        """
+        calls = [(entity_id, (entity_type, entity_id, data)) for entity_id, data in records.items()]
+        return sum(self._batches("create", calls))
+
+    def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a data record from its partition.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Entity data or None
+        """
+        return self._call(self.partition_of(entity_id), "retrieve", entity_type, entity_id)
+
+    def retrieve_many(
+        self, entity_type: str, entity_ids: Iterable[str], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Retrieve several records with one round trip per partition.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: Entity identifiers
+            fields: Only return these fields of each record
+
+        Returns:
+            Records in the order of ``entity_ids``, skipping ids that do not exist
+        """
+        records = self._batches("retrieve", [(entity_id, (entity_type, entity_id)) for entity_id in entity_ids])
+        return self._project([record for record in records if record is not None], fields)
+
+    def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Update an existing data record on its partition.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Only update if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        return self._call(self.partition_of(entity_id), "update", entity_type, entity_id, data, expected_version)
+
+    def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Delete a data record from its partition.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Only delete if the record is still at this version
+
+        Returns:
+            True if successful
+        """
+        return self._call(self.partition_of(entity_id), "delete", entity_type, entity_id, expected_version)
+
+    def get_version(self, entity_type: str, entity_id: str) -> int | None:
+        """Get the version of a record from its partition.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Record version, or None if the record does not exist
+        """
+        return self._call(self.partition_of(entity_id), "get_version", entity_type, entity_id)
+
+    def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List the records of every partition.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record
+
+        Returns:
+            List of entity records, partition by partition
+        """
+        return [record for records in self._scatter("list_all", entity_type, fields) for record in records]
+
+    def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search every partition in parallel.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records, partition by partition
+        """
+        return [record for records in self._scatter("search", entity_type, filters, fields) for record in records]
+
+    def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count matching records across partitions.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        return sum(self._scatter("count", entity_type, filters))
+
+    def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any partition holds a matching record.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        return any(self._scatter("exists", entity_type, filters))
+
+    def register_index(self, entity_type: str, field: str) -> None:
+        """Declare an equality index on every partition.
+
+        Args:
+            entity_type: Type of entity
+            field: Field to index
+        """
+        self._scatter("register_index", entity_type, field)
+
+    def register_text_index(self, entity_type: str, fields: list[str]) -> None:
+        """Declare full-text indexed fields on every partition.
+
+        Args:
+            entity_type: Type of entity
+            fields: Names of the text fields to index
+        """
+        self._scatter("register_text_index", entity_type, fields)
+
+    def text_search(self, entity_type: str, query: str) -> list[dict[str, Any]]:
+        """Run a full-text search on every partition in parallel.
+
+        Args:
+            entity_type: Type of entity
+            query: Full-text query
+
+        Returns:
+            List of matching records, partition by partition
+        """
+        return [record for records in self._scatter("text_search", entity_type, query) for record in records]
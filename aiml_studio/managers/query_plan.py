@@ -0,0 +1,60 @@
+"""Execution plans reported for DataManager searches."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+# How a search found its results
+STRATEGIES = (
+    "all",  # no filters: every record is returned
+    "index",  # every filter answered by equality indexes
+    "index+filter",  # index candidates checked against the remaining filters
+    "columnar",  # column scan of a ColumnarTable
+    "time_partitioned",  # scan of every segment of a TimePartitionedLogStore
+    "scan",  # every record checked against the filters
+    "unknown",  # the data manager does not report plans
+)
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """How a search was executed and what it cost.
+
+    Attributes:
+        entity_type: Type of entity searched
+        filters: Search filters
+        strategy: One of ``STRATEGIES``
+        indexes: Fields whose equality indexes were used
+        rows_examined: Records (or index entries) looked at, None if unknown
+        rows_returned: Records returned
+        duration: Execution time in seconds
+    """
+
+    entity_type: str
+    filters: dict[str, Any]
+    strategy: str
+    indexes: tuple[str, ...] = field(default_factory=tuple)
+    rows_examined: int | None = None
+    rows_returned: int = 0
+    duration: float = 0.0
+
+    @property
+    def full_scan(self) -> bool:
+        """Check whether the search had to look at every record.
+
+        Returns:
+            True for scan strategies
+        """
+        return self.strategy in ("scan", "columnar", "time_partitioned")
+
+    def describe(self) -> str:
+        """Summarize the plan in one line for logs.
+
+        Returns:
+            Plan summary
+        """
+        via = f" via {', '.join(self.indexes)}" if self.indexes else ""
+        examined = "?" if self.rows_examined is None else self.rows_examined
+        return (
+            f"{self.entity_type} {self.filters!r}: {self.strategy}{via}, examined {examined}, "
+            f"returned {self.rows_returned} in {self.duration * 1000:.1f} ms"
+        )
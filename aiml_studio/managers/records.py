@@ -0,0 +1,299 @@
+"""Typed, slotted records for the core entity types."""
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any, ClassVar, overload
+
+
+class _Missing:
+    """Marker for record fields that were never set."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Get the marker representation.
+
+        Returns:
+            Marker name
+        """
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+class Record(Mapping):
+    """Base class for immutable records with a fixed set of fields.
+
+    Subclasses are frozen dataclasses with ``slots=True``, so a record costs
+    one pointer per field instead of a hash table. Records still behave as
+    read-only mappings: fields that were never set are absent, and keys
+    outside the schema are kept in ``extra``. Convert with ``to_dict`` at
+    boundaries that need plain dictionaries (Dash components, JSON).
+    """
+
+    __slots__ = ()
+
+    _field_names: ClassVar[tuple[str, ...]] = ()
+    _field_set: ClassVar[frozenset[str]] = frozenset()
+
+    extra: Mapping[str, Any] | None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Reset the cached field names of a subclass.
+
+        Args:
+            **kwargs: Subclass keyword arguments
+        """
+        super().__init_subclass__(**kwargs)
+        cls._field_names = ()
+        cls._field_set = frozenset()
+
+    @classmethod
+    def field_names(cls) -> tuple[str, ...]:
+        """Get the schema fields of the record type.
+
+        Returns:
+            Field names in declaration order (without ``extra``)
+        """
+        if not cls._field_names:
+            cls._field_names = tuple(f.name for f in fields(cls) if f.name != "extra")  # type: ignore[arg-type]
+            cls._field_set = frozenset(cls._field_names)
+        return cls._field_names
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Record":
+        """Build a record from a mapping.
+
+        Args:
+            data: Record data; keys outside the schema go to ``extra``
+
+        Returns:
+            Typed record
+        """
+        names = cls._field_set or frozenset(cls.field_names())
+        if names.issuperset(data):
+            return cls(**data)
+        known = {key: value for key, value in data.items() if key in names}
+        extra = {key: value for key, value in data.items() if key not in names}
+        return cls(**known, extra=extra)  # type: ignore[call-arg]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record to a plain dictionary.
+
+        Returns:
+            Record data
+        """
+        data = {name: value for name in self.field_names() if (value := getattr(self, name)) is not MISSING}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field value.
+
+        Args:
+            key: Field name
+            default: Value returned if the field is not set
+
+        Returns:
+            Field value or default
+        """
+        if key in self._field_set:
+            value = getattr(self, key)
+            return default if value is MISSING else value
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a field value.
+
+        Args:
+            key: Field name
+
+        Returns:
+            Field value
+        """
+        if key in self._field_set:
+            value = getattr(self, key)
+            if value is not MISSING:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a field is set.
+
+        Args:
+            key: Field name
+
+        Returns:
+            True if the field is set
+        """
+        return self.get(key, MISSING) is not MISSING  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the set fields.
+
+        Returns:
+            Iterator of field names
+        """
+        for name in self.field_names():
+            if getattr(self, name) is not MISSING:
+                yield name
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        """Get the number of set fields.
+
+        Returns:
+            Number of fields
+        """
+        count = sum(1 for name in self.field_names() if getattr(self, name) is not MISSING)
+        return count + (len(self.extra) if self.extra else 0)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ProjectRecord(Record):
+    """A machine learning project."""
+
+    name: Any = MISSING
+    status: Any = MISSING
+    description: Any = MISSING
+    created: Any = MISSING
+    modified: Any = MISSING
+    extra: Mapping[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DataSourceRecord(Record):
+    """A configured data source connection."""
+
+    name: Any = MISSING
+    type: Any = MISSING
+    status: Any = MISSING
+    connection: Any = MISSING
+    extra: Mapping[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LogRecord(Record):
+    """An application log entry."""
+
+    timestamp: Any = MISSING
+    level: Any = MISSING
+    message: Any = MISSING
+    extra: Mapping[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class UserRecord(Record):
+    """An application user."""
+
+    name: Any = MISSING
+    email: Any = MISSING
+    role: Any = MISSING
+    extra: Mapping[str, Any] | None = None
+
+
+RECORD_TYPES: dict[str, type[Record]] = {
+    "projects": ProjectRecord,
+    "data_sources": DataSourceRecord,
+    "logs": LogRecord,
+    "users": UserRecord,
+}
+
+for _record_type in RECORD_TYPES.values():
+    _record_type.field_names()
+
+
+def to_dict(record: Mapping[str, Any] | None) -> dict[str, Any] | None:
+    """Convert a stored record to a plain dictionary.
+
+    Args:
+        record: Typed record, dictionary or None
+
+    Returns:
+        Record data, or None
+    """
+    if record is None:
+        return None
+    if isinstance(record, Record):
+        return record.to_dict()
+    return dict(record)
+
+
+def read_only(record: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Get a read-only view of a stored record without copying it.
+
+    Typed records are immutable already and are returned as they are;
+    dictionaries are wrapped in a ``MappingProxyType``. The view is shallow:
+    nested containers are shared with the store and must not be modified.
+
+    Args:
+        record: Typed record or dictionary
+
+    Returns:
+        Read-only mapping sharing the record's storage
+    """
+    if isinstance(record, Record):
+        return record
+    return MappingProxyType(record)  # type: ignore[arg-type]
+
+
+class RecordViews(Sequence):
+    """Lazy, read-only sequence of record views.
+
+    Holds references to the records of a query result and wraps each one
+    with ``read_only`` only when it is accessed, so building the sequence
+    never copies record data.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Sequence[Mapping[str, Any]]) -> None:
+        """Initialize the sequence.
+
+        Args:
+            records: Records to expose (the sequence is not copied)
+        """
+        self._records = records
+
+    @overload
+    def __getitem__(self, index: int) -> Mapping[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordViews": ...
+
+    def __getitem__(self, index: int | slice) -> "Mapping[str, Any] | RecordViews":
+        """Get a record view, or a lazy sequence of views for a slice.
+
+        Args:
+            index: Position or slice
+
+        Returns:
+            Read-only record or sequence of read-only records
+        """
+        if isinstance(index, slice):
+            return RecordViews(self._records[index])
+        return read_only(self._records[index])
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        """Iterate over the record views.
+
+        Returns:
+            Iterator of read-only records
+        """
+        return map(read_only, self._records)
+
+    def __len__(self) -> int:
+        """Get the number of records.
+
+        Returns:
+            Number of records
+        """
+        return len(self._records)
@@ -0,0 +1,160 @@
+"""Relationships between entity types with forward and reverse adjacency indexes."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# What deleting a referenced record does to the records referencing it
+ON_DELETE = (
+    "restrict",  # the delete is refused while references exist
+    "cascade",  # referencing records are deleted too
+    "set_null",  # the reference is cleared (removed from the list for many)
+)
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class Relationship:
+    """A reference from records of one entity type to records of another.
+
+    Attributes:
+        name: Relationship name
+        source_type: Entity type holding the reference
+        field: Field of the source records holding the referenced id (or a
+            list of ids when ``many`` is set)
+        target_type: Entity type referenced
+        many: Whether the field holds a list of ids
+        on_delete: One of ``ON_DELETE``
+    """
+
+    name: str
+    source_type: str
+    field: str
+    target_type: str
+    many: bool = False
+    on_delete: str = "restrict"
+
+    def references(self, record: Mapping[str, Any]) -> tuple[str, ...]:
+        """Get the ids a source record references.
+
+        Args:
+            record: Source record
+
+        Returns:
+            Referenced ids in field order, without duplicates
+        """
+        value = record.get(self.field)
+        if value is None:
+            return ()
+        if not self.many:
+            return (value,)
+        return tuple(dict.fromkeys(value))
+
+    def cleared(self, record: Mapping[str, Any], target_id: str) -> dict[str, Any]:
+        """Get the update clearing a reference to a deleted target.
+
+        Args:
+            record: Source record
+            target_id: Deleted target id
+
+        Returns:
+            Field update for the source record
+        """
+        if not self.many:
+            return {self.field: None}
+        return {self.field: [value for value in record.get(self.field) or () if value != target_id]}
+
+
+class RelationshipIndex:
+    """Forward and reverse adjacency of one relationship.
+
+    The forward side maps each source id to the ids it references and the
+    reverse side maps each target id to the ids referencing it, so both
+    directions are answered in O(k) for k related records. References are
+    not validated: a source may reference an id that does not exist.
+    """
+
+    def __init__(self, relationship: Relationship) -> None:
+        """Initialize an empty index.
+
+        Args:
+            relationship: Relationship to index
+        """
+        self.relationship = relationship
+        self._forward: dict[str, tuple[str, ...]] = {}
+        self._reverse: dict[str, set[str]] = {}
+
+    def add(self, source_id: str, record: Mapping[str, Any]) -> None:
+        """Index the references of a source record.
+
+        Args:
+            source_id: Source entity id
+            record: Source record
+        """
+        targets = self.relationship.references(record)
+        if not targets:
+            return
+        self._forward[source_id] = targets
+        for target_id in targets:
+            self._reverse.setdefault(target_id, set()).add(source_id)
+
+    def remove(self, source_id: str) -> None:
+        """Remove the references of a source record.
+
+        Args:
+            source_id: Source entity id
+        """
+        for target_id in self._forward.pop(source_id, ()):
+            sources = self._reverse.get(target_id)
+            if sources is not None:
+                sources.discard(source_id)
+                if not sources:
+                    del self._reverse[target_id]
+
+    def update(self, source_id: str, new_record: Mapping[str, Any]) -> None:
+        """Re-index a source record whose references may have changed.
+
+        Args:
+            source_id: Source entity id
+            new_record: Source record after the update
+        """
+        if self._forward.get(source_id, ()) == self.relationship.references(new_record):
+            return
+        self.remove(source_id)
+        self.add(source_id, new_record)
+
+    def targets(self, source_id: str) -> tuple[str, ...]:
+        """Get the ids a source record references.
+
+        Args:
+            source_id: Source entity id
+
+        Returns:
+            Referenced ids
+        """
+        return self._forward.get(source_id, ())
+
+    def sources(self, target_id: str) -> set[str] | frozenset[str]:
+        """Get the ids of the source records referencing a target.
+
+        Args:
+            target_id: Target entity id
+
+        Returns:
+            Referencing ids (do not modify)
+        """
+        return self._reverse.get(target_id, _EMPTY)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._forward.clear()
+        self._reverse.clear()
+
+    def __len__(self) -> int:
+        """Get the number of source records with references.
+
+        Returns:
+            Number of indexed source records
+        """
+        return len(self._forward)
@@ -0,0 +1,574 @@
+"""Leader/follower replication of an InMemoryDataManager over TCP."""
+
+import json
+import socket
+import struct
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any, BinaryIO
+
+from aiml_studio.managers.data_manager import InMemoryDataManager
+from aiml_studio.utilities.logger import get_logger
+
+# Messages are JSON objects prefixed with their length as a 4-byte big-endian integer
+_LENGTH = struct.Struct(">I")
+
+
+def _encode(value: Any) -> Any:
+    """Convert values JSON cannot encode.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        A plain dictionary for records, the string form for anything else
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _send(connection: socket.socket, message: Mapping[str, Any]) -> None:
+    """Send a length-prefixed JSON message.
+
+    Args:
+        connection: Connected socket
+        message: Message to send
+    """
+    payload = json.dumps(message, default=_encode, separators=(",", ":")).encode()
+    connection.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _receive(reader: BinaryIO) -> dict[str, Any]:
+    """Read one length-prefixed JSON message.
+
+    Args:
+        reader: Buffered reader over a connected socket
+
+    Returns:
+        Decoded message
+
+    Raises:
+        ConnectionError: If the connection closed mid-message
+    """
+    header = reader.read(_LENGTH.size)
+    if len(header) < _LENGTH.size:
+        msg = "Replication connection closed"
+        raise ConnectionError(msg)
+    (length,) = _LENGTH.unpack(header)
+    payload = reader.read(length)
+    if len(payload) < length:
+        msg = "Replication connection closed mid-message"
+        raise ConnectionError(msg)
+    return json.loads(payload)
+
+
+class ReplicationServer:
+    """Stream the mutations of a leader data manager to followers over TCP.
+
+    A connecting follower sends the leader id and change sequence it last
+    applied. If the leader's change feed still holds everything after that
+    sequence, only the missing changes are sent; otherwise the follower is
+    bootstrapped with a full snapshot first. Changes are then streamed in
+    order as they happen, interleaved with heartbeats carrying the leader's
+    latest sequence so followers can tell how far behind they are.
+    """
+
+    def __init__(
+        self,
+        data_manager: InMemoryDataManager,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        heartbeat_interval: float = 0.5,
+        batch_size: int = 1000,
+    ) -> None:
+        """Initialize the replication server.
+
+        Args:
+            data_manager: Leader data manager
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            heartbeat_interval: Seconds between heartbeats
+            batch_size: Maximum number of changes per message
+        """
+        self._data_manager = data_manager
+        self._host = host
+        self._port = port
+        self._heartbeat_interval = heartbeat_interval
+        self._batch_size = batch_size
+        # Identifies this leader's change sequence; a follower of another leader is re-bootstrapped
+        self.leader_id = uuid.uuid4().hex
+        self._logger = get_logger(__name__)
+        self._stop = threading.Event()
+        self._listener: socket.socket | None = None
+        self._threads: list[threading.Thread] = []
+        self._followers: set[socket.socket] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Get the address followers connect to.
+
+        Returns:
+            Host and port (the port is only known once started)
+        """
+        return self._host, self._port
+
+    def start(self) -> None:
+        """Start accepting followers in a background thread."""
+        if self._listener is not None:
+            return
+        self._stop.clear()
+        self._listener = socket.create_server((self._host, self._port))
+        self._port = self._listener.getsockname()[1]
+        thread = threading.Thread(target=self._accept, args=(self._listener,), name="replication-leader", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        self._logger.info(f"Replication leader listening on {self._host}:{self._port}")
+
+    def stop(self) -> None:
+        """Disconnect the followers and stop accepting new ones."""
+        if self._listener is None:
+            return
+        self._stop.set()
+        self._listener.close()
+        with self._lock:
+            for follower in self._followers:
+                try:
+                    follower.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        self._listener = None
+
+    def _accept(self, listener: socket.socket) -> None:
+        """Accept follower connections until stopped.
+
+        Args:
+            listener: Listening socket
+        """
+        while not self._stop.is_set():
+            try:
+                connection, address = listener.accept()
+            except OSError:
+                break
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._followers.add(connection)
+            thread = threading.Thread(
+                target=self._serve, args=(connection, address), name="replication-follower", daemon=True
+            )
+            thread.start()
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            self._threads.append(thread)
+
+    def _serve(self, connection: socket.socket, address: tuple[str, int]) -> None:
+        """Stream changes to one follower until it disconnects.
+
+        Args:
+            connection: Follower connection
+            address: Follower address
+        """
+        try:
+            with connection, connection.makefile("rb") as reader:
+                hello = _receive(reader)
+                sequence: int | None = hello.get("sequence", 0)
+                if hello.get("leader_id") != self.leader_id:
+                    sequence = None
+                self._logger.info(f"Follower {address[0]}:{address[1]} connected at sequence {sequence}")
+                next_heartbeat = 0.0
+                while not self._stop.is_set():
+                    latest = self._data_manager.latest_change_sequence()
+                    changes = None
+                    if sequence is not None and sequence <= latest:
+                        changes = self._data_manager.changes_since(sequence)
+                    if changes is None:
+                        sequence = self._send_snapshot(connection)
+                        continue
+                    for start in range(0, len(changes), self._batch_size):
+                        batch = changes[start : start + self._batch_size]
+                        _send(
+                            connection,
+                            {
+                                "type": "changes",
+                                "events": [
+                                    [event.sequence, event.op, event.entity_type, event.entity_id, event.record]
+                                    for event in batch
+                                ],
+                                "time": batch[-1].timestamp,
+                            },
+                        )
+                    if changes:
+                        sequence = changes[-1].sequence
+                    now = time.monotonic()
+                    if now >= next_heartbeat:
+                        _send(connection, {"type": "heartbeat", "sequence": latest})
+                        next_heartbeat = now + self._heartbeat_interval
+                    self._data_manager.wait_for_changes(sequence, max(next_heartbeat - time.monotonic(), 0))
+        except (OSError, ValueError) as e:
+            if not self._stop.is_set():
+                self._logger.info(f"Follower {address[0]}:{address[1]} disconnected: {e}")
+        finally:
+            with self._lock:
+                self._followers.discard(connection)
+
+    def _send_snapshot(self, connection: socket.socket) -> int:
+        """Send every record of the leader to a follower.
+
+        The change sequence is taken before copying, so changes the copy
+        already contains are sent again afterwards; applying them twice
+        leaves the follower in the same state.
+
+        Args:
+            connection: Follower connection
+
+        Returns:
+            Change sequence the snapshot is consistent with
+        """
+        sequence = self._data_manager.latest_change_sequence()
+        data = {
+            entity_type: self._data_manager.snapshot(entity_type) for entity_type in self._data_manager.entity_types()
+        }
+        _send(connection, {"type": "snapshot", "leader_id": self.leader_id, "sequence": sequence, "data": data})
+        self._logger.info(f"Sent snapshot of {sum(map(len, data.values()))} records at sequence {sequence}")
+        return sequence
+
+
+class FollowerDataManager(InMemoryDataManager):
+    """Read-only replica of a leader data manager served by a ReplicationServer.
+
+    A background thread keeps a local copy current with the leader's change
+    stream and reconnects when the connection drops. Changes are applied
+    through the normal derived-structure hooks, so indexes, relationships,
+    aggregations and the replica's own change feed behave as on the leader.
+    Writes are refused.
+
+    Reads are bounded in staleness: ``retrieve``, ``retrieve_many``,
+    ``list_all``, ``search``, ``count``, ``exists`` and ``text_search`` raise
+    ``TimeoutError`` once the replica has not been caught up with the
+    leader for more than ``max_staleness`` seconds, so callers can fall back
+    to the leader. The replica learns it is caught up from the leader's
+    heartbeats, so ``max_staleness`` must exceed the heartbeat interval.
+    Values JSON cannot represent arrive as strings.
+    """
+
+    def __init__(
+        self,
+        leader: tuple[str, int],
+        max_staleness: float | None = 5.0,
+        sync_timeout: float = 10.0,
+        reconnect_interval: float = 1.0,
+        **options: Any,
+    ) -> None:
+        """Initialize the replica.
+
+        Args:
+            leader: Host and port of the leader's ReplicationServer
+            max_staleness: Refuse reads after this many seconds without
+                being caught up (None never refuses)
+            sync_timeout: Seconds ``initialize`` waits for the first sync
+            reconnect_interval: Seconds between reconnection attempts
+            **options: ``InMemoryDataManager`` keyword arguments (without a
+                write-ahead log)
+        """
+        super().__init__(**options)
+        self.leader = leader
+        self.max_staleness = max_staleness
+        self._sync_timeout = sync_timeout
+        self._reconnect_interval = reconnect_interval
+        self._leader_id: str | None = None
+        self._applied = 0
+        self._leader_sequence = 0
+        # Leader sequences announced by heartbeats, with the time they arrived
+        self._pending: deque[tuple[int, float]] = deque()
+        self._synced_at: float | None = None
+        self._event_lag = 0.0
+        self._synced = threading.Condition()
+        self._stop = threading.Event()
+        self._connection: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+
+    def initialize(self) -> None:
+        """Initialize the replica and wait for the first sync with the leader."""
+        super().initialize()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._follow, name="replication-follower", daemon=True)
+        self._thread.start()
+        with self._synced:
+            if not self._synced.wait_for(lambda: self._synced_at is not None, self._sync_timeout):
+                self._logger.warning(f"Replica did not sync with {self.leader[0]}:{self.leader[1]} yet")
+
+    def shutdown(self) -> None:
+        """Disconnect from the leader and shutdown the replica."""
+        self._stop.set()
+        connection = self._connection
+        if connection is not None:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        super().shutdown()
+
+    def replication_status(self) -> dict[str, Any]:
+        """Get how far the replica is behind the leader.
+
+        Returns:
+            Applied and leader sequences, their difference, the staleness
+            (seconds since the replica was last caught up, None before the
+            first sync) and the event lag (seconds between the leader making
+            the last applied change and the replica applying it)
+        """
+        staleness = None if self._synced_at is None else time.monotonic() - self._synced_at
+        return {
+            "leader": f"{self.leader[0]}:{self.leader[1]}",
+            "applied_sequence": self._applied,
+            "leader_sequence": self._leader_sequence,
+            "sequence_lag": max(self._leader_sequence - self._applied, 0),
+            "staleness": staleness,
+            "event_lag": self._event_lag,
+        }
+
+    def _follow(self) -> None:
+        """Apply the leader's change stream, reconnecting until stopped."""
+        while not self._stop.is_set():
+            try:
+                with socket.create_connection(self.leader, timeout=self._reconnect_interval) as connection:
+                    connection.settimeout(None)
+                    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    self._connection = connection
+                    _send(connection, {"leader_id": self._leader_id, "sequence": self._applied})
+                    with connection.makefile("rb") as reader:
+                        while not self._stop.is_set():
+                            self._handle(_receive(reader))
+            except (OSError, ValueError) as e:
+                if not self._stop.is_set():
+                    self._logger.warning(f"Replication from {self.leader[0]}:{self.leader[1]} interrupted: {e}")
+            finally:
+                self._connection = None
+            self._stop.wait(self._reconnect_interval)
+
+    def _handle(self, message: Mapping[str, Any]) -> None:
+        """Apply one message of the leader.
+
+        Args:
+            message: Snapshot, changes or heartbeat
+        """
+        kind = message["type"]
+        if kind == "snapshot":
+            store = {"projects": {}, "data_sources": {}, "logs": {}, "users": {}}
+            for entity_type, records in message["data"].items():
+                store[entity_type] = self._build_partition(entity_type, records)
+            self._replace_store(store)
+            self._leader_id = message["leader_id"]
+            self._applied = message["sequence"]
+            self._leader_sequence = max(self._leader_sequence, self._applied)
+            self._pending.clear()
+            self._pending.append((self._applied, time.monotonic()))
+            self._logger.info(f"Replica loaded snapshot at sequence {self._applied}")
+        elif kind == "changes":
+            for sequence, op, entity_type, entity_id, record in message["events"]:
+                self._apply(op, entity_type, entity_id, record)
+                self._applied = sequence
+            self._leader_sequence = max(self._leader_sequence, self._applied)
+            self._event_lag = max(time.time() - message["time"], 0.0)
+        elif kind == "heartbeat":
+            self._leader_sequence = max(self._leader_sequence, message["sequence"])
+            self._pending.append((message["sequence"], time.monotonic()))
+
+        # Once the sequence a heartbeat announced is applied, the replica was
+        # caught up with the leader as of that heartbeat's arrival
+        synced_at = None
+        while self._pending and self._pending[0][0] <= self._applied:
+            synced_at = self._pending.popleft()[1]
+        if synced_at is not None:
+            with self._synced:
+                self._synced_at = synced_at
+                self._synced.notify_all()
+
+    def _apply(self, op: str, entity_type: str, entity_id: str, data: Mapping[str, Any] | None) -> None:
+        """Apply a replicated change as the final state of a record.
+
+        Args:
+            op: Mutation type
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Record after the change (None for deletes)
+        """
+        with self._partition_lock(entity_type):
+            partition = self._data_store.setdefault(entity_type, {})
+            old_record = partition.get(entity_id)
+            if op == "delete" or data is None:
+                if old_record is not None:
+                    del partition[entity_id]
+                    self._on_deleted(entity_type, entity_id, old_record)
+                return
+            record = self._to_record(entity_type, data)
+            partition[entity_id] = record
+            if old_record is None:
+                self._on_created(entity_type, entity_id, record)
+            else:
+                self._on_updated(entity_type, entity_id, old_record, record)
+
+    def _check_fresh(self) -> None:
+        """Refuse a read if the replica is too far behind the leader.
+
+        Raises:
+            TimeoutError: If the replica has not been caught up within
+                ``max_staleness`` seconds
+        """
+        if self.max_staleness is None:
+            return
+        synced_at = self._synced_at
+        if synced_at is None or time.monotonic() - synced_at > self.max_staleness:
+            msg = f"Replica of {self.leader[0]}:{self.leader[1]} is more than {self.max_staleness}s stale"
+            raise TimeoutError(msg)
+
+    def create(self, entity_type: str, entity_id: str, data: dict[str, Any]) -> bool:
+        """Refuse a write: replicas are read-only.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Unique identifier
+            data: Data to store
+
+        Returns:
+            False
+        """
+        self._logger.warning(f"Refusing to create {entity_type}/{entity_id} on a read-only replica")
+        return False
+
+    def update(
+        self, entity_type: str, entity_id: str, data: dict[str, Any], expected_version: int | None = None
+    ) -> bool:
+        """Refuse a write: replicas are read-only.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            data: Updated data
+            expected_version: Ignored
+
+        Returns:
+            False
+        """
+        self._logger.warning(f"Refusing to update {entity_type}/{entity_id} on a read-only replica")
+        return False
+
+    def delete(self, entity_type: str, entity_id: str, expected_version: int | None = None) -> bool:
+        """Refuse a write: replicas are read-only.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            expected_version: Ignored
+
+        Returns:
+            False
+        """
+        self._logger.warning(f"Refusing to delete {entity_type}/{entity_id} on a read-only replica")
+        return False
+
+    def retrieve(self, entity_type: str, entity_id: str) -> dict[str, Any] | None:
+        """Retrieve a record from the replica.
+
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+
+        Returns:
+            Entity data or None
+        """
+        self._check_fresh()
+        return super().retrieve(entity_type, entity_id)
+
+    def retrieve_many(
+        self, entity_type: str, entity_ids: Iterable[str], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Retrieve several records from the replica.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: Entity identifiers
+            fields: Only return these fields of each record
+
+        Returns:
+            Records in the order of ``entity_ids``, skipping ids that do not exist
+        """
+        self._check_fresh()
+        return super().retrieve_many(entity_type, entity_ids, fields)
+
+    def list_all(self, entity_type: str, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List the records of an entity type on the replica.
+
+        Args:
+            entity_type: Type of entity
+            fields: Only return these fields of each record
+
+        Returns:
+            List of entity records
+        """
+        self._check_fresh()
+        return super().list_all(entity_type, fields)
+
+    def search(
+        self, entity_type: str, filters: dict[str, Any], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search the replica.
+
+        Args:
+            entity_type: Type of entity
+            filters: Search filters
+            fields: Only return these fields of each record
+
+        Returns:
+            List of matching records
+        """
+        self._check_fresh()
+        return super().search(entity_type, filters, fields)
+
+    def count(self, entity_type: str, filters: dict[str, Any] | None = None) -> int:
+        """Count matching records on the replica.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None counts every record)
+
+        Returns:
+            Number of matching records
+        """
+        self._check_fresh()
+        return super().count(entity_type, filters)
+
+    def exists(self, entity_type: str, filters: dict[str, Any] | None = None) -> bool:
+        """Check whether any record on the replica matches filters.
+
+        Args:
+            entity_type: Type of entity
+            filters: Field values to match (None checks for any record)
+
+        Returns:
+            True if at least one record matches
+        """
+        self._check_fresh()
+        return super().exists(entity_type, filters)
+
+    def text_search(self, entity_type: str, query: str) -> list[dict[str, Any]]:
+        """Run a full-text search on the replica.
+
+        Args:
+            entity_type: Type of entity
+            query: Full-text query
+
+        Returns:
+            List of matching records
+        """
+        self._check_fresh()
+        return super().text_search(entity_type, query)
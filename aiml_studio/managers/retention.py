@@ -0,0 +1,214 @@
+"""Retention policies enforced in the background for DataManager entity types."""
+
+import json
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from aiml_studio.managers.data_manager import InMemoryDataManager
+from aiml_studio.managers.log_store import to_epoch
+from aiml_studio.utilities.logger import get_logger
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Limits on how much data an entity type keeps.
+
+    Records beyond ``max_age`` are removed first; if ``max_count`` or
+    ``max_bytes`` is still exceeded, the oldest remaining records are
+    removed until the limits hold. Records are ordered by their timestamp
+    field, falling back to insertion order for records without one.
+    """
+
+    max_age: float | None = None
+    max_count: int | None = None
+    max_bytes: int | None = None
+    timestamp_field: str = "timestamp"
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    """Outcome of enforcing a retention policy on one entity type."""
+
+    entity_type: str
+    removed: int
+    reclaimed_bytes: int
+    duration: float
+
+
+def record_size(record: Mapping[str, Any]) -> int:
+    """Estimate the size of a record as its JSON-encoded length.
+
+    Args:
+        record: Record data
+
+    Returns:
+        Estimated size in bytes
+    """
+    return len(json.dumps(record, default=dict, separators=(",", ":")))
+
+
+class RetentionWorker:
+    """Background task enforcing retention policies on a data manager.
+
+    Expired records are removed through the data manager's own mutation
+    path, so text indexes, aggregations, versions and the change feed stay
+    consistent. Deletes run in small batches with a pause in between to
+    keep the worker from starving request threads.
+    """
+
+    def __init__(
+        self,
+        data_manager: InMemoryDataManager,
+        policies: Mapping[str, RetentionPolicy],
+        interval: float = 300.0,
+        batch_size: int = 500,
+        batch_pause: float = 0.01,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            data_manager: Data manager to enforce the policies on
+            policies: Retention policy per entity type
+            interval: Seconds between enforcement passes
+            batch_size: Records deleted per batch
+            batch_pause: Seconds to yield between batches
+        """
+        self._logger = get_logger(__name__)
+        self._data_manager = data_manager
+        self._policies = dict(policies)
+        self._interval = interval
+        self._batch_size = batch_size
+        self._batch_pause = batch_pause
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reclaimed_bytes = 0
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Get the estimated bytes reclaimed since the worker was created.
+
+        Returns:
+            Reclaimed bytes
+        """
+        return self._reclaimed_bytes
+
+    def start(self) -> None:
+        """Start enforcing the policies in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="data-retention", daemon=True)
+        self._thread.start()
+        self._logger.info(f"Retention worker started for {', '.join(self._policies)}")
+
+    def stop(self) -> None:
+        """Stop the background thread, finishing the current batch."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Enforce the policies every interval until stopped."""
+        while not self._stop.wait(self._interval):
+            self.enforce()
+
+    def enforce(self) -> list[RetentionReport]:
+        """Enforce every policy once.
+
+        Returns:
+            One report per entity type
+        """
+        reports = []
+        for entity_type, policy in self._policies.items():
+            try:
+                report = self._enforce(entity_type, policy)
+            except Exception:
+                self._logger.exception(f"Error enforcing retention on {entity_type}")
+                continue
+            reports.append(report)
+            self._reclaimed_bytes += report.reclaimed_bytes
+            if report.removed:
+                self._logger.info(
+                    f"Retention removed {report.removed} {entity_type} records "
+                    f"(~{report.reclaimed_bytes} bytes) in {report.duration:.2f}s"
+                )
+        return reports
+
+    def _enforce(self, entity_type: str, policy: RetentionPolicy) -> RetentionReport:
+        """Enforce a policy on one entity type.
+
+        Args:
+            entity_type: Type of entity
+            policy: Policy to enforce
+
+        Returns:
+            Report of the removed records
+        """
+        started = time.perf_counter()
+        removed = 0
+        reclaimed = 0
+
+        if policy.max_age is not None and self._data_manager.is_time_partitioned(entity_type):
+            # Whole segments past the cutoff are dropped in one step; records
+            # in the boundary segment are left to the per-record pass below.
+            dropped = self._data_manager.drop_before(entity_type, time.time() - policy.max_age)
+            removed += len(dropped)
+            reclaimed += sum(record_size(record) for record in dropped.values())
+
+        records = self._data_manager.snapshot(entity_type)
+        expired = self._expired(records, policy)
+        for start in range(0, len(expired), self._batch_size):
+            if self._stop.is_set():
+                break
+            for entity_id in expired[start : start + self._batch_size]:
+                if self._data_manager.delete(entity_type, entity_id):
+                    removed += 1
+                    reclaimed += record_size(records[entity_id])
+            time.sleep(self._batch_pause)
+
+        return RetentionReport(entity_type, removed, reclaimed, time.perf_counter() - started)
+
+    @staticmethod
+    def _expired(records: Mapping[str, Mapping[str, Any]], policy: RetentionPolicy) -> list[str]:
+        """Select the records a policy removes, oldest first.
+
+        Args:
+            records: Records keyed by entity id, in insertion order
+            policy: Policy to apply
+
+        Returns:
+            Entity ids to delete
+        """
+        if policy.max_age is None and policy.max_count is None and policy.max_bytes is None:
+            return []
+
+        timestamps = {}
+        for entity_id, record in records.items():
+            timestamp = to_epoch(record.get(policy.timestamp_field))
+            timestamps[entity_id] = float("-inf") if timestamp is None else timestamp
+        ordered = sorted(records, key=timestamps.__getitem__)
+
+        # Records without a timestamp never expire by age, but are the first
+        # to go when a count or size limit is exceeded.
+        expired: list[str] = []
+        if policy.max_age is not None:
+            cutoff = time.time() - policy.max_age
+            expired = [entity_id for entity_id in ordered if float("-inf") < timestamps[entity_id] < cutoff]
+            if expired:
+                expired_ids = set(expired)
+                ordered = [entity_id for entity_id in ordered if entity_id not in expired_ids]
+
+        evicted = 0
+        if policy.max_count is not None:
+            evicted = max(0, len(ordered) - policy.max_count)
+        if policy.max_bytes is not None:
+            remaining = sum(record_size(records[entity_id]) for entity_id in ordered[evicted:])
+            while evicted < len(ordered) and remaining > policy.max_bytes:
+                remaining -= record_size(records[ordered[evicted]])
+                evicted += 1
+        return expired + ordered[:evicted]
@@ -0,0 +1,260 @@
+"""Full-text inverted index over declared text fields of data records."""
+
+import bisect
+import re
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_query(query: str) -> tuple[list[str], list[str], list[list[str]]]:
+    """Parse a full-text query into terms, prefixes and phrases.
+
+    Bare words are required terms, words ending in ``*`` are prefix terms and
+    double-quoted text is a phrase whose tokens must appear consecutively.
+    All parts are combined with AND semantics.
+
+    Args:
+        query: Query string, e.g. ``'error "data source" conn*'``
+
+    Returns:
+        Tuple of (terms, prefixes, phrases)
+    """
+    terms: list[str] = []
+    prefixes: list[str] = []
+    phrases: list[list[str]] = []
+
+    for phrase, word in _QUERY_PATTERN.findall(query):
+        if phrase:
+            tokens = tokenize(phrase)
+            if len(tokens) == 1:
+                terms.append(tokens[0])
+            elif tokens:
+                phrases.append(tokens)
+        elif word.endswith("*"):
+            prefixes.extend(tokenize(word[:-1])[-1:])
+        else:
+            terms.extend(tokenize(word))
+
+    return terms, prefixes, phrases
+
+
+def _contains_phrase(tokens: list[str], phrase: list[str]) -> bool:
+    """Check whether a token list contains a phrase as a consecutive run.
+
+    Args:
+        tokens: Tokens of a document field
+        phrase: Phrase tokens
+
+    Returns:
+        True if the phrase occurs in the tokens
+    """
+    size = len(phrase)
+    first = phrase[0]
+    return any(token == first and tokens[i : i + size] == phrase for i, token in enumerate(tokens))
+
+
+class FullTextIndex:
+    """Inverted index mapping tokens of selected text fields to record ids.
+
+    Posting lists are kept as sets of record ids so that create, update and
+    delete can be applied incrementally. Phrase queries are answered by
+    intersecting the posting lists of the phrase tokens and verifying the
+    remaining candidates against their field text.
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """Initialize the index.
+
+        Args:
+            fields: Names of the record fields to index
+        """
+        self._fields = tuple(fields)
+        self._postings: dict[str, set[str]] = {}
+        self._vocabulary: list[str] = []
+        self._vocabulary_dirty = False
+        self._documents = 0
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Get the indexed field names.
+
+        Returns:
+            Tuple of field names
+        """
+        return self._fields
+
+    def __len__(self) -> int:
+        """Get the number of indexed records.
+
+        Returns:
+            Number of records
+        """
+        return self._documents
+
+    def field_tokens(self, record: Mapping[str, Any]) -> list[list[str]]:
+        """Tokenize the indexed fields of a record.
+
+        Args:
+            record: Record to tokenize
+
+        Returns:
+            One token list per indexed field that holds a value
+        """
+        return [tokenize(str(record[field])) for field in self._fields if record.get(field) is not None]
+
+    def add(self, record_id: str, record: Mapping[str, Any]) -> None:
+        """Add a record to the index.
+
+        Args:
+            record_id: Record identifier
+            record: Record data
+        """
+        for tokens in self.field_tokens(record):
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    self._postings[token] = postings = set()
+                    self._vocabulary_dirty = True
+                postings.add(record_id)
+        self._documents += 1
+
+    def remove(self, record_id: str, record: Mapping[str, Any]) -> None:
+        """Remove a record from the index.
+
+        Args:
+            record_id: Record identifier
+            record: Record data as it was indexed
+        """
+        for tokens in self.field_tokens(record):
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    continue
+                postings.discard(record_id)
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary_dirty = True
+        self._documents -= 1
+
+    def update(self, record_id: str, old_record: Mapping[str, Any], new_record: Mapping[str, Any]) -> None:
+        """Re-index a record whose data changed.
+
+        Args:
+            record_id: Record identifier
+            old_record: Record data as it was indexed
+            new_record: New record data
+        """
+        if all(old_record.get(field) == new_record.get(field) for field in self._fields):
+            return
+        self.remove(record_id, old_record)
+        self.add(record_id, new_record)
+
+    def clear(self) -> None:
+        """Remove all records from the index."""
+        self._postings.clear()
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+        self._documents = 0
+
+    def _prefix_postings(self, prefix: str) -> set[str]:
+        """Get the union of posting lists of all tokens starting with a prefix.
+
+        Args:
+            prefix: Token prefix
+
+        Returns:
+            Set of matching record ids
+        """
+        if self._vocabulary_dirty:
+            self._vocabulary_dirty = False
+            self._vocabulary = sorted(self._postings)
+
+        vocabulary = self._vocabulary
+        matches: set[str] = set()
+        start = bisect.bisect_left(vocabulary, prefix)
+        for token in vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            matches |= self._postings.get(token, set())
+        return matches
+
+    def search(self, query: str, resolve: Callable[[str], Mapping[str, Any] | None] | None = None) -> set[str]:
+        """Find record ids matching a query.
+
+        Args:
+            query: Query string (see ``parse_query``)
+            resolve: Callable mapping a record id to its record, required to
+                verify phrase queries
+
+        Returns:
+            Set of matching record ids
+        """
+        terms, prefixes, phrases = parse_query(query)
+        if not (terms or prefixes or phrases):
+            return set()
+
+        candidates = [self._postings.get(term, set()) for term in {*terms, *(t for p in phrases for t in p)}]
+        candidates.extend(self._prefix_postings(prefix) for prefix in prefixes)
+        candidates.sort(key=len)
+
+        result = set(candidates[0])
+        for postings in candidates[1:]:
+            if not result:
+                break
+            result &= postings
+
+        if phrases and result and resolve is not None:
+            result = {record_id for record_id in result if self._matches_phrases(resolve(record_id), phrases)}
+        return result
+
+    def _matches_phrases(self, record: Mapping[str, Any] | None, phrases: list[list[str]]) -> bool:
+        """Verify that a record contains every phrase within a single field.
+
+        Args:
+            record: Candidate record
+            phrases: Phrases to verify
+
+        Returns:
+            True if all phrases occur
+        """
+        if record is None:
+            return False
+        field_tokens = self.field_tokens(record)
+        return all(any(_contains_phrase(tokens, phrase) for tokens in field_tokens) for phrase in phrases)
+
+    def matches(self, record: Mapping[str, Any], query: str) -> bool:
+        """Evaluate a query against a single record without using the index.
+
+        Args:
+            record: Record to test
+            query: Query string
+
+        Returns:
+            True if the record matches the query
+        """
+        terms, prefixes, phrases = parse_query(query)
+        if not (terms or prefixes or phrases):
+            return False
+
+        field_tokens = self.field_tokens(record)
+        tokens = {token for field in field_tokens for token in field}
+        return (
+            all(term in tokens for term in terms)
+            and all(any(token.startswith(prefix) for token in tokens) for prefix in prefixes)
+            and all(any(_contains_phrase(field, phrase) for field in field_tokens) for phrase in phrases)
+        )
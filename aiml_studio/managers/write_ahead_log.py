@@ -0,0 +1,313 @@
+"""Append-only write-ahead log with snapshots for durable in-memory stores."""
+
+import json
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import IO, Any
+
+from aiml_studio.utilities.logger import get_logger
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+_SNAPSHOT_FILE = "snapshot.json"
+_SEGMENT_PREFIX = "wal-"
+_SEGMENT_SUFFIX = ".log"
+
+
+class WriteAheadLog:
+    """Durable log of data mutations with periodic compacted snapshots.
+
+    Every mutation is appended as one JSON line holding the full after-image
+    of the record, which makes replay idempotent. Appends are buffered and
+    written in groups: with the ``always`` fsync policy a writer waits in
+    ``sync`` until its group is on disk, while ``interval`` and ``never``
+    flush in the background every ``flush_interval`` seconds (with and
+    without fsync respectively).
+
+    Snapshots are fuzzy: ``begin_snapshot`` rotates to a new log segment and
+    returns the last sequence number it covers, the caller then copies its
+    state and hands it to ``write_snapshot``, after which older segments are
+    removed. Recovery loads the snapshot and replays the remaining segments.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        fsync_policy: str = "interval",
+        flush_interval: float = 0.05,
+        snapshot_every: int = 100_000,
+    ) -> None:
+        """Initialize the write-ahead log.
+
+        Args:
+            directory: Directory holding the snapshot and log segments
+            fsync_policy: One of 'always', 'interval' or 'never'
+            flush_interval: Seconds between background flushes
+            snapshot_every: Number of appends after which a snapshot is due
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            msg = f"Invalid fsync policy: {fsync_policy}"
+            raise ValueError(msg)
+
+        self._logger = get_logger(__name__)
+        self._directory = Path(directory)
+        self._fsync_policy = fsync_policy
+        self._flush_interval = flush_interval
+        self._snapshot_every = snapshot_every
+
+        self._condition = threading.Condition()
+        self._buffer: list[bytes] = []
+        self._file: IO[bytes] | None = None
+        self._sequence = 0
+        self._buffered_sequence = 0
+        self._durable_sequence = 0
+        self._flushing = False
+        self._appends_since_snapshot = 0
+        self._snapshot_running = False
+        self._stop_event = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    @property
+    def sequence(self) -> int:
+        """Get the sequence number of the last appended mutation.
+
+        Returns:
+            Last sequence number
+        """
+        return self._sequence
+
+    @property
+    def snapshot_due(self) -> bool:
+        """Check whether enough mutations were logged to warrant a snapshot.
+
+        Returns:
+            True if a snapshot should be written
+        """
+        return not self._snapshot_running and self._appends_since_snapshot >= self._snapshot_every
+
+    def recover(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Rebuild state from the latest snapshot and the log tail.
+
+        Returns:
+            Mapping of entity type to records keyed by entity id
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        state: dict[str, dict[str, dict[str, Any]]] = {}
+        snapshot_sequence = 0
+
+        snapshot_path = self._directory / _SNAPSHOT_FILE
+        if snapshot_path.exists():
+            with snapshot_path.open("rb") as f:
+                snapshot = json.load(f)
+            snapshot_sequence = snapshot["sequence"]
+            state = snapshot["data"]
+
+        sequence = snapshot_sequence
+        replayed = 0
+        for segment in self._segments():
+            with segment.open("rb") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        self._logger.warning(f"Ignoring torn entry at the end of {segment.name}")
+                        break
+                    if entry["seq"] <= snapshot_sequence:
+                        continue
+                    partition = state.setdefault(entry["type"], {})
+                    if entry["op"] == "delete":
+                        partition.pop(entry["id"], None)
+                    else:
+                        partition[entry["id"]] = entry["record"]
+                    sequence = entry["seq"]
+                    replayed += 1
+
+        self._sequence = self._buffered_sequence = self._durable_sequence = sequence
+        self._appends_since_snapshot = replayed
+        self._logger.info(f"Recovered snapshot at sequence {snapshot_sequence} and replayed {replayed} log entries")
+        return state
+
+    def open(self) -> None:
+        """Open a new log segment for appending and start the flusher."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with self._condition:
+            self._file = self._open_segment(self._sequence + 1)
+        self._stop_event.clear()
+        if self._fsync_policy != "always":
+            self._flusher = threading.Thread(target=self._flush_loop, name="wal-flusher", daemon=True)
+            self._flusher.start()
+
+    def close(self) -> None:
+        """Flush pending entries and close the log."""
+        self._stop_event.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.sync(self._sequence, force=True)
+        with self._condition:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def append(self, op: str, entity_type: str, entity_id: str, record: Mapping[str, Any] | None) -> int:
+        """Append a mutation to the log buffer.
+
+        Callers must append mutations of a record in the order they are
+        applied, e.g. while holding the lock that serializes them.
+
+        Args:
+            op: Mutation type ('create', 'update' or 'delete')
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            record: Full record after the mutation (None for deletes)
+
+        Returns:
+            Sequence number assigned to the mutation
+        """
+        body = json.dumps(
+            {"op": op, "type": entity_type, "id": entity_id, "record": record}, separators=(",", ":"), default=dict
+        )
+        with self._condition:
+            self._sequence += 1
+            self._buffer.append(b'{"seq":%d,%s\n' % (self._sequence, body[1:].encode()))
+            self._buffered_sequence = self._sequence
+            self._appends_since_snapshot += 1
+            return self._sequence
+
+    def sync(self, sequence: int, force: bool = False) -> None:
+        """Wait until a mutation is durable according to the fsync policy.
+
+        With the 'always' policy concurrent callers are committed as one
+        group: the first waiter writes and fsyncs every buffered entry while
+        the others wait for it. Other policies return immediately unless
+        ``force`` is set.
+
+        Args:
+            sequence: Sequence number returned by ``append``
+            force: Flush even if the policy would defer it
+        """
+        if self._fsync_policy != "always" and not force:
+            return
+
+        with self._condition:
+            while self._durable_sequence < sequence:
+                if self._flushing:
+                    self._condition.wait()
+                    continue
+                self._flush_locked(fsync=self._fsync_policy != "never")
+
+    def _flush_locked(self, fsync: bool) -> None:
+        """Write the buffer to the current segment.
+
+        Must be called with the condition held; it is released during I/O.
+
+        Args:
+            fsync: Whether to fsync after writing
+        """
+        batch, self._buffer = self._buffer, []
+        target_sequence = self._buffered_sequence
+        log_file = self._file
+        self._flushing = True
+        self._condition.release()
+        try:
+            if log_file is not None and batch:
+                log_file.write(b"".join(batch))
+                log_file.flush()
+                if fsync:
+                    os.fsync(log_file.fileno())
+        finally:
+            self._condition.acquire()
+            self._flushing = False
+            self._durable_sequence = max(self._durable_sequence, target_sequence)
+            self._condition.notify_all()
+
+    def _flush_loop(self) -> None:
+        """Flush the buffer periodically in the background."""
+        fsync = self._fsync_policy == "interval"
+        while not self._stop_event.wait(self._flush_interval):
+            with self._condition:
+                if self._buffer and not self._flushing:
+                    self._flush_locked(fsync=fsync)
+
+    def begin_snapshot(self) -> int | None:
+        """Start a snapshot by rotating to a new log segment.
+
+        Returns:
+            Sequence number covered by the snapshot, or None if a snapshot is
+            already in progress
+        """
+        with self._condition:
+            if self._snapshot_running:
+                return None
+            self._snapshot_running = True
+            while self._flushing:
+                self._condition.wait()
+            if self._buffer:
+                self._flush_locked(fsync=self._fsync_policy != "never")
+            sequence = self._sequence
+            if self._file is not None:
+                self._file.close()
+                self._file = self._open_segment(sequence + 1)
+            self._appends_since_snapshot = 0
+            return sequence
+
+    def write_snapshot(self, state: dict[str, dict[str, Any]], sequence: int) -> None:
+        """Persist a snapshot and remove the log segments it covers.
+
+        Every mutation up to ``sequence`` must be reflected in ``state``;
+        later mutations may or may not be, since replay is idempotent.
+
+        Args:
+            state: Mapping of entity type to records keyed by entity id
+            sequence: Sequence number returned by ``begin_snapshot``
+        """
+        try:
+            snapshot_path = self._directory / _SNAPSHOT_FILE
+            temp_path = snapshot_path.with_suffix(".tmp")
+            payload = json.dumps({"sequence": sequence, "data": state}, separators=(",", ":"), default=dict).encode()
+            with temp_path.open("wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, snapshot_path)
+
+            for segment in self._segments():
+                if self._segment_start(segment) <= sequence:
+                    segment.unlink()
+            self._logger.info(f"Wrote snapshot at sequence {sequence}")
+        finally:
+            with self._condition:
+                self._snapshot_running = False
+
+    def _segments(self) -> list[Path]:
+        """List log segments in sequence order.
+
+        Returns:
+            Sorted list of segment paths
+        """
+        return sorted(self._directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"), key=self._segment_start)
+
+    def _segment_start(self, segment: Path) -> int:
+        """Get the first sequence number a segment may contain.
+
+        Args:
+            segment: Segment path
+
+        Returns:
+            First sequence number
+        """
+        return int(segment.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)])
+
+    def _open_segment(self, first_sequence: int) -> IO[bytes]:
+        """Create a new log segment.
+
+        Args:
+            first_sequence: First sequence number written to the segment
+
+        Returns:
+            Binary file handle opened for appending
+        """
+        path = self._directory / f"{_SEGMENT_PREFIX}{first_sequence:020d}{_SEGMENT_SUFFIX}"
+        return path.open("ab")
@@ -24,6 +24,19 @@ ENABLE_DARK_MODE = True
 # Security Settings
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
 
+# Data Store Durability (write-ahead log directory; unset keeps data in memory only)
+DATA_WAL_DIR = os.getenv("DATA_WAL_DIR")
+DATA_WAL_FSYNC_POLICY = os.getenv("DATA_WAL_FSYNC_POLICY", "interval")
+
+# Slow-query log: searches taking at least this many milliseconds are logged (0 disables)
+DATA_SLOW_QUERY_MS = float(os.getenv("DATA_SLOW_QUERY_MS", "100"))
+
+# Data Retention (0 disables a limit)
+DATA_RETENTION_INTERVAL = float(os.getenv("DATA_RETENTION_INTERVAL", "300"))
+DATA_LOG_MAX_AGE_DAYS = float(os.getenv("DATA_LOG_MAX_AGE_DAYS", "30"))
+DATA_LOG_MAX_RECORDS = int(os.getenv("DATA_LOG_MAX_RECORDS", "1000000"))
+DATA_USER_MAX_RECORDS = int(os.getenv("DATA_USER_MAX_RECORDS", "0"))
+
 # Data Sources (Example Configuration)
 DATA_SOURCE_TYPES: list[str] = ["PostgreSQL", "MySQL", "SQLite", "MongoDB", "API"]
 
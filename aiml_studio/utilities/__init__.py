@@ -6,6 +6,7 @@ from aiml_studio.utilities.export import (
     export_to_json,
     generate_export_filename,
 )
+from aiml_studio.utilities.ids import generate_id, id_timestamp
 from aiml_studio.utilities.logger import get_logger
 from aiml_studio.utilities.profiler import Profiler
 from aiml_studio.utilities.validation import (
@@ -22,6 +23,8 @@ from aiml_studio.utilities.validation import (
 __all__ = [
     "Profiler",
     "get_logger",
+    "generate_id",
+    "id_timestamp",
     "export_to_csv",
     "export_to_json",
     "create_download_link",
@@ -0,0 +1,128 @@
+"""Monotonic, time-sortable identifier generation (ULID format)."""
+
+import os
+import re
+import threading
+import time
+
+# Crockford base32, whose alphabet sorts in the same order as the values
+ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ID_LENGTH = 26
+
+_TIME_LENGTH = 10
+_RANDOM_BITS = 80
+_DECODING = {char: value for value, char in enumerate(ENCODING)}
+_ID_PATTERN = re.compile("[0-7][0-9A-HJKMNP-TV-Z]{25}")
+
+_lock = threading.Lock()
+_last_millis = -1
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    """Encode an integer as fixed-width Crockford base32.
+
+    Args:
+        value: Non-negative integer
+        length: Number of characters
+
+    Returns:
+        Encoded string
+    """
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 32)
+        chars.append(ENCODING[remainder])
+    return "".join(reversed(chars))
+
+
+def _random() -> int:
+    """Draw the random part of an identifier.
+
+    The top bit is left clear so increments within a millisecond have
+    headroom before they overflow.
+
+    Returns:
+        79-bit random integer
+    """
+    return int.from_bytes(os.urandom(10), "big") >> 1
+
+
+def generate_id(timestamp: float | None = None) -> str:
+    """Generate a monotonic, lexicographically time-sortable identifier.
+
+    The identifier is a 26-character ULID: 48 bits of milliseconds since the
+    epoch followed by 80 random bits. Identifiers generated in the same
+    millisecond increment the random part, so every identifier from this
+    process sorts after the previous one.
+
+    Args:
+        timestamp: Creation time in epoch seconds (defaults to now; explicit
+            times are not forced to be monotonic)
+
+    Returns:
+        Identifier string
+    """
+    global _last_millis, _last_random
+
+    if timestamp is not None:
+        # Explicit (e.g. backfilled) times are not part of the monotonic sequence
+        return _encode(int(timestamp * 1000), _TIME_LENGTH) + _encode(_random(), ID_LENGTH - _TIME_LENGTH)
+
+    millis = int(time.time() * 1000)
+    with _lock:
+        if millis <= _last_millis:
+            millis = _last_millis
+            random_part = _last_random + 1
+            if random_part >> _RANDOM_BITS:
+                millis += 1
+                random_part = _random()
+        else:
+            random_part = _random()
+        _last_millis = millis
+        _last_random = random_part
+    return _encode(millis, _TIME_LENGTH) + _encode(random_part, ID_LENGTH - _TIME_LENGTH)
+
+
+def is_time_ordered_id(identifier: str) -> bool:
+    """Check whether a string has the format produced by ``generate_id``.
+
+    Args:
+        identifier: Candidate identifier
+
+    Returns:
+        True if the identifier is a ULID
+    """
+    return _ID_PATTERN.fullmatch(identifier) is not None
+
+
+def id_timestamp(identifier: str) -> float | None:
+    """Get the creation time encoded in an identifier.
+
+    Args:
+        identifier: Identifier from ``generate_id``
+
+    Returns:
+        Epoch seconds, or None if the value is not a valid identifier
+    """
+    if not is_time_ordered_id(identifier):
+        return None
+    millis = 0
+    for char in identifier[:_TIME_LENGTH]:
+        millis = millis * 32 + _DECODING[char]
+    return millis / 1000
+
+
+def min_id_after(timestamp: float) -> str:
+    """Get the smallest identifier generated strictly after a time.
+
+    Every identifier created after ``timestamp`` sorts at or after the
+    returned value, which makes it a bisect key for "created after" queries.
+
+    Args:
+        timestamp: Epoch seconds
+
+    Returns:
+        Lower-bound identifier
+    """
+    return _encode(int(timestamp * 1000) + 1, _TIME_LENGTH) + ENCODING[0] * (ID_LENGTH - _TIME_LENGTH)
@@ -0,0 +1,55 @@
+import pytest
+
+from aiml_studio.managers import DuckDBDataManager, InMemoryDataManager
+
+pytest.importorskip("duckdb")
+
+
+def make_analytics() -> DuckDBDataManager:
+    manager = DuckDBDataManager(
+        {"logs": {"timestamp": "timestamp", "level": "category", "message": "str", "duration": "float"}}
+    )
+    manager.initialize()
+    return manager
+
+
+def test_grouped_aggregates_over_time_windows():
+    """Aggregates group by fields and time buckets within a window."""
+    source = InMemoryDataManager()
+    source.initialize()
+    for i in range(12):
+        level = "ERROR" if i % 3 == 0 else "INFO"
+        source.create("logs", f"l{i}", {"timestamp": 3600 + i * 900, "level": level, "duration": float(i)})
+
+    analytics = make_analytics()
+    assert analytics.load_from(source) == 12
+    assert analytics.aggregate("logs", {"n": "count", "total": "sum:duration"}, group_by=["level"]) == [
+        {"level": "ERROR", "n": 4, "total": 18.0},
+        {"level": "INFO", "n": 8, "total": 48.0},
+    ]
+    assert analytics.aggregate("logs", {"n": "count"}, start=3600, end=10800, bucket=3600) == [
+        {"timestamp": 3600.0, "n": 4},
+        {"timestamp": 7200.0, "n": 4},
+    ]
+    with pytest.raises(ValueError):
+        analytics.aggregate("logs", {"n": "median:duration"})
+
+
+def test_sync_applies_the_change_feed_incrementally():
+    """Creates, updates and deletes on the source reach the analytics store."""
+    source = InMemoryDataManager()
+    source.initialize()
+    source.create("logs", "a", {"timestamp": 0, "level": "INFO", "message": "start"})
+    source.create("logs", "b", {"timestamp": 1, "level": "INFO"})
+    analytics = make_analytics()
+    analytics.load_from(source)
+
+    source.update("logs", "a", {"level": "ERROR"})
+    source.delete("logs", "b")
+    source.create("logs", "c", {"timestamp": 2, "level": "WARNING"})
+    assert analytics.sync(source) == 3
+    assert analytics.retrieve("logs", "a") == {"timestamp": 0.0, "level": "ERROR", "message": "start"}
+    assert analytics.retrieve("logs", "b") is None
+    assert analytics.count("logs") == 2
+    assert analytics.count("logs", {"level": "WARNING"}) == 1
+    assert analytics.sync(source) == 0
@@ -0,0 +1,37 @@
+import asyncio
+
+from aiml_studio.managers import ExecutorAsyncDataManager, InMemoryDataManager, SQLiteAsyncDataManager
+
+
+async def exercise(manager):
+    await manager.initialize()
+    assert await manager.create("projects", "p1", {"name": "Churn", "status": "Active"})
+    assert not await manager.create("projects", "p1", {"name": "Duplicate"})
+    assert await manager.create("projects", "p2", {"name": "Sales", "status": "Completed"})
+    version = await manager.get_version("projects", "p1")
+    assert await manager.update("projects", "p1", {"owner": "ada"}, expected_version=version)
+    assert not await manager.update("projects", "p1", {"owner": "bob"}, expected_version=version)
+    assert await manager.get_version("projects", "p1") > version
+    assert await manager.retrieve("projects", "p1") == {"name": "Churn", "status": "Active", "owner": "ada"}
+    assert [r["name"] for r in await manager.search("projects", {"status": "Completed"})] == ["Sales"]
+    await manager.register_index("projects", "status")
+    assert await manager.count("projects") == 2
+    assert await manager.count("projects", {"status": "Active"}) == 1
+    assert await manager.exists("projects", {"status": "Completed"})
+    assert not await manager.exists("projects", {"status": "Archived"})
+    assert await manager.search("projects", {"status": "Active"}, fields=["name", "missing"]) == [{"name": "Churn"}]
+    assert not await manager.delete("projects", "p2", expected_version=-1)
+    assert await manager.delete("projects", "p2", expected_version=await manager.get_version("projects", "p2"))
+    assert not await manager.delete("projects", "p2")
+    results = await asyncio.gather(*(manager.retrieve("projects", "p1") for _ in range(50)))
+    assert all(result["owner"] == "ada" for result in results)
+    assert len(await manager.list_all("projects")) == 1
+    await manager.shutdown()
+
+
+def test_executor_async_data_manager():
+    asyncio.run(exercise(ExecutorAsyncDataManager(InMemoryDataManager(), max_workers=4, max_pending=8)))
+
+
+def test_sqlite_async_data_manager():
+    asyncio.run(exercise(SQLiteAsyncDataManager()))
@@ -0,0 +1,50 @@
+from aiml_studio.managers import CachingDataManager, InMemoryDataManager, LRUCacheManager
+
+
+def test_caching_data_manager_invalidates_precisely():
+    manager = CachingDataManager(InMemoryDataManager(), LRUCacheManager(max_size=100))
+    manager.initialize()
+    manager.create("projects", "p1", {"name": "Churn", "status": "Active"})
+    manager.create("projects", "p2", {"name": "Sales", "status": "Completed"})
+
+    assert manager.retrieve("projects", "missing") is None
+    assert manager.retrieve("projects", "missing") is None
+    assert manager.count("projects", {"status": "Active"}) == 1
+    assert [r["name"] for r in manager.search("projects", {"status": "Completed"})] == ["Sales"]
+    assert manager.count("projects") == 2
+    for _ in range(3):
+        manager.retrieve("projects", "p1")
+        manager.count("projects", {"status": "Active"})
+        manager.search("projects", {"status": "Completed"})
+    assert manager.get_stats()["saved_calls"] == 9
+
+    # Touches only Active queries: the Completed search and the total count stay cached
+    manager.update("projects", "p1", {"name": "Churn v2"})
+    calls = manager.get_stats()["backend_calls"]
+    assert [r["name"] for r in manager.search("projects", {"status": "Completed"})] == ["Sales"]
+    assert manager.count("projects") == 2
+    assert manager.get_stats()["backend_calls"] == calls
+    assert manager.retrieve("projects", "p1")["name"] == "Churn v2"
+    assert manager.count("projects", {"status": "Active"}) == 1
+
+    manager.update("projects", "p1", {"status": "Completed"})
+    assert manager.count("projects", {"status": "Active"}) == 0
+    assert [r["name"] for r in manager.search("projects", {"status": "Completed"})] == ["Churn v2", "Sales"]
+    manager.delete("projects", "p2")
+    assert manager.count("projects") == 1
+    manager.shutdown()
+
+
+def test_caching_data_manager_invalidates_cascaded_deletes():
+    manager = CachingDataManager(InMemoryDataManager(), LRUCacheManager(max_size=100))
+    manager.initialize()
+    manager.define_relationship("project_runs", "runs", "project_id", "projects", on_delete="cascade")
+    manager.create("projects", "p1", {"name": "Churn"})
+    manager.create("runs", "r1", {"project_id": "p1", "status": "done"})
+
+    assert manager.count("runs", {"status": "done"}) == 1
+    assert manager.related("project_runs", "p1", reverse=True)[0]["status"] == "done"
+    manager.delete("projects", "p1")
+    assert manager.count("runs", {"status": "done"}) == 0
+    assert manager.retrieve_many("runs", ["r1"]) == []
+    manager.shutdown()
@@ -0,0 +1,391 @@
+import threading
+from types import MappingProxyType
+
+import pytest
+
+from aiml_studio.managers import (
+    ChangeFeed,
+    Count,
+    CountBy,
+    InMemoryDataManager,
+    Max,
+    ProjectRecord,
+    Sum,
+    WriteAheadLog,
+    apply_changes,
+)
+from aiml_studio.managers.records import to_dict
+from aiml_studio.utilities import generate_id, id_timestamp
+
+
+def make_manager() -> InMemoryDataManager:
+    manager = InMemoryDataManager()
+    manager.initialize()
+    return manager
+
+
+def test_text_search_terms_phrases_and_prefixes():
+    manager = make_manager()
+    manager.create("logs", "1", {"level": "ERROR", "message": "Failed to fetch data from API endpoint"})
+    manager.create("logs", "2", {"level": "INFO", "message": "Data source connection established"})
+    manager.register_text_index("logs", ["message"])
+    manager.create("logs", "3", {"level": "INFO", "message": "Source data refreshed"})
+
+    assert {r["level"] for r in manager.text_search("logs", "data")} == {"ERROR", "INFO"}
+    assert [r["message"] for r in manager.text_search("logs", '"data source"')] == [
+        "Data source connection established"
+    ]
+    assert len(manager.text_search("logs", "conn* data")) == 1
+    assert manager.text_search("logs", "missing") == []
+
+
+def test_text_index_follows_updates_and_deletes():
+    manager = make_manager()
+    manager.register_text_index("projects", ["name", "description"])
+    manager.create("projects", "p1", {"name": "Churn", "description": "Predict customer churn"})
+
+    manager.update("projects", "p1", {"description": "Forecast sales"})
+    assert manager.text_search("projects", "customer") == []
+    assert len(manager.text_search("projects", "forecast churn")) == 1
+
+    manager.delete("projects", "p1")
+    assert manager.text_search("projects", "churn") == []
+
+
+def test_readers_never_see_partial_updates():
+    manager = make_manager()
+    manager._logger.disabled = True
+    manager.create("projects", "p1", {"a": 0, "b": 0})
+    errors = []
+
+    def write():
+        for i in range(2000):
+            manager.update("projects", "p1", {"a": i, "b": i})
+            manager.create("projects", f"extra-{i}", {"a": i, "b": i})
+
+    def read():
+        for _ in range(2000):
+            record = manager.retrieve("projects", "p1")
+            if record["a"] != record["b"]:
+                errors.append(record)
+            for item in manager.list_all("projects"):
+                if item["a"] != item["b"]:
+                    errors.append(item)
+                    break
+
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    manager._logger.disabled = False
+    assert errors == []
+    assert len(manager.snapshot("projects")) == 2001
+
+
+def test_write_ahead_log_recovers_after_restart(tmp_path):
+    manager = InMemoryDataManager(wal=WriteAheadLog(tmp_path, fsync_policy="always"))
+    manager.initialize()
+    for i in range(5):
+        manager.create("logs", f"l{i}", {"message": f"entry {i}"})
+    manager.update("logs", "l1", {"message": "changed"})
+    manager.delete("logs", "l2")
+    manager.compact()
+    manager.create("projects", "p1", {"name": "Churn"})
+    manager._wal.close()
+
+    restored = InMemoryDataManager(wal=WriteAheadLog(tmp_path))
+    restored.initialize()
+    assert restored.retrieve("logs", "l1") == {"message": "changed"}
+    assert restored.retrieve("logs", "l2") is None
+    assert restored.retrieve("projects", "p1") == {"name": "Churn"}
+    assert len(restored.list_all("logs")) == 4
+    restored.shutdown()
+
+
+def test_change_feed_delivers_deltas():
+    manager = make_manager()
+    manager.create("projects", "p1", {"name": "Churn"})
+    start = manager.latest_change_sequence()
+    records = {"p1": manager.retrieve("projects", "p1")}
+
+    manager.create("projects", "p2", {"name": "Sales"})
+    manager.update("projects", "p1", {"status": "Active"})
+    manager.delete("projects", "p2")
+    manager.create("logs", "l1", {"message": "ignored"})
+
+    events = manager.changes_since(start, entity_type="projects")
+    assert [event.op for event in events] == ["create", "update", "delete"]
+    assert apply_changes(records, events) == {"p1": {"name": "Churn", "status": "Active"}}
+    assert manager.changes_since(manager.latest_change_sequence()) == []
+
+
+def test_change_feed_reports_evicted_positions():
+    feed = ChangeFeed(max_events=2)
+    for i in range(5):
+        feed.publish("create", "logs", str(i), {})
+    assert feed.changes_since(1) is None
+    assert [event.entity_id for event in feed.changes_since(3)] == ["3", "4"]
+
+
+def test_aggregations_follow_mutations():
+    manager = make_manager()
+    manager.create("projects", "p1", {"status": "Active", "runs": 3})
+    manager.register_aggregation("total", "projects", Count())
+    manager.register_aggregation("by_status", "projects", CountBy("status"))
+    manager.register_aggregation("runs", "projects", Sum("runs"))
+    manager.register_aggregation("max_runs", "projects", Max("runs"))
+    manager.create("projects", "p2", {"status": "Active", "runs": 7})
+    manager.create("projects", "p3", {"status": "Completed", "runs": 1})
+
+    manager.update("projects", "p1", {"status": "Completed"})
+    manager.delete("projects", "p2")
+
+    assert manager.get_aggregates() == {
+        "total": 2,
+        "by_status": {"Completed": 2},
+        "runs": 4,
+        "max_runs": 3,
+    }
+    assert manager.get_aggregates(["total"]) == {"total": 2}
+
+
+def test_columnar_entity_type_round_trips_records():
+    manager = InMemoryDataManager(
+        columnar_schemas={"logs": {"level": "category", "message": "str", "duration": "float", "code": "int"}}
+    )
+    manager.initialize()
+    manager.create("logs", "l1", {"level": "INFO", "message": "started", "code": 200, "duration": 0.5})
+    manager.create("logs", "l2", {"level": "ERROR", "message": "failed", "code": "E42", "extra": [1, 2]})
+    manager.create("logs", "l3", {"level": "INFO", "message": "done"})
+
+    assert manager.retrieve("logs", "l2") == {"level": "ERROR", "message": "failed", "code": "E42", "extra": [1, 2]}
+    assert [r["message"] for r in manager.search("logs", {"level": "INFO"})] == ["started", "done"]
+    assert manager.search("logs", {"code": "E42"})[0]["message"] == "failed"
+
+    manager.delete("logs", "l1")
+    manager.update("logs", "l3", {"level": "WARNING"})
+    assert manager.list_all("logs") == [
+        {"level": "WARNING", "message": "done"},
+        {"level": "ERROR", "message": "failed", "code": "E42", "extra": [1, 2]},
+    ]
+    assert manager.retrieve("logs", "l1") is None
+
+
+def test_time_partitioned_logs_range_and_retention():
+    manager = InMemoryDataManager(time_partitioned={"logs": {"segment_seconds": 3600, "open_segments": 1}})
+    manager.initialize()
+    for hour in range(4):
+        for minute in (0, 30):
+            manager.create(
+                "logs",
+                f"l{hour}{minute}",
+                {"timestamp": f"2024-01-22 1{hour}:{minute:02d}:00", "level": "ERROR" if minute else "INFO"},
+            )
+    store = manager._data_store["logs"]
+    assert [segment["sealed"] for segment in store.segments()] == [True, True, True, False]
+
+    window = manager.range_query("logs", "2024-01-22 10:30:00", "2024-01-22 12:30:00")
+    assert [r["timestamp"][11:16] for r in window] == ["10:30", "11:00", "11:30", "12:00"]
+    assert len(manager.range_query("logs", "2024-01-22 10:00:00", "2024-01-22 14:00:00", {"level": "ERROR"})) == 4
+
+    assert len(manager.drop_before("logs", "2024-01-22 12:00:00")) == 4
+    assert len(manager.list_all("logs")) == 4
+    assert manager.retrieve("logs", "l00") is None
+    assert manager.retrieve("logs", "l230") == {"timestamp": "2024-01-22 12:30:00", "level": "ERROR"}
+
+
+def test_core_entities_are_stored_as_typed_records(tmp_path):
+    manager = InMemoryDataManager(wal=WriteAheadLog(tmp_path))
+    manager.initialize()
+    manager.create("projects", "p1", {"name": "Churn", "status": "Active", "owner": "ana"})
+    manager.update("projects", "p1", {"status": "Completed"})
+
+    record = manager.retrieve("projects", "p1")
+    assert isinstance(record, ProjectRecord)
+    assert record.status == "Completed"
+    assert "description" not in record
+    assert record == {"name": "Churn", "status": "Completed", "owner": "ana"}
+    assert to_dict(record) == {"name": "Churn", "status": "Completed", "owner": "ana"}
+    assert manager.search("projects", {"owner": "ana"}) == [record]
+
+    manager.shutdown()
+    manager.initialize()
+    assert isinstance(manager.retrieve("projects", "p1"), ProjectRecord)
+    assert manager.retrieve("projects", "p1") == record
+    manager.shutdown()
+
+
+def test_conditional_updates_prevent_lost_updates():
+    manager = make_manager()
+    manager._logger.disabled = True
+    manager.create("projects", "p1", {"name": "Counter", "runs": 0})
+
+    def increment():
+        for _ in range(200):
+            while True:
+                version = manager.get_version("projects", "p1")
+                runs = manager.retrieve("projects", "p1")["runs"]
+                if manager.update("projects", "p1", {"runs": runs + 1}, expected_version=version):
+                    break
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert manager.retrieve("projects", "p1")["runs"] == 800
+    version = manager.get_version("projects", "p1")
+    assert not manager.delete("projects", "p1", expected_version=version - 1)
+    assert manager.delete("projects", "p1", expected_version=version)
+    assert manager.get_version("projects", "p1") is None
+
+
+def test_latest_and_created_after_use_time_ordered_ids():
+    manager = make_manager()
+    ids = [generate_id() for _ in range(50)]
+    assert ids == sorted(ids)
+    for i, entity_id in enumerate(reversed(ids)):
+        manager.create("logs", entity_id, {"message": f"entry {49 - i}"})
+    manager.create("logs", "legacy-id", {"message": "not time ordered"})
+    manager.delete("logs", ids[-1])
+
+    assert [r["message"] for r in manager.latest("logs", 3)] == ["entry 48", "entry 47", "entry 46"]
+    backfilled = generate_id(timestamp=id_timestamp(ids[0]) - 60)
+    manager.create("logs", backfilled, {"message": "backfilled"})
+    assert manager.latest("logs", 100)[-1]["message"] == "backfilled"
+    assert len(manager.created_after("logs", id_timestamp(ids[0]) - 1)) == 49
+    assert manager.created_after("logs", id_timestamp(ids[-1])) == []
+
+
+def test_count_exists_and_projection_use_field_indexes():
+    manager = make_manager()
+    for i in range(30):
+        manager.create("projects", f"p{i}", {"name": f"P{i}", "status": ("Active", "Completed", "Archived")[i % 3]})
+    manager.register_index("projects", "status")
+    manager.update("projects", "p0", {"status": "Archived"})
+    manager.delete("projects", "p3")
+
+    assert manager.count("projects") == 29
+    assert manager.count("projects", {"status": "Active"}) == 8
+    assert manager.count("projects", {"status": "Archived", "name": "P0"}) == 1
+    assert manager.exists("projects", {"status": "Completed"})
+    assert not manager.exists("projects", {"status": "Inactive"})
+    assert manager.search("projects", {"status": "Active", "name": "P6"}, fields=["name"]) == [{"name": "P6"}]
+    assert manager.list_all("projects", fields=["status"])[0] == {"status": "Archived"}
+
+
+def test_record_views_are_read_only_and_share_storage():
+    """Views expose stored records without copying and reject mutation."""
+    manager = InMemoryDataManager(record_types={})
+    manager.initialize()
+    for i in range(5):
+        manager.create("projects", f"p{i}", {"name": f"P{i}", "status": "Active" if i % 2 else "Inactive"})
+
+    view = manager.retrieve_view("projects", "p1")
+    with pytest.raises(TypeError):
+        view["name"] = "Changed"
+    assert manager.retrieve("projects", "p1")["name"] == "P1"
+
+    manager.update("projects", "p1", {"name": "Renamed"})
+    assert manager.retrieve_view("projects", "p1")["name"] == "Renamed"
+
+    views = manager.list_all_views("projects")
+    assert len(views) == 5
+    assert [record["name"] for record in views[1:3]] == ["Renamed", "P2"]
+    assert all(isinstance(record, MappingProxyType) for record in views)
+    assert [record["name"] for record in manager.search_views("projects", {"status": "Active"})] == ["Renamed", "P3"]
+    assert manager.retrieve_view("projects", "missing") is None
+
+    typed = InMemoryDataManager()
+    typed.initialize()
+    typed.create("projects", "p1", {"name": "P1"})
+    assert typed.retrieve_view("projects", "p1") is typed.retrieve("projects", "p1")
+
+
+def test_binary_snapshot_restores_records_versions_and_indexes(tmp_path):
+    """A dumped snapshot loads back with versions, id order and indexes."""
+    manager = make_manager()
+    manager.register_index("projects", "status")
+    ids = [generate_id() for _ in range(3)]
+    for i, entity_id in enumerate(ids):
+        manager.create("projects", entity_id, {"name": f"P{i}", "status": "Active" if i else "Done", "tags": ["a"]})
+    manager.create("custom", "c1", {"value": 1})
+    manager.delete("projects", ids[1])
+    version = manager.get_version("projects", ids[2])
+    assert manager.dump_snapshot(tmp_path / "data.snap")
+
+    restored = make_manager()
+    assert restored.load_snapshot(tmp_path / "data.snap")
+    assert isinstance(restored.retrieve("projects", ids[0]), ProjectRecord)
+    assert to_dict(restored.retrieve("projects", ids[2])) == {"name": "P2", "status": "Active", "tags": ["a"]}
+    assert restored.retrieve("custom", "c1") == {"value": 1}
+    assert restored.get_version("projects", ids[2]) == version
+    assert restored.count("projects", {"status": "Active"}) == 1
+    assert [record["name"] for record in restored.latest("projects", 5)] == ["P2", "P0"]
+
+    (tmp_path / "bad.snap").write_bytes(b"not a snapshot")
+    assert not restored.load_snapshot(tmp_path / "bad.snap")
+    assert restored.count("projects") == 2
+
+
+def test_explain_reports_plans_and_slow_queries_are_logged(caplog, monkeypatch):
+    """explain shows index use versus scans; slow searches are logged."""
+    manager = make_manager()
+    monkeypatch.setattr(manager._logger, "disabled", False)
+    for i in range(20):
+        manager.create("projects", f"p{i}", {"name": f"P{i}", "status": "Active" if i < 5 else "Done", "owner": i % 2})
+
+    plan = manager.explain("projects", {"status": "Active"})
+    assert (plan.strategy, plan.rows_examined, plan.rows_returned) == ("scan", 20, 5)
+    assert plan.full_scan
+
+    manager.register_index("projects", "status")
+    plan = manager.explain("projects", {"status": "Active", "owner": 0})
+    assert (plan.strategy, plan.indexes, plan.rows_examined, plan.rows_returned) == ("index+filter", ("status",), 5, 3)
+    assert manager.explain("projects", {"status": "Active"}).strategy == "index"
+
+    manager.search("projects", {"owner": 1})
+    assert "Slow query" not in caplog.text
+    manager.slow_query_threshold = 0
+    manager.search("projects", {"owner": 1})
+    assert "Slow query on projects {'owner': 1}: scan, examined 20, returned 10" in caplog.text
+
+
+def test_relationships_answer_both_directions_and_apply_on_delete():
+    """Adjacency indexes follow mutations; deletes cascade, clear or are refused."""
+    manager = make_manager()
+    manager.create("data_sources", "d1", {"name": "Warehouse"})
+    manager.create("data_sources", "d2", {"name": "Lake"})
+    manager.create("projects", "p1", {"name": "Churn", "data_source_ids": ["d1", "d2"]})
+    manager.define_relationship(
+        "project_data_sources", "projects", "data_source_ids", "data_sources", many=True, on_delete="set_null"
+    )
+    manager.define_relationship("project_runs", "runs", "project_id", "projects", on_delete="cascade")
+    manager.define_relationship("run_users", "runs", "user_id", "users")
+    manager.create("projects", "p2", {"name": "Sales", "data_source_ids": ["d2"]})
+    manager.create("users", "u1", {"name": "Ada"})
+    manager.create("runs", "r1", {"project_id": "p1", "user_id": "u1"})
+    manager.create("runs", "r2", {"project_id": "p1"})
+
+    assert [r["name"] for r in manager.related("project_data_sources", "p1")] == ["Warehouse", "Lake"]
+    assert [r["name"] for r in manager.related("project_data_sources", "d2", reverse=True)] == ["Churn", "Sales"]
+    assert manager.retrieve_many("projects", ["p2", "missing", "p1"], fields=["name"]) == [
+        {"name": "Sales"},
+        {"name": "Churn"},
+    ]
+    with pytest.raises(ValueError):
+        manager.define_relationship("project_runs", "runs", "project_id", "projects")
+
+    manager.update("projects", "p2", {"data_source_ids": ["d1"]})
+    assert manager.related("project_data_sources", "d2", reverse=True)[0]["name"] == "Churn"
+    assert manager.delete("data_sources", "d1")
+    assert manager.retrieve("projects", "p2")["data_source_ids"] == []
+
+    assert not manager.delete("users", "u1")
+    assert manager.delete("projects", "p1")
+    assert manager.retrieve_many("runs", ["r1", "r2"]) == []
+    assert manager.related("project_data_sources", "d2", reverse=True) == []
+    assert manager.delete("users", "u1")
@@ -0,0 +1,31 @@
+import pytest
+
+from aiml_studio.managers import PartitionedDataManager, ProjectRecord
+
+
+def test_partitioned_data_manager_routes_and_scatter_gathers():
+    manager = PartitionedDataManager(partitions=2)
+    manager.initialize()
+    try:
+        ids = [f"p{i}" for i in range(20)]
+        assert {manager.partition_of(entity_id) for entity_id in ids} == {0, 1}
+        records = {entity_id: {"name": entity_id, "status": "Active"} for entity_id in ids}
+        assert manager.create_many("projects", records) == 20
+        assert not manager.create("projects", "p0", {"name": "duplicate"})
+        version = manager.get_version("projects", "p3")
+        assert manager.update("projects", "p3", {"status": "Done"}, expected_version=version)
+        assert manager.delete("projects", "p4")
+
+        assert isinstance(manager.retrieve("projects", "p3"), ProjectRecord)
+        assert manager.retrieve("projects", "p4") is None
+        assert [r["name"] for r in manager.retrieve_many("projects", ["p9", "p4", "p1"])] == ["p9", "p1"]
+        manager.register_index("projects", "status")
+        assert manager.count("projects") == 19
+        assert manager.count("projects", {"status": "Active"}) == 18
+        assert manager.exists("projects", {"status": "Done"})
+        assert sorted(r["name"] for r in manager.search("projects", {"status": "Done"}, fields=["name"])) == ["p3"]
+        assert len(manager.list_all("projects")) == 19
+        with pytest.raises(AttributeError):
+            manager._call(0, "no_such_method")
+    finally:
+        manager.shutdown()
@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from aiml_studio.managers import FollowerDataManager, InMemoryDataManager, ReplicationServer
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_follower_bootstraps_streams_resumes_and_bounds_staleness():
+    leader = InMemoryDataManager()
+    leader.initialize()
+    leader.create("projects", "p1", {"name": "Churn", "status": "Active"})
+    server = ReplicationServer(leader, heartbeat_interval=0.05)
+    server.start()
+    follower = FollowerDataManager(server.address, max_staleness=0.5)
+    follower.initialize()
+    try:
+        assert follower.retrieve("projects", "p1")["name"] == "Churn"
+        assert not follower.create("projects", "p2", {"name": "Sales"})
+
+        follower.register_index("projects", "status")
+        leader.create("projects", "p2", {"name": "Sales", "status": "Active"})
+        leader.update("projects", "p1", {"status": "Done"})
+        leader.delete("projects", "p2")
+        wait_until(lambda: follower.replication_status()["applied_sequence"] == leader.latest_change_sequence())
+        assert follower.count("projects", {"status": "Active"}) == 0
+        assert [r["name"] for r in follower.search("projects", {"status": "Done"})] == ["Churn"]
+
+        # Changes made while the follower is disconnected are sent as a delta on reconnect
+        server.stop()
+        leader.create("projects", "p3", {"name": "Forecast"})
+        time.sleep(0.6)
+        with pytest.raises(TimeoutError):
+            follower.retrieve("projects", "p1")
+        server.start()
+        wait_until(lambda: follower.replication_status()["staleness"] < 0.5)
+        assert follower.retrieve("projects", "p3")["name"] == "Forecast"
+        assert follower.replication_status()["sequence_lag"] == 0
+    finally:
+        follower.shutdown()
+        server.stop()
@@ -0,0 +1,32 @@
+import time
+
+from aiml_studio.managers import InMemoryDataManager, RetentionPolicy, RetentionWorker
+
+
+def test_retention_worker_enforces_age_count_and_size_limits():
+    manager = InMemoryDataManager()
+    manager.initialize()
+    manager._logger.disabled = True
+    now = time.time()
+    for i in range(10):
+        manager.create("logs", f"l{i}", {"timestamp": now - (10 - i) * 3600, "message": f"entry {i}"})
+    for i in range(5):
+        manager.create("users", f"u{i}", {"name": f"user {i}"})
+
+    worker = RetentionWorker(
+        manager,
+        {
+            "logs": RetentionPolicy(max_age=6 * 3600 + 60, max_count=4),
+            "users": RetentionPolicy(max_bytes=60),
+        },
+        batch_size=2,
+        batch_pause=0,
+    )
+    reports = {report.entity_type: report for report in worker.enforce()}
+
+    assert sorted(r["message"] for r in manager.list_all("logs")) == ["entry 6", "entry 7", "entry 8", "entry 9"]
+    assert reports["logs"].removed == 6
+    assert [r["name"] for r in manager.list_all("users")] == ["user 2", "user 3", "user 4"]
+    assert reports["users"].reclaimed_bytes == 2 * len('{"name":"user 0"}')
+    assert manager.get_aggregates() == {}
+    assert worker.enforce()[0].removed == 0